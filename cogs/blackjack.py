@@ -1,442 +1,323 @@
-import random
 import asyncio
+import time
+from collections import OrderedDict
 
 import discord
 from discord.ext import commands
 
-from utils import db
+from utils import bj_sim, db
+from utils.bj_ev import EvTables
+from utils.bj_math import (
+    ACE,
+    DEALER_STANDS,
+    INSURANCE_PAY,
+    NATURAL_PAY,
+    RANKS,
+    Hand,
+    Shoe,
+)
 from utils.common import make_embed, send_log
+from utils.router import get_router, static_view
 
 CURRENCY_EMOJI = "💰"
 MAX_BET = 250_000
 
-# 1️⃣ = Stand, 2️⃣ = Hit, 3️⃣ = Double, 4️⃣ = Split, 5️⃣ = Insurance
-EMOJI_ACTIONS = {
-    "1️⃣": "stand",
-    "2️⃣": "hit",
-    "3️⃣": "double",
-    "4️⃣": "split",
-    "5️⃣": "insurance",
-}
-
-RANKS = ["A", "2", "3", "4", "5", "6", "7", "8", "9", "10", "J", "Q", "K"]
-VALUES = {
-    "A": 11,
-    "2": 2,
-    "3": 3,
-    "4": 4,
-    "5": 5,
-    "6": 6,
-    "7": 7,
-    "8": 8,
-    "9": 9,
-    "10": 10,
-    "J": 10,
-    "Q": 10,
-    "K": 10,
-}
+# seconds a player has for each move before the hand auto-stands
+MOVE_TIMEOUT = 40.0
+
+# solo games: one shoe buffer per player (shuffled every game), LRU
+SOLO_SHOES = 1_000
+
+# table mode: seats per table, join window, per-seat move timer
+TABLE_SEATS = 7
+JOIN_WINDOW = 20.0
+SEAT_TIMEOUT = 25.0
+
+# action, label, emoji, style
+ACTION_BUTTONS = [
+    ("stand", "Stand", "1️⃣", discord.ButtonStyle.secondary),
+    ("hit", "Hit", "2️⃣", discord.ButtonStyle.primary),
+    ("double", "Double", "3️⃣", discord.ButtonStyle.success),
+    ("split", "Split", "4️⃣", discord.ButtonStyle.success),
+    ("insurance", "Insurance", "5️⃣", discord.ButtonStyle.secondary),
+    ("hint", "Hint", "💡", discord.ButtonStyle.secondary),
+]
+
+# table join phase: action, label, emoji, style
+TABLE_BUTTONS = [
+    ("join", "Join", "🪑", discord.ButtonStyle.success),
+    ("leave", "Leave", "🚪", discord.ButtonStyle.secondary),
+    ("deal", "Deal", "🃏", discord.ButtonStyle.primary),
+]
 
 HEADER_LINE = "**━━━━━━━━ AYO BLACKJACK ━━━━━━━━**"
 
 
-def new_deck():
-    deck = RANKS * 4
-    random.shuffle(deck)
-    return deck
-
-
-def hand_value(hand):
-    total = sum(VALUES[c] for c in hand)
-    aces = hand.count("A")
-    while total > 21 and aces > 0:
-        total -= 10
-        aces -= 1
-    return total
-
-
-def format_big_hand(hand, hide_first=False):
+def format_big_hand(hand: Hand, hide_first=False):
     """
     Cards always left -> right.
     If hide_first=True: SECOND card hidden, first visible.
     Dealer look: [ 7 ][ ❓ ]
     """
     parts = []
-    for i, card in enumerate(hand):
+    for i, card in enumerate(hand.cards):
         # hide SECOND card for dealer
         if hide_first and i == 1:
             parts.append("[ ❓ ]")
         else:
-            parts.append(f"[ {card} ]")
+            parts.append(f"[ {RANKS[card]} ]")
     return " ".join(parts)
 
 
-class Blackjack(commands.Cog):
-
-    def __init__(self, bot):
-        self.bot = bot
-        self.active_games = set()
-
-    # ================= MAIN COMMAND =================
-
-    @commands.command(name="bj", aliases=["blackjack"])
-    async def blackjack_command(self, ctx: commands.Context, amount: str):
-        """
-        ayobj 5000
-        ayo bj 5000
-        ayobj all
-        """
-        # games enabled?
-        if not db.are_games_enabled():
-            await ctx.send("❌ Games are currently disabled.")
-            return
-
-        # one active game per user
-        if ctx.author.id in self.active_games:
-            await ctx.send("❌ You already have an active blackjack game.")
-            return
-
-        profile = db.get_profile(ctx.author.id)
-        balance = profile["cash"]
-
-        # parse bet
-        amt_raw = amount.lower()
-        if amt_raw == "all":
-            bet = min(balance, MAX_BET)
-        else:
-            if not amt_raw.isdigit():
-                await ctx.send("❌ Bet must be a number or `all`.")
-                return
-            bet = int(amt_raw)
-
-        if bet <= 0:
-            await ctx.send("❌ Bet must be positive.")
-            return
-        if bet > MAX_BET:
-            await ctx.send(f"❌ Max bet is `{MAX_BET:,}` {CURRENCY_EMOJI}.")
-            return
-        if bet > balance:
-            await ctx.send("❌ You don't have enough cash for that bet.")
-            return
-
-        self.active_games.add(ctx.author.id)
+class BlackjackGame:
+    """
+    State of one running blackjack game (one player, one message), or of
+    one seat at a table (dealer + shoe shared with the other seats).
+    """
 
-        try:
-            # take base bet
-            profile["cash"] -= bet
+    def __init__(self,
+                 user: discord.abc.User,
+                 profile,
+                 bet: int,
+                 shoe: Shoe,
+                 dealer: Hand | None = None):
+        self.user = user
+        self.user_id = user.id
+        self.profile = profile
+        self.bet = bet
+        # player's own shoe (solo) or the table's shoe, no per-game deck
+        self.shoe = shoe
+
+        # dealer: index 0 = OPEN, index 1 = HIDDEN
+        if dealer is None:
+            shoe.start_round()
+            dealer = Hand((shoe.draw(), shoe.draw()))
+        self.dealer = dealer
+        # first hand (we support split later)
+        self.hands = [Hand((shoe.draw(), shoe.draw()), bet)]
+
+        # insurance state - dealer upcard = FIRST card (index 0)
+        self.insurance_bet = 0
+        self.insurance_possible = self.dealer.cards[0] == ACE
+
+        self.note = ""  # last action info (split / insurance)
+        self.message: discord.Message | None = None
+        self.over = False
+
+    # ---------- state ----------
+
+    def active_index(self):
+        for i, h in enumerate(self.hands):
+            if not h.finished and not h.busted:
+                return i
+        return None
+
+    def total_at_risk(self) -> int:
+        return sum(h.bet for h in self.hands) + self.insurance_bet
+
+    def allowed_actions(self) -> set[str]:
+        idx = self.active_index()
+        if self.over or idx is None:
+            return set()
+
+        hand = self.hands[idx]
+        cash = self.profile["cash"]
+        allowed = {"stand", "hit"}
+
+        # allowed actions (REAL RULES):
+        first_turn = len(hand.cards) == 2 and not hand.doubled
+        # double only first turn + enough balance
+        if first_turn and cash >= hand.bet:
+            allowed.add("double")
+        # split only first hand, first turn, same rank, enough balance, and not already split
+        if (first_turn and len(self.hands) == 1
+                and hand.cards[0] == hand.cards[1]
+                and cash >= hand.bet):
+            allowed.add("split")
+        if (self.insurance_possible and self.insurance_bet == 0
+                and min(hand.bet // 2, cash) > 0):
+            allowed.add("insurance")
+        return allowed
+
+    # ---------- actions ----------
+
+    def apply(self, action: str) -> bool:
+        """Apply a player action. Returns False if it isn't allowed now."""
+        if action not in self.allowed_actions():
+            return False
+
+        hand = self.hands[self.active_index()]
+        profile = self.profile
+        self.note = ""
+
+        # ===== INSURANCE =====
+        if action == "insurance":
+            # auto take max allowed (simple UX)
+            self.insurance_bet = min(hand.bet // 2, profile["cash"])
+            profile["cash"] -= self.insurance_bet
             db.save_users()
+            self.note = (
+                f"🛡️ Insurance taken for `{self.insurance_bet:,}` {CURRENCY_EMOJI}."
+            )
 
-            deck = new_deck()
-            # first hand (we support split later)
-            first_hand_cards = [deck.pop(), deck.pop()]
-            # dealer: index 0 = OPEN, index 1 = HIDDEN
-            dealer_cards = [deck.pop(), deck.pop()]
-
-            # each hand dict: cards / bet / finished / busted / doubled
-            hands = [{
-                "cards": first_hand_cards,
-                "bet": bet,
-                "finished": False,
-                "busted": False,
-                "doubled": False,
-            }]
-            current_index = 0
-
-            # insurance state
-            insurance_bet = 0
-            # dealer upcard = FIRST card (index 0)
-            insurance_possible = dealer_cards[0] == "A"
-            insurance_resolved = False
-
-            # === helper: build status text ===
-            def build_status(reveal_dealer=False, active_index=0):
-                dealer_val = hand_value(
-                    dealer_cards) if reveal_dealer else "??"
-                dealer_line = (
-                    f"🤵 **Dealer** (**{dealer_val}**): "
-                    f"{format_big_hand(dealer_cards, hide_first=not reveal_dealer)}"
-                )
-
-                lines = [dealer_line, ""]
-                for idx, h in enumerate(hands):
-                    prefix = "👉 " if idx == active_index and not h[
-                        "finished"] and not h["busted"] else "   "
-                    tag = f"Hand {idx+1}"
-                    val = hand_value(h["cards"])
-                    cards_str = format_big_hand(h["cards"])
-                    state = ""
-                    if h["busted"]:
-                        state = " **[BUST]**"
-                    elif h["finished"]:
-                        state = " **[STAND]**"
-                    lines.append(
-                        f"{prefix}🃏 **{tag}** (**{val}**): {cards_str}{state}")
-                return "\n".join(lines)
-
-            # ===== initial embed (BET CONFIRM) =====
-            desc = (
-                f"{HEADER_LINE}\n\n"
-                f"💰 **Base Bet:** `{bet:,}` {CURRENCY_EMOJI}\n"
-                f"🎲 **Total At Risk:** `{bet:,}` {CURRENCY_EMOJI}\n\n"
-                f"{build_status(reveal_dealer=False, active_index=current_index)}\n\n"
-                "React:\n"
-                "1️⃣ Stand  2️⃣ Hit  3️⃣ Double")
-            # insurance offer
-            if insurance_possible:
-                desc += "  5️⃣ Insurance (up to 50% bet)"
-            # split possible? (same rank + enough balance)
-            can_split = (first_hand_cards[0] == first_hand_cards[1]
-                         and profile["cash"] >= bet)
-            if can_split:
-                desc += "  4️⃣ Split"
-
-            embed = make_embed(
-                title="♠️ AYO Blackjack",
-                description=desc,
+        # ===== SPLIT =====
+        elif action == "split":
+            card1, card2 = hand.cards
+            profile["cash"] -= hand.bet
+            db.save_users()
+            new_bet = hand.bet
+            self.hands = [
+                Hand((card1, self.shoe.draw()), new_bet),
+                Hand((card2, self.shoe.draw()), new_bet),
+            ]
+            self.note = (
+                f"✂️ Split! Now playing **2 hands** with `{new_bet:,}` {CURRENCY_EMOJI} each."
             )
-            msg = await ctx.send(embed=embed)
-            for e in EMOJI_ACTIONS.keys():
-                await msg.add_reaction(e)
 
-            # ===== natural blackjack: PLAYER ONLY =====
-            p_val = hand_value(first_hand_cards)
-            if p_val == 21:
-                await asyncio.sleep(0.7)
-                win_amount = int(bet * 2.5)
-                profile["cash"] += win_amount
-                profile["bj_wins"] = profile.get("bj_wins", 0) + 1
-                db.save_users()
+        # ===== DOUBLE =====
+        elif action == "double":
+            profile["cash"] -= hand.bet
+            hand.bet *= 2
+            hand.doubled = True
+            db.save_users()
+            # one card then auto-stand
+            hand.add(self.shoe.draw())
+            if hand.value > 21:
+                hand.busted = True
+            hand.finished = True
+
+        # ===== HIT =====
+        elif action == "hit":
+            hand.add(self.shoe.draw())
+            if hand.value > 21:
+                hand.busted = True
+                hand.finished = True
+
+        # ===== STAND =====
+        elif action == "stand":
+            hand.finished = True
+
+        return True
+
+    def auto_stand(self):
+        """Timeout -> auto stand current hand."""
+        idx = self.active_index()
+        if idx is not None:
+            self.hands[idx].finished = True
+
+    # ---------- rendering ----------
+
+    def build_status(self, reveal_dealer=False):
+        active_index = self.active_index()
+        dealer_val = self.dealer.value if reveal_dealer else "??"
+        dealer_line = (
+            f"🤵 **Dealer** (**{dealer_val}**): "
+            f"{format_big_hand(self.dealer, hide_first=not reveal_dealer)}"
+        )
 
-                final_result = (
-                    f"🎉 **Blackjack!** You win `{win_amount - bet:,}` {CURRENCY_EMOJI}."
-                )
-                await self._reveal_and_finish_embed(ctx, msg, hands,
-                                                    dealer_cards, final_result,
-                                                    profile)
-                return
+        lines = [dealer_line, ""]
+        for idx, h in enumerate(self.hands):
+            prefix = "👉 " if idx == active_index else "   "
+            tag = f"Hand {idx+1}"
+            val = h.value
+            cards_str = format_big_hand(h)
+            state = ""
+            if h.busted:
+                state = " **[BUST]**"
+            elif h.finished:
+                state = " **[STAND]**"
+            lines.append(
+                f"{prefix}🃏 **{tag}** (**{val}**): {cards_str}{state}")
+        return "\n".join(lines)
+
+    def playing_embed(self) -> discord.Embed:
+        desc = (
+            f"{HEADER_LINE}\n\n"
+            f"💰 **Base Bet:** `{self.bet:,}` {CURRENCY_EMOJI}\n"
+            f"🎲 **Total At Risk:** `{self.total_at_risk():,}` {CURRENCY_EMOJI}\n\n"
+            f"{self.build_status(reveal_dealer=False)}\n\n")
+        if self.note:
+            desc += f"{self.note}\n"
+        elif "insurance" in self.allowed_actions():
+            desc += "🛡️ Dealer shows an Ace – Insurance available (up to 50% bet).\n"
+        desc += "Choose your move with the buttons below."
+        return make_embed(title="♠️ AYO Blackjack", description=desc)
+
+    def final_embed(self, result_text: str) -> discord.Embed:
+        lines = [
+            f"🤵 **Dealer** (**{self.dealer.value}**): "
+            f"{format_big_hand(self.dealer, hide_first=False)}",
+            "",
+        ]
+        for idx, h in enumerate(self.hands):
+            tag = f"Hand {idx+1}"
+            lines.append(f"🃏 **{tag}** (**{h.value}**): {format_big_hand(h)}")
+        lines.append("")
 
-            # ================= MAIN LOOP =================
-            while True:
-                # next active hand index
-                try:
-                    current_index = next(
-                        i for i, h in enumerate(hands)
-                        if not h["finished"] and not h["busted"])
-                except StopIteration:
-                    # all hands done -> dealer plays + settle
-                    await self._dealer_and_settle(ctx, msg, hands,
-                                                  dealer_cards, profile,
-                                                  insurance_possible,
-                                                  insurance_bet)
-                    return
-
-                active_hand = hands[current_index]
-
-                total_bet_now = sum(h["bet"] for h in hands) + insurance_bet
-                desc = (
-                    f"{HEADER_LINE}\n\n"
-                    f"💰 **Base Bet:** `{bet:,}` {CURRENCY_EMOJI}\n"
-                    f"🎲 **Total At Risk:** `{total_bet_now:,}` {CURRENCY_EMOJI}\n\n"
-                    f"{build_status(reveal_dealer=False, active_index=current_index)}\n\n"
-                    "React:\n"
-                    "1️⃣ Stand  2️⃣ Hit")
-
-                # allowed actions (REAL RULES):
-                first_turn = len(
-                    active_hand["cards"]) == 2 and not active_hand["doubled"]
-                # double only first turn + enough balance
-                can_double = first_turn and profile["cash"] >= active_hand[
-                    "bet"]
-                # split only first hand, first turn, same rank, enough balance, and not already split
-                can_split_current = (first_turn and active_hand is hands[0]
-                                     and active_hand["cards"][0]
-                                     == active_hand["cards"][1]
-                                     and profile["cash"] >= active_hand["bet"])
-                if can_double:
-                    desc += "  3️⃣ Double"
-                if can_split_current and len(hands) == 1:
-                    desc += "  4️⃣ Split"
-                if insurance_possible and not insurance_resolved and insurance_bet == 0:
-                    desc += "  5️⃣ Insurance"
-
-                embed.description = desc
-                await msg.edit(embed=embed)
-
-                def check(reaction, user):
-                    return (user.id == ctx.author.id
-                            and reaction.message.id == msg.id
-                            and str(reaction.emoji) in EMOJI_ACTIONS)
-
-                try:
-                    reaction, user = await self.bot.wait_for("reaction_add",
-                                                             timeout=40.0,
-                                                             check=check)
-                except asyncio.TimeoutError:
-                    # timeout -> auto stand current hand
-                    active_hand["finished"] = True
-                    continue
-
-                try:
-                    await msg.remove_reaction(reaction.emoji, user)
-                except discord.Forbidden:
-                    pass
-
-                action = EMOJI_ACTIONS[str(reaction.emoji)]
-
-                # ===== INSURANCE =====
-                if action == "insurance":
-                    if not (insurance_possible and not insurance_resolved
-                            and insurance_bet == 0):
-                        continue
-                    max_ins = min(active_hand["bet"] // 2, profile["cash"])
-                    if max_ins <= 0:
-                        continue
-                    # auto take max allowed (simple UX)
-                    insurance_bet = max_ins
-                    profile["cash"] -= insurance_bet
-                    db.save_users()
-                    await ctx.send(
-                        f"🛡️ Insurance taken for `{insurance_bet:,}` {CURRENCY_EMOJI}.",
-                        delete_after=4,
-                    )
-                    continue
-
-                # ===== SPLIT =====
-                if action == "split":
-                    if not can_split_current or len(hands) > 1:
-                        continue
-                    card1, card2 = active_hand["cards"]
-                    profile["cash"] -= active_hand["bet"]
-                    db.save_users()
-                    new_bet = active_hand["bet"]
-                    hands.clear()
-                    hands.append({
-                        "cards": [card1, deck.pop()],
-                        "bet": new_bet,
-                        "finished": False,
-                        "busted": False,
-                        "doubled": False,
-                    })
-                    hands.append({
-                        "cards": [card2, deck.pop()],
-                        "bet": new_bet,
-                        "finished": False,
-                        "busted": False,
-                        "doubled": False,
-                    })
-                    current_index = 0
-                    await ctx.send(
-                        f"✂️ Split! Now playing **2 hands** with `{new_bet:,}` {CURRENCY_EMOJI} each.",
-                        delete_after=4,
-                    )
-                    continue
-
-                # ===== DOUBLE =====
-                if action == "double":
-                    if not can_double:
-                        continue
-                    profile["cash"] -= active_hand["bet"]
-                    active_hand["bet"] *= 2
-                    active_hand["doubled"] = True
-                    db.save_users()
-                    # one card then auto-stand
-                    active_hand["cards"].append(deck.pop())
-                    if hand_value(active_hand["cards"]) > 21:
-                        active_hand["busted"] = True
-                    active_hand["finished"] = True
-                    await asyncio.sleep(0.6)
-                    continue
-
-                # ===== HIT =====
-                if action == "hit":
-                    active_hand["cards"].append(deck.pop())
-                    if hand_value(active_hand["cards"]) > 21:
-                        active_hand["busted"] = True
-                        active_hand["finished"] = True
-                    await asyncio.sleep(0.4)
-                    continue
-
-                # ===== STAND =====
-                if action == "stand":
-                    active_hand["finished"] = True
-                    await asyncio.sleep(0.3)
-                    continue
-
-        finally:
-            self.active_games.discard(ctx.author.id)
+        # BJ stats line
+        wins = self.profile.get("bj_wins", 0)
+        losses = self.profile.get("bj_losses", 0)
+        lines.append(f"📈 **BJ Stats:** {wins} Wins • {losses} Losses")
+        lines.append("")
+        lines.append(result_text)
 
-    # ================= DEALER + SETTLE =================
+        return make_embed(
+            title="♠️ AYO Blackjack",
+            description=f"{HEADER_LINE}\n\n" + "\n".join(lines),
+        )
 
-    async def _dealer_and_settle(
-        self,
-        ctx: commands.Context,
-        msg: discord.Message,
-        hands,
-        dealer_cards,
-        profile,
-        insurance_possible,
-        insurance_bet: int,
-    ):
-        # small helper for dealer animation embed
-        async def show_state(text: str):
-            dealer_val_now = hand_value(dealer_cards)
-            lines = [
-                f"🤵 **Dealer** (**{dealer_val_now}**): "
-                f"{format_big_hand(dealer_cards, hide_first=False)}",
-                "",
-            ]
-            for idx, h in enumerate(hands):
-                tag = f"Hand {idx+1}"
-                val = hand_value(h["cards"])
-                cards_str = format_big_hand(h["cards"])
-                state = ""
-                if h["busted"]:
-                    state = " **[BUST]**"
-                elif h["finished"]:
-                    state = " **[STAND]**"
-                lines.append(f"🃏 **{tag}** (**{val}**): {cards_str}{state}")
-            lines.append("")
-            lines.append(text)
+    # ---------- settlement ----------
 
-            embed = (msg.embeds[0] if msg.embeds else make_embed(
-                title="♠️ AYO Blackjack"))
-            embed.title = "♠️ AYO Blackjack"
-            embed.description = f"{HEADER_LINE}\n\n" + "\n".join(lines)
-            await msg.edit(embed=embed)
+    def is_natural(self) -> bool:
+        return len(self.hands) == 1 and len(self.hands[0].cards) == 2 and \
+            self.hands[0].value == 21
+
+    def settle_natural(self, save=True) -> str:
+        win_amount = int(self.bet * NATURAL_PAY)
+        self.profile["cash"] += win_amount
+        self.profile["bj_wins"] = self.profile.get("bj_wins", 0) + 1
+        if save:
+            db.save_users()
+        return (
+            f"🎉 **Blackjack!** You win `{win_amount - self.bet:,}` {CURRENCY_EMOJI}."
+        )
 
-        # dealer reveal + animation
-        await asyncio.sleep(0.6)
-        await show_state("▶️ Dealer reveals hand...")
+    def settle(self, save=True):
+        """
+        Dealer plays, every hand is paid out. Returns (text, net).
+        Shared dealer: the first seat settled plays it, the rest just compare.
+        """
+        profile = self.profile
+        dealer = self.dealer
 
-        while hand_value(dealer_cards) < 17:
-            dealer_cards.append(random.choice(RANKS))
-            await asyncio.sleep(0.8)
-            await show_state("🃏 Dealer draws a card...")
+        while dealer.value < DEALER_STANDS:
+            dealer.add(self.shoe.draw())
 
-        dealer_val = hand_value(dealer_cards)
+        dealer_val = dealer.value
 
         total_delta = 0
         result_lines = []
 
         # insurance resolve
-        if insurance_possible and insurance_bet > 0:
+        if self.insurance_possible and self.insurance_bet > 0:
             if dealer_val == 21:
-                win_ins = insurance_bet * 3
+                win_ins = self.insurance_bet * INSURANCE_PAY
                 profile["cash"] += win_ins
-                total_delta += win_ins - insurance_bet
+                total_delta += win_ins - self.insurance_bet
                 result_lines.append(
-                    f"🛡️ Insurance wins `{win_ins - insurance_bet:,}` {CURRENCY_EMOJI}."
+                    f"🛡️ Insurance wins `{win_ins - self.insurance_bet:,}` {CURRENCY_EMOJI}."
                 )
             else:
-                total_delta -= insurance_bet
+                total_delta -= self.insurance_bet
                 result_lines.append("🛡️ Insurance lost.")
 
         # each hand result
-        for idx, h in enumerate(hands):
-            val = hand_value(h["cards"])
-            bet = h["bet"]
+        for idx, h in enumerate(self.hands):
+            val = h.value
+            bet = h.bet
             tag = f"Hand {idx+1}"
 
-            if h["busted"]:
+            if h.busted:
                 total_delta -= bet
                 profile["bj_losses"] = profile.get("bj_losses", 0) + 1
                 result_lines.append(
@@ -468,68 +349,681 @@ class Blackjack(commands.Cog):
                 profile["cash"] += bet
                 result_lines.append(f"😐 {tag}: Push – bet returned.")
 
-        db.save_users()
+        if save:
+            db.save_users()
 
         result_lines.append(
             f"\n📊 **Net result:** `{total_delta:,}` {CURRENCY_EMOJI}.")
-        final_result = "\n".join(result_lines)
+        return "\n".join(result_lines), total_delta
+
+
+def build_buttons(game: BlackjackGame) -> discord.ui.View:
+    """
+    Stand / Hit / Double / Split / Insurance (+ Hint) buttons for the current state.
+    Render-only: clicks are dispatched by the interaction router.
+    """
+    allowed = game.allowed_actions()
+    return static_view(*(discord.ui.Button(
+        label=label,
+        emoji=emoji,
+        style=style,
+        custom_id=f"ayo:bj:{action}",
+        disabled=action != "hint" and action not in allowed,
+    ) for action, label, emoji, style in ACTION_BUTTONS))
+
+
+# ================= TABLE MODE =================
+
+
+class BlackjackTable:
+    """
+    Multi-seat table of one channel: one dealer, one shoe and one message
+    per round. Seats move in turn (buttons + per-seat timer), then the
+    dealer plays once and every seat is settled in one batch.
+    """
+
+    def __init__(self, channel_id: int):
+        self.channel_id = channel_id
+        self.shoe = Shoe()  # stays with the table across rounds
+        self.reset(0)
+
+    def reset(self, bet: int):
+        self.bet = bet
+        self.phase = "open"  # open -> playing -> done
+        # (user, profile) until the deal, then one BlackjackGame per seat
+        self.players: list[tuple[discord.abc.User, dict]] = []
+        self.seats: list[BlackjackGame] = []
+        self.dealer: Hand | None = None
+        self.message: discord.Message | None = None
+        self.deadline = 0.0  # join window / current seat's timer (unix)
+        self.results: list[str] = []
+
+    # ---------- seats ----------
+
+    def seated(self, user_id: int) -> bool:
+        return any(user.id == user_id for user, _ in self.players)
+
+    def deal(self):
+        self.shoe.start_round()
+        self.dealer = Hand((self.shoe.draw(), self.shoe.draw()))
+        self.seats = [
+            BlackjackGame(user, profile, self.bet, self.shoe, self.dealer)
+            for user, profile in self.players
+        ]
+        for game in self.seats:
+            if game.is_natural():
+                game.hands[0].finished = True  # paid with everyone at the end
+        self.phase = "playing"
+
+    def current(self) -> BlackjackGame | None:
+        """Seat whose turn it is (None -> dealer's turn)."""
+        for game in self.seats:
+            if game.active_index() is not None:
+                return game
+        return None
+
+    def settle(self) -> list[int]:
+        """Dealer plays once, every seat is paid, ONE save. Returns nets."""
+        nets = []
+        for i, game in enumerate(self.seats, 1):
+            game.over = True
+            if game.is_natural():
+                game.settle_natural(save=False)
+                net = int(game.bet * NATURAL_PAY) - game.bet
+            else:
+                net = game.settle(save=False)[1]
+            nets.append(net)
+            icon = "✅" if net > 0 else "❌" if net < 0 else "😐"
+            self.results.append(f"{icon} **{i}.** {game.user.mention}: "
+                                f"`{net:+,}` {CURRENCY_EMOJI}")
+        db.save_users()
+        self.phase = "done"
+        return nets
 
-        await self._reveal_and_finish_embed(ctx, msg, hands, dealer_cards,
-                                            final_result, profile)
+    # ---------- rendering ----------
+
+    def embed(self) -> discord.Embed:
+        count = len(self.players)
+        lines = [
+            HEADER_LINE,
+            "",
+            f"💰 **Table Bet:** `{self.bet:,}` {CURRENCY_EMOJI} • "
+            f"🪑 **Seats:** `{count}/{TABLE_SEATS}`",
+            "",
+        ]
+
+        if self.phase == "open":
+            for i, (user, _) in enumerate(self.players, 1):
+                lines.append(f"🪑 **{i}.** {user.mention}" +
+                             (" 👑" if i == 1 else ""))
+            lines.append("")
+            lines.append(f"⏳ Dealing <t:{int(self.deadline)}:R> – press **Join** "
+                         f"to sit down (same bet), host can **Deal** now.")
+            return make_embed(title="♠️ AYO Blackjack Table",
+                              description="\n".join(lines))
+
+        reveal = self.phase == "done"
+        dealer_val = self.dealer.value if reveal else "??"
+        lines.append(f"🤵 **Dealer** (**{dealer_val}**): "
+                     f"{format_big_hand(self.dealer, hide_first=not reveal)}")
+        lines.append("")
+
+        current = None if reveal else self.current()
+        for i, game in enumerate(self.seats, 1):
+            active = game.active_index() if game is current else None
+            split = len(game.hands) > 1
+            for idx, h in enumerate(game.hands):
+                prefix = "👉 " if idx == active else ""
+                tag = f" [{idx + 1}]" if split else ""
+                if game.is_natural():
+                    state = " **[BJ]**"
+                elif h.busted:
+                    state = " **[BUST]**"
+                elif h.finished:
+                    state = " **[STAND]**"
+                else:
+                    state = ""
+                shield = " 🛡️" if game.insurance_bet else ""
+                lines.append(f"{prefix}**{i}.** {game.user.mention}{tag}{shield} "
+                             f"(**{h.value}**): {format_big_hand(h)}{state}")
+
+        if self.results:
+            lines.append("")
+            lines.extend(self.results)
+        elif current is not None:
+            lines.append("")
+            lines.append(f"🎯 {current.user.mention}'s move – auto-stand "
+                         f"<t:{int(self.deadline)}:R>.")
+        return make_embed(title="♠️ AYO Blackjack Table",
+                          description="\n".join(lines))
+
+
+def build_table_buttons(table: BlackjackTable) -> discord.ui.View:
+    """Join / Leave / Deal while open, the current seat's moves after."""
+    if table.phase == "open":
+        full = len(table.players) >= TABLE_SEATS
+        return static_view(*(discord.ui.Button(
+            label=label,
+            emoji=emoji,
+            style=style,
+            custom_id=f"ayo:bjt:{action}",
+            disabled=action == "join" and full,
+        ) for action, label, emoji, style in TABLE_BUTTONS))
+
+    current = table.current()
+    allowed = current.allowed_actions() if current else set()
+    return static_view(*(discord.ui.Button(
+        label=label,
+        emoji=emoji,
+        style=style,
+        custom_id=f"ayo:bjt:{action}",
+        disabled=action != "hint" and action not in allowed,
+    ) for action, label, emoji, style in ACTION_BUTTONS))
+
+
+class Blackjack(commands.Cog):
+
+    def __init__(self, bot):
+        self.bot = bot
+        self.active_games = set()
+        # message id -> game dispatch + shared move timers
+        self.router = get_router(bot)
+        # user id -> that player's solo shoe (buffer reused, reshuffled for
+        # every game). One game per player at a time, so a shuffle never
+        # pulls cards out from under another running game
+        self.shoes: OrderedDict[int, Shoe] = OrderedDict()
+        # channel id -> multi-seat table (keeps its shoe between rounds)
+        self.tables: dict[int, BlackjackTable] = {}
+        # exact EV tables for the Hint button (built / loaded on cog load)
+        self.ev = EvTables()
+
+    async def cog_load(self):
+        await asyncio.to_thread(self.ev.load)
+
+    # ================= OWNER: SIMULATOR =================
+
+    @commands.command(name="bjsim")
+    @commands.is_owner()
+    async def bj_sim_command(self,
+                             ctx: commands.Context,
+                             hands: int = 10_000_000,
+                             strategy: str = "basic",
+                             natural_pay: float = NATURAL_PAY):
+        """
+        Owner only: house edge of the current rules (or a natural payout tweak).
+        ayo bjsim 10000000 basic+ins 2.0
+        Strategies: basic, stand:<n>, mimic (+ins = always insure)
+        """
+        hands = max(100_000, min(hands, 50_000_000))
+        try:
+            bj_sim.parse_strategy(strategy)
+        except ValueError:
+            await ctx.send("❌ Strategy must be `basic`, `stand:<12-21>` or "
+                           "`mimic`, optionally with `+ins`.")
+            return
+
+        msg = await ctx.send(f"⏳ Simulating `{hands:,}` blackjack hands "
+                             f"(`{strategy}`)...")
+        try:
+            stats = await bj_sim.run_async(hands, strategy,
+                                           {"natural_pay": natural_pay})
+        except RuntimeError as e:
+            await msg.edit(content=f"❌ Simulator unavailable: {e}.")
+            return
+
+        parts = "\n".join(f"• {part}: `{stats['parts'][part]:+.3%}`"
+                          for part in bj_sim.PARTS)
+        await msg.edit(content=None, embed=make_embed(
+            title="🧪 Blackjack Simulation",
+            description=
+            (f"🃏 Hands: `{stats['hands']:,}` • strategy `{strategy}` • "
+             f"natural pays `{natural_pay:g}x`\n\n"
+             f"📊 Player EV: **{stats['ev']:+.3%}** per base bet "
+             f"(± `{1.96 * stats['stderr']:.3%}`)\n"
+             f"🏦 House edge: `{stats['house_edge']:+.3%}` • "
+             f"RTP of all wagers: `{stats['rtp']:.2%}`\n\n"
+             f"**EV by source**\n{parts}\n\n"
+             f"⏱️ `{stats['seconds']:.1f}s`"),
+        ))
+
+    # ================= MAIN COMMAND =================
+
+    @commands.command(name="bj", aliases=["blackjack"])
+    async def blackjack_command(self, ctx: commands.Context, amount: str):
+        """
+        ayobj 5000
+        ayo bj 5000
+        ayobj all
+        """
+        # games enabled?
+        if not db.are_games_enabled():
+            await ctx.send("❌ Games are currently disabled.")
+            return
+
+        # one active game per user
+        if ctx.author.id in self.active_games:
+            await ctx.send("❌ You already have an active blackjack game.")
+            return
+
+        profile = db.get_profile(ctx.author.id)
+        bet = await self._parse_bet(ctx, amount, profile["cash"])
+        if bet is None:
+            return
+
+        self.active_games.add(ctx.author.id)
+
+        try:
+            # take base bet
+            profile["cash"] -= bet
+            db.save_users()
+
+            game = BlackjackGame(ctx.author, profile, bet,
+                                 self._solo_shoe(ctx.author.id))
+
+            # ===== natural blackjack: PLAYER ONLY =====
+            if game.is_natural():
+                game.over = True
+                final_result = game.settle_natural()
+                await ctx.send(embed=game.final_embed(final_result))
+                self.active_games.discard(ctx.author.id)
+                return
+
+            game.message = await ctx.send(embed=game.playing_embed(),
+                                          view=build_buttons(game))
+            self.router.register(
+                game.message.id,
+                lambda interaction, action: self._handle_action(
+                    game, interaction, action),
+                on_timeout=lambda: self._handle_timeout(game),
+                timeout=MOVE_TIMEOUT,
+            )
+        except Exception:
+            self.active_games.discard(ctx.author.id)
+            raise
+
+    def _solo_shoe(self, user_id: int) -> Shoe:
+        shoe = self.shoes.get(user_id)
+        if shoe is None:
+            shoe = self.shoes[user_id] = Shoe()
+            if len(self.shoes) > SOLO_SHOES:
+                # a running game keeps its own reference, eviction is safe
+                self.shoes.popitem(last=False)
+        else:
+            # fresh shuffle every solo game: nothing carries over between a
+            # player's games, so there is no count to follow
+            shoe.shuffle()
+            self.shoes.move_to_end(user_id)
+        return shoe
+
+    async def _parse_bet(self, ctx: commands.Context, amount: str,
+                         balance: int) -> int | None:
+        """Bet from "5000" / "all", or None after telling the user why not."""
+        amt_raw = amount.lower()
+        if amt_raw == "all":
+            bet = min(balance, MAX_BET)
+        else:
+            if not amt_raw.isdigit():
+                await ctx.send("❌ Bet must be a number or `all`.")
+                return None
+            bet = int(amt_raw)
+
+        if bet <= 0:
+            await ctx.send("❌ Bet must be positive.")
+            return None
+        if bet > MAX_BET:
+            await ctx.send(f"❌ Max bet is `{MAX_BET:,}` {CURRENCY_EMOJI}.")
+            return None
+        if bet > balance:
+            await ctx.send("❌ You don't have enough cash for that bet.")
+            return None
+        return bet
+
+    # ================= BUTTON HANDLERS =================
+
+    async def _handle_action(
+        self,
+        game: BlackjackGame,
+        interaction: discord.Interaction,
+        action: str,
+    ):
+        if interaction.user.id != game.user_id:
+            await interaction.response.send_message(
+                "⚠️ This is not your blackjack game.",
+                ephemeral=True,
+            )
+            return
+
+        if action == "hint":
+            await interaction.response.send_message(embed=self._hint_embed(game),
+                                                    ephemeral=True)
+            return
+
+        if not game.apply(action):
+            await interaction.response.defer()
+            return
+
+        # all hands done -> dealer plays + settle (same response edit)
+        if game.active_index() is None:
+            await self._finish_game(game, interaction=interaction)
+            return
+
+        # one interaction response edit per move
+        self.router.touch(game.message.id, MOVE_TIMEOUT)
+        await interaction.response.edit_message(embed=game.playing_embed(),
+                                                view=build_buttons(game))
+
+    def _hint_embed(self, game: BlackjackGame) -> discord.Embed:
+        """EV of every allowed move for the current hand (table lookups)."""
+        idx = game.active_index()
+        actions = game.allowed_actions()
+        if idx is None or not actions:
+            return make_embed(title="💡 Blackjack Hint",
+                              description="Nothing to decide right now.")
+
+        hand = game.hands[idx]
+        up = game.dealer.cards[0]
+        evs = self.ev.hint(hand.value, hand.soft, hand.cards[0], up, actions)
+        if not evs:
+            return make_embed(title="💡 Blackjack Hint",
+                              description="Hints are still loading, try again.")
+
+        best = max((a for a in evs if a != "insurance"), key=evs.get)
+        lines = []
+        for action in sorted(evs, key=evs.get, reverse=True):
+            ev = evs[action]
+            mark = " ⭐" if action == best else ""
+            lines.append(f"**{action.title()}**: `{ev:+.1%}` "
+                         f"(≈ `{ev * hand.bet:+,.0f}` {CURRENCY_EMOJI}){mark}")
+        return make_embed(
+            title="💡 Blackjack Hint",
+            description=(
+                f"🃏 Hand {idx + 1} (**{hand.value}**) vs "
+                f"dealer `{RANKS[up]}`\n\n" + "\n".join(lines) +
+                "\n\nExpected result per move, as % of this hand's bet "
+                "(insurance: extra EV of taking it)."),
+        )
+
+    async def _handle_timeout(self, game: BlackjackGame):
+        if game.over or game.message is None:
+            return
+
+        # timeout -> auto stand current hand
+        game.auto_stand()
+        try:
+            if game.active_index() is None:
+                await self._finish_game(game)
+            else:
+                self.router.touch(game.message.id, MOVE_TIMEOUT)
+                await game.message.edit(embed=game.playing_embed(),
+                                        view=build_buttons(game))
+        except Exception:
+            self.router.unregister(game.message.id)
+            self.active_games.discard(game.user_id)
+
+    # ================= DEALER + SETTLE =================
+
+    async def _finish_game(
+        self,
+        game: BlackjackGame,
+        *,
+        interaction: discord.Interaction | None = None,
+    ):
+        game.over = True
+        self.router.unregister(game.message.id)
+        self.active_games.discard(game.user_id)
+
+        final_result, total_delta = game.settle()
+        embed = game.final_embed(final_result)
+        if interaction is not None:
+            await interaction.response.edit_message(embed=embed, view=None)
+        else:
+            await game.message.edit(embed=embed, view=None)
 
         # log
+        user = game.user
         try:
             log_embed = make_embed(
                 title="Blackjack Game",
-                description=(f"Player: {ctx.author} (`{ctx.author.id}`)\n"
+                description=(f"Player: {user} (`{user.id}`)\n"
                              f"Details:\n{final_result}"),
             )
-            await send_log(self.bot, ctx.guild, "games", log_embed)
+            await send_log(self.bot,
+                           game.message.guild,
+                           "games",
+                           log_embed,
+                           game="blackjack",
+                           users=[user.id],
+                           bet=game.total_at_risk(),
+                           net=total_delta)
         except Exception:
             pass
 
-    # ================= FINAL EMBED =================
+    # ================= TABLE MODE =================
 
-    async def _reveal_and_finish_embed(
+    @commands.command(name="bjtable", aliases=["bjt"])
+    async def bj_table_command(self, ctx: commands.Context, amount: str):
+        """
+        ayo bjtable 5000 -> open a table here, others press Join (same bet)
+        Up to TABLE_SEATS players, one message, one dealer.
+        """
+        if not db.are_games_enabled():
+            await ctx.send("❌ Games are currently disabled.")
+            return
+
+        table = self.tables.get(ctx.channel.id)
+        if table is not None and table.phase != "done":
+            await ctx.send(
+                "❌ A blackjack table is already running here – press **Join** on it.")
+            return
+        if ctx.author.id in self.active_games:
+            await ctx.send("❌ You already have an active blackjack game.")
+            return
+
+        profile = db.get_profile(ctx.author.id)
+        bet = await self._parse_bet(ctx, amount, profile["cash"])
+        if bet is None:
+            return
+
+        if table is None:
+            table = self.tables[ctx.channel.id] = BlackjackTable(ctx.channel.id)
+        table.reset(bet)
+        table.deadline = time.time() + JOIN_WINDOW
+        self._seat(table, ctx.author, profile)
+
+        try:
+            table.message = await ctx.send(embed=table.embed(),
+                                           view=build_table_buttons(table))
+        except Exception:
+            self._unseat(table, ctx.author.id)
+            table.phase = "done"
+            raise
+
+        self.router.register(
+            table.message.id,
+            lambda interaction, action: self._table_action(
+                table, interaction, action),
+            on_timeout=lambda: self._table_timeout(table),
+            timeout=JOIN_WINDOW,
+        )
+
+    def _seat(self, table: BlackjackTable, user: discord.abc.User, profile):
+        # bet is taken on join (refunded on leave before the deal)
+        profile["cash"] -= table.bet
+        db.save_users()
+        table.players.append((user, profile))
+        self.active_games.add(user.id)
+
+    def _unseat(self, table: BlackjackTable, user_id: int):
+        for i, (user, profile) in enumerate(table.players):
+            if user.id == user_id:
+                profile["cash"] += table.bet
+                db.save_users()
+                del table.players[i]
+                self.active_games.discard(user_id)
+                return
+
+    def _arm_turn(self, table: BlackjackTable):
+        # per-seat move timer (re-armed on every move / seat change)
+        table.deadline = time.time() + SEAT_TIMEOUT
+        self.router.touch(table.message.id, SEAT_TIMEOUT)
+
+    def _deal_table(self, table: BlackjackTable):
+        table.deal()
+        if table.current() is not None:
+            self._arm_turn(table)
+
+    async def _table_action(
         self,
-        ctx: commands.Context,
-        msg: discord.Message,
-        hands,
-        dealer_cards,
-        result_text: str,
-        profile,
+        table: BlackjackTable,
+        interaction: discord.Interaction,
+        action: str,
     ):
-        try:
-            await msg.clear_reactions()
-        except discord.Forbidden:
-            pass
+        user = interaction.user
+
+        # ===== join phase =====
+        if table.phase == "open":
+            error = None
+            if action == "join":
+                if table.seated(user.id):
+                    error = "🪑 You're already seated."
+                elif len(table.players) >= TABLE_SEATS:
+                    error = "❌ This table is full."
+                elif user.id in self.active_games:
+                    error = "❌ You already have an active blackjack game."
+                elif not db.are_games_enabled():
+                    error = "❌ Games are currently disabled."
+                else:
+                    profile = db.get_profile(user.id)
+                    if profile["cash"] < table.bet:
+                        error = "❌ You don't have enough cash for the table bet."
+                    else:
+                        self._seat(table, user, profile)
+            elif action == "leave":
+                if not table.seated(user.id):
+                    error = "⚠️ You're not seated at this table."
+                else:
+                    self._unseat(table, user.id)
+            elif action == "deal":
+                if not table.players or table.players[0][0].id != user.id:
+                    error = "👑 Only the host (first seat) can deal early."
+                else:
+                    self._deal_table(table)
+            else:
+                await interaction.response.defer()
+                return
 
-        dealer_val = hand_value(dealer_cards)
+            if error:
+                await interaction.response.send_message(error, ephemeral=True)
+                return
+            if not table.players:
+                # everyone left -> table closes
+                table.phase = "done"
+                self.router.unregister(table.message.id)
+                await interaction.response.edit_message(embed=make_embed(
+                    title="♠️ AYO Blackjack Table",
+                    description="🚪 Everyone left, the table is closed."),
+                                                        view=None)
+                return
+            if table.phase == "playing" and table.current() is None:
+                await self._finish_table(table, interaction=interaction)
+                return
+            await interaction.response.edit_message(
+                embed=table.embed(), view=build_table_buttons(table))
+            return
 
-        lines = [
-            f"🤵 **Dealer** (**{dealer_val}**): "
-            f"{format_big_hand(dealer_cards, hide_first=False)}",
-            "",
-        ]
-        for idx, h in enumerate(hands):
-            tag = f"Hand {idx+1}"
-            val = hand_value(h["cards"])
-            cards_str = format_big_hand(h["cards"])
-            lines.append(f"🃏 **{tag}** (**{val}**): {cards_str}")
-        lines.append("")
+        # ===== seats play in turn =====
+        game = table.current()
+        if game is None or table.phase != "playing":
+            await interaction.response.defer()
+            return
+        if user.id != game.user_id:
+            if table.seated(user.id):
+                msg = f"⏳ Wait for your turn – it's {game.user.mention}'s move."
+            else:
+                msg = "⚠️ You're not seated at this table."
+            await interaction.response.send_message(msg, ephemeral=True)
+            return
 
-        # BJ stats line
-        wins = profile.get("bj_wins", 0)
-        losses = profile.get("bj_losses", 0)
-        lines.append(f"📈 **BJ Stats:** {wins} Wins • {losses} Losses")
-        lines.append("")
-        lines.append(result_text)
+        if action == "hint":
+            await interaction.response.send_message(embed=self._hint_embed(game),
+                                                    ephemeral=True)
+            return
+
+        if not game.apply(action):
+            await interaction.response.defer()
+            return
+
+        # last seat done -> dealer plays + batch settle (same response edit)
+        if table.current() is None:
+            await self._finish_table(table, interaction=interaction)
+            return
+
+        self._arm_turn(table)
+        await interaction.response.edit_message(embed=table.embed(),
+                                                view=build_table_buttons(table))
+
+    async def _table_timeout(self, table: BlackjackTable):
+        if table.phase == "open":
+            # join window over -> deal
+            self._deal_table(table)
+        elif table.phase == "playing":
+            # seat timer over -> auto stand its current hand
+            game = table.current()
+            if game is not None:
+                game.auto_stand()
+        else:
+            return
 
-        embed = (msg.embeds[0] if msg.embeds else make_embed(
-            title="♠️ AYO Blackjack"))
-        embed.title = "♠️ AYO Blackjack"
-        embed.description = f"{HEADER_LINE}\n\n" + "\n".join(lines)
-        await msg.edit(embed=embed)
+        if table.current() is None:
+            await self._finish_table(table)
+            return
+        self._arm_turn(table)
+        try:
+            await table.message.edit(embed=table.embed(),
+                                     view=build_table_buttons(table))
+        except Exception:
+            pass  # timer stays armed, seats keep auto-standing to the end
+
+    async def _finish_table(
+        self,
+        table: BlackjackTable,
+        *,
+        interaction: discord.Interaction | None = None,
+    ):
+        self.router.unregister(table.message.id)
+        # money first, message after: a failed edit can't strand any bet
+        nets = table.settle()
+        for game in table.seats:
+            self.active_games.discard(game.user_id)
+
+        embed = table.embed()
+        try:
+            if interaction is not None:
+                await interaction.response.edit_message(embed=embed, view=None)
+            else:
+                await table.message.edit(embed=embed, view=None)
+        except Exception:
+            pass
+
+        # one log for the whole table
+        try:
+            log_embed = make_embed(
+                title="Blackjack Table",
+                description="\n".join(
+                    f"Player: {game.user} (`{game.user_id}`) • "
+                    f"bet `{game.total_at_risk():,}` • net `{net:+,}`"
+                    for game, net in zip(table.seats, nets)),
+            )
+            await send_log(self.bot,
+                           table.message.guild,
+                           "games",
+                           log_embed,
+                           game="blackjack",
+                           users=[game.user_id for game in table.seats],
+                           bet=sum(game.total_at_risk() for game in table.seats),
+                           net=sum(nets))
+        except Exception:
+            pass
 
 
 async def setup(bot):
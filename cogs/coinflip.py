@@ -2,230 +2,94 @@
 
 import random
 import asyncio
+import time
+import uuid
+
 import discord
 from discord.ext import commands
 
 from utils import db
 from utils.common import make_embed, send_log
+from utils.eventlog import log_error
+from utils.router import get_router, static_view
 
 CURRENCY_EMOJI = "💰"
 MAX_BET = 250_000
 
 
-class CoinflipChallengeView(discord.ui.View):
-  """
-    Pending challenge view – Accept / Decline buttons
-    """
-
-  def __init__(
-      self,
-      cog,
-      ctx: commands.Context,
-      challenger: discord.Member,
-      opponent: discord.Member,
-      bet: int,
-      *,
-      timeout: float = 60.0,
-  ):
-    super().__init__(timeout=timeout)
-    self.cog = cog
-    self.ctx = ctx
-    self.challenger = challenger
-    self.opponent = opponent
-    self.bet = bet
-    self.resolved = False
-    self.message: discord.Message | None = None
-
-  async def on_timeout(self):
-    try:
-      if self.resolved or self.message is None:
-        return
-
-      for child in self.children:
-        child.disabled = True
-
-      embed = self.message.embeds[0]
-      embed.description += "\n\n⏰ **Challenge timed out.**"
-      await self.message.edit(embed=embed, view=self)
-
-      # FREE PLAYERS ON TIMEOUT
-      if self.challenger.id in self.cog.active_players:
-        self.cog.active_players.remove(self.challenger.id)
-      if self.opponent.id in self.cog.active_players:
-        self.cog.active_players.remove(self.opponent.id)
-    except Exception:
-      pass
+CHALLENGE_TIMEOUT = 60.0
+DOUBLE_TIMEOUT = 30.0
 
-  @discord.ui.button(label="Accept",
-                     style=discord.ButtonStyle.success,
-                     emoji="✅")
-  async def accept_button(
-      self,
-      interaction: discord.Interaction,
-      button: discord.ui.Button,
-  ):
-    if interaction.user.id != self.opponent.id:
-      await interaction.response.send_message(
-          "⚠️ Only the challenged user can accept this coinflip.",
-          ephemeral=True,
-      )
-      return
-
-    if self.resolved:
-      await interaction.response.send_message(
-          "⚠️ This coinflip is already resolved.",
-          ephemeral=True,
-      )
-      return
-
-    self.resolved = True
-    await interaction.response.defer()
-
-    await self.cog._start_coinflip_game(self, accepted=True)
-
-  @discord.ui.button(label="Decline",
-                     style=discord.ButtonStyle.danger,
-                     emoji="❌")
-  async def decline_button(
-      self,
-      interaction: discord.Interaction,
-      button: discord.ui.Button,
-  ):
-    if interaction.user.id != self.opponent.id:
-      await interaction.response.send_message(
-          "⚠️ Only the challenged user can decline this coinflip.",
-          ephemeral=True,
-      )
-      return
-
-    if self.resolved:
-      await interaction.response.send_message(
-          "⚠️ This coinflip is already resolved.",
-          ephemeral=True,
-      )
-      return
 
-    self.resolved = True
-    await interaction.response.defer()
-
-    for child in self.children:
-      child.disabled = True
-
-    if self.message:
-      try:
-        embed = self.message.embeds[0]
-        embed.description += (
-            f"\n\n❌ **{self.opponent.mention} declined the challenge.**")
-        await self.message.edit(embed=embed, view=self)
-      except Exception:
-        pass
-
-    # FREE PLAYERS ON DECLINE
-    if self.challenger.id in self.cog.active_players:
-      self.cog.active_players.remove(self.challenger.id)
-    if self.opponent.id in self.cog.active_players:
-      self.cog.active_players.remove(self.opponent.id)
-
-
-class DoubleOrNothingView(discord.ui.View):
+class CoinflipGame:
   """
-    After a win -> winner can either TAKE WIN or go DOUBLE OR NOTHING vs the house.
+    Compact record of a coinflip waiting on a button (challenge or the
+    Double-or-Nothing choice). Persisted in live_games so the buttons keep
+    working after a reload / restart.
     """
 
-  def __init__(
-      self,
-      cog,
-      ctx: commands.Context,
-      winner: discord.Member,
-      loser: discord.Member,
-      pot: int,
-      *,
-      timeout: float = 30.0,
-  ):
-    super().__init__(timeout=timeout)
-    self.cog = cog
-    self.ctx = ctx
-    self.winner = winner
-    self.loser = loser
-    self.pot = pot
-    self.done = False
-    self.message: discord.Message | None = None
-
-  async def on_timeout(self):
-    try:
-      if self.done or self.message is None:
-        return
-
-      self.done = True
-      for child in self.children:
-        child.disabled = True
-
-      embed = self.message.embeds[0]
-      embed.description += "\n\n⏰ Time out – win locked in automatically."
-      await self.message.edit(embed=embed, view=self)
-
-      await self.cog._finish_coinflip(self.winner, self.loser)
-    except Exception:
-      pass
-
-  @discord.ui.button(label="Take Win",
-                     style=discord.ButtonStyle.success,
-                     emoji="✅")
-  async def take_win_button(
-      self,
-      interaction: discord.Interaction,
-      button: discord.ui.Button,
-  ):
-    if interaction.user.id != self.winner.id:
-      await interaction.response.send_message(
-          "⚠️ Only the winner can choose this.",
-          ephemeral=True,
-      )
-      return
-
-    if self.done:
-      await interaction.response.defer()
-      return
-
-    self.done = True
-    await interaction.response.defer()
-
-    for child in self.children:
-      child.disabled = True
-
-    if self.message:
-      try:
-        embed = self.message.embeds[0]
-        embed.description += "\n\n✅ **Win locked in. Enjoy your earnings!**"
-        await self.message.edit(embed=embed, view=self)
-      except Exception:
-        pass
-
-    await self.cog._finish_coinflip(self.winner, self.loser)
-
-  @discord.ui.button(label="Double or Nothing",
-                     style=discord.ButtonStyle.danger,
-                     emoji="🎲")
-  async def double_or_nothing_button(
-      self,
-      interaction: discord.Interaction,
-      button: discord.ui.Button,
-  ):
-    if interaction.user.id != self.winner.id:
-      await interaction.response.send_message(
-          "⚠️ Only the winner can choose Double or Nothing.",
-          ephemeral=True,
-      )
-      return
-
-    if self.done:
-      await interaction.response.defer()
-      return
-
-    self.done = True
-    await interaction.response.defer()
-
-    await self.cog._handle_double_or_nothing(self)
+  __slots__ = (
+      "game_id",
+      "stage",  # "challenge" -> "double"
+      "challenger_id",
+      "opponent_id",
+      "winner_id",
+      "side",
+      "bet",
+      "guild_id",
+      "channel_id",
+      "message_id",
+      "expires_at",  # wall clock, timeout is re-armed from this on load
+  )
+
+  def __init__(self, **fields):
+    for name in self.__slots__:
+      setattr(self, name, fields.get(name))
+
+  def to_dict(self) -> dict:
+    return {name: getattr(self, name) for name in self.__slots__}
+
+  @property
+  def pot(self) -> int:
+    return self.bet * 2
+
+  @property
+  def loser_id(self) -> int:
+    if self.winner_id == self.challenger_id:
+      return self.opponent_id
+    return self.challenger_id
+
+
+def challenge_view(game: CoinflipGame, *, disabled: bool = False):
+  """Accept / Decline buttons - routed by game id."""
+  return static_view(
+      discord.ui.Button(label="Accept",
+                        style=discord.ButtonStyle.success,
+                        emoji="✅",
+                        custom_id=f"ayo:cf:{game.game_id}:accept",
+                        disabled=disabled),
+      discord.ui.Button(label="Decline",
+                        style=discord.ButtonStyle.danger,
+                        emoji="❌",
+                        custom_id=f"ayo:cf:{game.game_id}:decline",
+                        disabled=disabled),
+  )
+
+
+def double_view(game: CoinflipGame, *, disabled: bool = False):
+  """After a win -> TAKE WIN or DOUBLE OR NOTHING vs the house."""
+  return static_view(
+      discord.ui.Button(label="Take Win",
+                        style=discord.ButtonStyle.success,
+                        emoji="✅",
+                        custom_id=f"ayo:cf:{game.game_id}:take",
+                        disabled=disabled),
+      discord.ui.Button(label="Double or Nothing",
+                        style=discord.ButtonStyle.danger,
+                        emoji="🎲",
+                        custom_id=f"ayo:cf:{game.game_id}:double",
+                        disabled=disabled),
+  )
 
 
 class Coinflip(commands.Cog):
@@ -235,8 +99,27 @@ class Coinflip(commands.Cog):
 
   def __init__(self, bot):
     self.bot = bot
+    self.router = get_router(bot)
     self.active_players: set[int] = set()
-    self.coinflip_games = {}  # Track active coinflip games
+    # game_id -> CoinflipGame (mirrored in db live_games "coinflip")
+    self.coinflip_games: dict[str, CoinflipGame] = {}
+
+  async def cog_load(self):
+    self.router.register_namespace("cf", self._on_component)
+
+    # Restart / reload: restore pending games + re-arm their timeouts
+    now = time.time()
+    for data in list(db.get_live_games("coinflip").values()):
+      game = CoinflipGame(**data)
+      self.coinflip_games[game.game_id] = game
+      self.active_players.add(game.challenger_id)
+      self.active_players.add(game.opponent_id)
+      self._arm_timeout(game, max(0.0, (game.expires_at or now) - now))
+
+  async def cog_unload(self):
+    self.router.unregister_namespace("cf", self._on_component)
+    for game_id in self.coinflip_games:
+      self.router.cancel_timer(("cf", game_id))
 
   # ======================================
   # MAIN COMMAND
@@ -311,26 +194,23 @@ class Coinflip(commands.Cog):
       self.active_players.add(ctx.author.id)
       self.active_players.add(opponent.id)
 
-      embed = make_embed(
-          title="🪙 AYO Coinflip Challenge",
-          description=
-          (f"👤 **Challenger:** {ctx.author.mention}\n"
-           f"👤 **Opponent:** {opponent.mention}\n\n"
-           f"🎯 **Bet:** `{bet:,}` {CURRENCY_EMOJI} *(each)*\n"
-           f"🏦 **Total Pot:** `{bet*2:,}` {CURRENCY_EMOJI}\n\n"
-           f"{opponent.mention}, press **Accept** to start or **Decline** to cancel.\n"
-           f"⏰ This challenge expires in 60 seconds."),
+      game = CoinflipGame(
+          game_id=uuid.uuid4().hex[:12],
+          stage="challenge",
+          challenger_id=ctx.author.id,
+          opponent_id=opponent.id,
+          bet=bet,
+          guild_id=ctx.guild.id if ctx.guild else None,
+          channel_id=ctx.channel.id,
+          expires_at=time.time() + CHALLENGE_TIMEOUT,
       )
-      view = CoinflipChallengeView(
-          self,
-          ctx,
-          ctx.author,
-          opponent,
-          bet,
-          timeout=60.0,
-      )
-      msg = await ctx.send(embed=embed, view=view)
-      view.message = msg
+      msg = await ctx.send(embed=self._challenge_embed(game),
+                           view=challenge_view(game))
+      game.message_id = msg.id
+
+      self.coinflip_games[game.game_id] = game
+      self._persist(game)
+      self._arm_timeout(game, CHALLENGE_TIMEOUT)
 
     except discord.Forbidden:
       await ctx.send(
@@ -340,7 +220,7 @@ class Coinflip(commands.Cog):
       if opponent.id in self.active_players:
         self.active_players.remove(opponent.id)
     except Exception as e:
-      print(f"Error in coinflip command: {e}")
+      log_error("coinflip_command", e, users=[ctx.author.id, opponent.id])
       await ctx.send("❌ An error occurred while creating the coinflip.")
       if ctx.author.id in self.active_players:
         self.active_players.remove(ctx.author.id)
@@ -348,261 +228,286 @@ class Coinflip(commands.Cog):
         self.active_players.remove(opponent.id)
 
   # ======================================
-  # GAME FLOW HELPERS
+  # BUTTONS
   # ======================================
 
-  async def _start_coinflip_game(
-      self,
-      view: CoinflipChallengeView,
-      accepted: bool,
-  ):
-    ctx = view.ctx
-    challenger = view.challenger
-    opponent = view.opponent
-    bet = view.bet
-    msg = view.message
-
-    try:
-      for child in view.children:
-        child.disabled = True
-
-      if not accepted:
-        await msg.edit(view=view)
-        if challenger.id in self.active_players:
-          self.active_players.remove(challenger.id)
-        if opponent.id in self.active_players:
-          self.active_players.remove(opponent.id)
-        return
-
-      profile_c = db.get_profile(challenger.id)
-      profile_o = db.get_profile(opponent.id)
-
-      # Double-check balances
-      if profile_c["cash"] < bet or profile_o["cash"] < bet:
-        reason = []
-        if profile_c["cash"] < bet:
-          reason.append(f"{challenger.mention} does not have enough cash.")
-        if profile_o["cash"] < bet:
-          reason.append(f"{opponent.mention} does not have enough cash.")
-
-        embed = make_embed(
-            title="🪙 AYO Coinflip Cancelled",
-            description="❌ Challenge cancelled:\n" + "\n".join(reason),
-        )
-        await msg.edit(embed=embed, view=view)
-
-        if challenger.id in self.active_players:
-          self.active_players.remove(challenger.id)
-        if opponent.id in self.active_players:
-          self.active_players.remove(opponent.id)
-        return
-
-      # Deduct bets
-      profile_c["cash"] -= bet
-      profile_o["cash"] -= bet
-      db.save_users()
-
-      pot = bet * 2
-
-      # Update message to show flipping
-      await msg.edit(
-          embed=make_embed(
-              title="🪙 AYO Coinflip – Flipping...",
-              description=(f"👤 Challenger: {challenger.mention}\n"
-                           f"👤 Opponent: {opponent.mention}\n\n"
-                           f"🎯 Bet Each: `{bet:,}` {CURRENCY_EMOJI}\n"
-                           f"🏦 Total Pot: `{pot:,}` {CURRENCY_EMOJI}\n\n"
-                           f"🌀 **Flipping the coin...**"),
-          ),
-          view=None,
+  async def _on_component(self, interaction: discord.Interaction,
+                          game_id: str, action: str):
+    game = self.coinflip_games.get(game_id)
+    stage = "challenge" if action in ("accept", "decline") else "double"
+    if game is None or game.stage != stage:
+      await interaction.response.send_message(
+          "⚠️ This coinflip is already resolved.",
+          ephemeral=True,
       )
+      return
 
-      # Add suspense
-      async with ctx.typing():
-        await asyncio.sleep(1.5)
-
-      # Determine winner
-      side = random.choice(["HEADS", "TAILS"])
-      if side == "HEADS":
-        winner = challenger
-        loser = opponent
-      else:
-        winner = opponent
-        loser = challenger
-
-      # Award pot to winner
-      winner_profile = db.get_profile(winner.id)
-      winner_profile["cash"] += pot
-      db.save_users()
-
-      # Create result embed
-      result_desc = (f"🎲 **Side:** `{side}`\n"
-                     f"🏆 **Winner:** {winner.mention}\n\n"
-                     f"💰 Bet Each: `{bet:,}` {CURRENCY_EMOJI}\n"
-                     f"🏦 Total Pot Won: `{pot:,}` {CURRENCY_EMOJI}\n\n"
-                     f"{winner.mention}, choose your action:\n"
-                     f"• ✅ **Take Win** - Keep your winnings\n"
-                     f"• 🎲 **Double or Nothing** - Risk it all for double!")
-
-      embed = make_embed(
-          title="🪙 AYO Coinflip – Result",
-          description=result_desc,
+    if stage == "challenge" and interaction.user.id != game.opponent_id:
+      await interaction.response.send_message(
+          f"⚠️ Only the challenged user can {action} this coinflip.",
+          ephemeral=True,
       )
-
-      # Create Double or Nothing view
-      dn_view = DoubleOrNothingView(
-          self,
-          ctx,
-          winner,
-          loser,
-          pot,
-          timeout=30.0,
+      return
+    if stage == "double" and interaction.user.id != game.winner_id:
+      await interaction.response.send_message(
+          "⚠️ Only the winner can choose this.",
+          ephemeral=True,
       )
-      result_msg = await msg.edit(embed=embed, view=dn_view)
-      dn_view.message = result_msg
-
-      # Store game info for double or nothing
-      self.coinflip_games[winner.id] = {
-          "message": msg,
-          "winner": winner,
-          "loser": loser,
-          "pot": pot,
-          "original_pot": pot
-      }
-
-      # Log the game
+      return
+
+    self.router.cancel_timer(("cf", game_id))
+    try:
+      if action == "accept":
+        await self._start_coinflip_game(game, interaction)
+      elif action == "decline":
+        self._finish_coinflip(game)
+        embed = self._challenge_embed(game)
+        embed.description += (
+            f"\n\n❌ **<@{game.opponent_id}> declined the challenge.**")
+        await interaction.response.edit_message(
+            embed=embed, view=challenge_view(game, disabled=True))
+      elif action == "take":
+        self._finish_coinflip(game)
+        embed = self._result_embed(game)
+        embed.description += "\n\n✅ **Win locked in. Enjoy your earnings!**"
+        await interaction.response.edit_message(
+            embed=embed, view=double_view(game, disabled=True))
+      elif action == "double":
+        await self._handle_double_or_nothing(game, interaction)
+    except Exception as e:
+      log_error("coinflip_button", e, users=[interaction.user.id])
+      # click ko bina jawab ke mat chhodo
+      error = "❌ Something went wrong with this coinflip. Please try again."
       try:
-        log_embed = make_embed(
-            title="🎮 Coinflip Game",
-            description=(f"Challenger: {challenger} (`{challenger.id}`)\n"
-                         f"Opponent: {opponent} (`{opponent.id}`)\n"
-                         f"Bet: {bet:,} {CURRENCY_EMOJI} each\n"
-                         f"Pot: {pot:,} {CURRENCY_EMOJI}\n"
-                         f"Side: {side}\n"
-                         f"Winner: {winner} (`{winner.id}`)\n"
-                         f"(Double or Nothing pending...)"),
-        )
-        await send_log(self.bot, ctx.guild, "games", log_embed)
-      except Exception:
+        if interaction.response.is_done():
+          await interaction.followup.send(error, ephemeral=True)
+        else:
+          await interaction.response.send_message(error, ephemeral=True)
+      except discord.HTTPException:
         pass
 
-    except Exception as e:
-      print(f"Error in _start_coinflip_game: {e}")
-      # Refund players on error
-      profile_c = db.get_profile(challenger.id)
-      profile_o = db.get_profile(opponent.id)
-      profile_c["cash"] += bet
-      profile_o["cash"] += bet
-      db.save_users()
-
-      if msg:
-        try:
-          await msg.edit(
-              embed=make_embed(
-                  title="🪙 AYO Coinflip – Error",
-                  description="❌ An error occurred. Bets have been refunded.",
-              ),
-              view=None,
-          )
-        except Exception:
-          pass
-
-      if challenger.id in self.active_players:
-        self.active_players.remove(challenger.id)
-      if opponent.id in self.active_players:
-        self.active_players.remove(opponent.id)
+  async def _on_timeout(self, game_id: str):
+    game = self.coinflip_games.get(game_id)
+    if game is None:
+      return
+    self._finish_coinflip(game)
 
-  async def _handle_double_or_nothing(self, view: DoubleOrNothingView):
-    ctx = view.ctx
-    winner = view.winner
-    loser = view.loser
-    pot = view.pot
-    msg = view.message
+    if game.stage == "challenge":
+      embed = self._challenge_embed(game)
+      embed.description += "\n\n⏰ **Challenge timed out.**"
+      view = challenge_view(game, disabled=True)
+    else:
+      embed = self._result_embed(game)
+      embed.description += "\n\n⏰ Time out – win locked in automatically."
+      view = double_view(game, disabled=True)
 
     try:
-      for child in view.children:
-        child.disabled = True
-
-      # Update message
-      embed = msg.embeds[0]
-      embed.description += ("\n\n🎲 **Double or Nothing chosen!**\n"
-                            "🌀 Flipping again vs **AYO System**...")
-      await msg.edit(embed=embed, view=view)
-
-      # Add suspense
-      async with ctx.typing():
-        await asyncio.sleep(1.5)
-
-      # Double or nothing flip
-      result = random.choice(["WIN", "LOSE"])
-      winner_profile = db.get_profile(winner.id)
-
-      if result == "WIN":
-        # Winner gets double the pot
-        winner_profile["cash"] += pot
-        db.save_users()
-
-        embed.description += (
-            f"\n\n🎉 **🎲 DOUBLE WIN! 🎲**\n"
-            f"✅ You won the Double or Nothing!\n"
-            f"💰 Extra Won: `+{pot:,}` {CURRENCY_EMOJI}\n"
-            f"🏆 Total from Coinflip + D/N: `+{pot*2:,}` {CURRENCY_EMOJI}\n"
-            f"💵 Your total winnings: `{pot*2:,}` {CURRENCY_EMOJI}")
-      else:
-        # Winner loses the original pot
-        winner_profile["cash"] -= pot
-        db.save_users()
+      await self._game_message(game).edit(embed=embed, view=view)
+    except Exception:
+      pass
 
-        embed.description += (
-            f"\n\n💥 **💸 DOUBLE LOSS! 💸**\n"
-            f"❌ You lost the Double or Nothing!\n"
-            f"📉 Lost original pot: `-{pot:,}` {CURRENCY_EMOJI}\n"
-            f"😭 Final result from this coinflip: `0` {CURRENCY_EMOJI}\n"
-            f"💡 Better luck next time!")
+  # ======================================
+  # GAME FLOW HELPERS
+  # ======================================
 
-      embed.title = "🪙 AYO Coinflip – Double or Nothing Result"
-      await msg.edit(embed=embed, view=view)
+  async def _start_coinflip_game(self, game: CoinflipGame,
+                                 interaction: discord.Interaction):
+    bet = game.bet
+    profile_c = db.get_profile(game.challenger_id)
+    profile_o = db.get_profile(game.opponent_id)
+
+    # Double-check balances
+    if profile_c["cash"] < bet or profile_o["cash"] < bet:
+      reason = []
+      if profile_c["cash"] < bet:
+        reason.append(f"<@{game.challenger_id}> does not have enough cash.")
+      if profile_o["cash"] < bet:
+        reason.append(f"<@{game.opponent_id}> does not have enough cash.")
+
+      self._finish_coinflip(game)
+      await interaction.response.edit_message(
+          embed=make_embed(
+              title="🪙 AYO Coinflip Cancelled",
+              description="❌ Challenge cancelled:\n" + "\n".join(reason),
+          ),
+          view=challenge_view(game, disabled=True),
+      )
+      return
 
-      await self._finish_coinflip(winner, loser)
+    # Whole money flow happens here, before any await: deduct bets, flip,
+    # award pot. The animation below is display only.
+    profile_c["cash"] -= bet
+    profile_o["cash"] -= bet
+
+    game.side = random.choice(["HEADS", "TAILS"])
+    if game.side == "HEADS":
+      game.winner_id = game.challenger_id
+    else:
+      game.winner_id = game.opponent_id
+    db.get_profile(game.winner_id)["cash"] += game.pot
+    db.save_users()
+
+    game.stage = "double"
+    game.expires_at = time.time() + 1.5 + DOUBLE_TIMEOUT
+    self._persist(game)
+
+    # Update message to show flipping
+    await interaction.response.edit_message(
+        embed=make_embed(
+            title="🪙 AYO Coinflip – Flipping...",
+            description=(f"👤 Challenger: <@{game.challenger_id}>\n"
+                         f"👤 Opponent: <@{game.opponent_id}>\n\n"
+                         f"🎯 Bet Each: `{bet:,}` {CURRENCY_EMOJI}\n"
+                         f"🏦 Total Pot: `{game.pot:,}` {CURRENCY_EMOJI}\n\n"
+                         f"🌀 **Flipping the coin...**"),
+        ),
+        view=None,
+    )
+    self._arm_timeout(game, 1.5 + DOUBLE_TIMEOUT)
+
+    # Add suspense
+    await asyncio.sleep(1.5)
+    if game.game_id in self.coinflip_games:
+      await interaction.edit_original_response(embed=self._result_embed(game),
+                                               view=double_view(game))
+
+    # Log the game
+    try:
+      log_embed = make_embed(
+          title="🎮 Coinflip Game",
+          description=(f"Challenger: {self._user_label(game.challenger_id)}\n"
+                       f"Opponent: {self._user_label(game.opponent_id)}\n"
+                       f"Bet: {bet:,} {CURRENCY_EMOJI} each\n"
+                       f"Pot: {game.pot:,} {CURRENCY_EMOJI}\n"
+                       f"Side: {game.side}\n"
+                       f"Winner: {self._user_label(game.winner_id)}\n"
+                       f"(Double or Nothing pending...)"),
+      )
+      await send_log(self.bot,
+                     interaction.guild,
+                     "games",
+                     log_embed,
+                     game="coinflip",
+                     users=[game.challenger_id, game.opponent_id],
+                     bet=bet,
+                     pot=game.pot,
+                     winner=game.winner_id)
+    except Exception:
+      pass
 
-      # Log double or nothing result
-      try:
-        log_embed = make_embed(
-            title="🎮 Coinflip Double or Nothing",
-            description=(f"Winner: {winner} (`{winner.id}`)\n"
-                         f"Loser: {loser} (`{loser.id}`)\n"
-                         f"Pot: {pot:,} {CURRENCY_EMOJI}\n"
-                         f"Result: {result}"),
-        )
-        await send_log(self.bot, ctx.guild, "games", log_embed)
-      except Exception:
-        pass
+  async def _handle_double_or_nothing(self, game: CoinflipGame,
+                                      interaction: discord.Interaction):
+    pot = game.pot
 
-    except Exception as e:
-      print(f"Error in _handle_double_or_nothing: {e}")
-      # Clean up on error
-      if winner.id in self.coinflip_games:
-        del self.coinflip_games[winner.id]
-      await self._finish_coinflip(winner, loser)
+    # Resolve first (no await in between), then animate
+    result = random.choice(["WIN", "LOSE"])
+    winner_profile = db.get_profile(game.winner_id)
+    if result == "WIN":
+      # Winner gets double the pot
+      winner_profile["cash"] += pot
+    else:
+      # Winner loses the original pot
+      winner_profile["cash"] -= pot
+    db.save_users()
+    self._finish_coinflip(game)
+
+    embed = self._result_embed(game)
+    embed.description += ("\n\n🎲 **Double or Nothing chosen!**\n"
+                          "🌀 Flipping again vs **AYO System**...")
+    view = double_view(game, disabled=True)
+    await interaction.response.edit_message(embed=embed, view=view)
+
+    # Add suspense
+    await asyncio.sleep(1.5)
+
+    if result == "WIN":
+      embed.description += (
+          f"\n\n🎉 **🎲 DOUBLE WIN! 🎲**\n"
+          f"✅ You won the Double or Nothing!\n"
+          f"💰 Extra Won: `+{pot:,}` {CURRENCY_EMOJI}\n"
+          f"🏆 Total from Coinflip + D/N: `+{pot*2:,}` {CURRENCY_EMOJI}\n"
+          f"💵 Your total winnings: `{pot*2:,}` {CURRENCY_EMOJI}")
+    else:
+      embed.description += (
+          f"\n\n💥 **💸 DOUBLE LOSS! 💸**\n"
+          f"❌ You lost the Double or Nothing!\n"
+          f"📉 Lost original pot: `-{pot:,}` {CURRENCY_EMOJI}\n"
+          f"😭 Final result from this coinflip: `0` {CURRENCY_EMOJI}\n"
+          f"💡 Better luck next time!")
+
+    embed.title = "🪙 AYO Coinflip – Double or Nothing Result"
+    await interaction.edit_original_response(embed=embed, view=view)
+
+    # Log double or nothing result
+    try:
+      log_embed = make_embed(
+          title="🎮 Coinflip Double or Nothing",
+          description=(f"Winner: {self._user_label(game.winner_id)}\n"
+                       f"Loser: {self._user_label(game.loser_id)}\n"
+                       f"Pot: {pot:,} {CURRENCY_EMOJI}\n"
+                       f"Result: {result}"),
+      )
+      await send_log(self.bot,
+                     interaction.guild,
+                     "games",
+                     log_embed,
+                     game="coinflip_double",
+                     users=[game.winner_id],
+                     pot=pot,
+                     result=result)
+    except Exception:
+      pass
 
-  async def _finish_coinflip(
-      self,
-      winner: discord.Member,
-      loser: discord.Member,
-  ):
+  def _finish_coinflip(self, game: CoinflipGame):
     """Clean up after a coinflip game."""
-    try:
-      # Remove from active players
-      if winner.id in self.active_players:
-        self.active_players.remove(winner.id)
-      if loser.id in self.active_players:
-        self.active_players.remove(loser.id)
-
-      # Remove from coinflip games tracking
-      if winner.id in self.coinflip_games:
-        del self.coinflip_games[winner.id]
-    except Exception as e:
-      print(f"Error in _finish_coinflip: {e}")
+    self.router.cancel_timer(("cf", game.game_id))
+    self.active_players.discard(game.challenger_id)
+    self.active_players.discard(game.opponent_id)
+    self.coinflip_games.pop(game.game_id, None)
+    db.get_live_games("coinflip").pop(game.game_id, None)
+    db.save_live_games()
+
+  def _persist(self, game: CoinflipGame):
+    db.get_live_games("coinflip")[game.game_id] = game.to_dict()
+    db.save_live_games()
+
+  def _arm_timeout(self, game: CoinflipGame, timeout: float):
+    game_id = game.game_id
+    self.router.set_timer(("cf", game_id), timeout,
+                          lambda: self._on_timeout(game_id))
+
+  def _game_message(self, game: CoinflipGame) -> discord.PartialMessage:
+    channel = self.bot.get_partial_messageable(game.channel_id)
+    return channel.get_partial_message(game.message_id)
+
+  def _user_label(self, user_id: int) -> str:
+    user = self.bot.get_user(user_id)
+    return f"{user or user_id} (`{user_id}`)"
+
+  def _challenge_embed(self, game: CoinflipGame) -> discord.Embed:
+    return make_embed(
+        title="🪙 AYO Coinflip Challenge",
+        description=
+        (f"👤 **Challenger:** <@{game.challenger_id}>\n"
+         f"👤 **Opponent:** <@{game.opponent_id}>\n\n"
+         f"🎯 **Bet:** `{game.bet:,}` {CURRENCY_EMOJI} *(each)*\n"
+         f"🏦 **Total Pot:** `{game.pot:,}` {CURRENCY_EMOJI}\n\n"
+         f"<@{game.opponent_id}>, press **Accept** to start or **Decline** to cancel.\n"
+         f"⏰ This challenge expires in 60 seconds."),
+    )
+
+  def _result_embed(self, game: CoinflipGame) -> discord.Embed:
+    winner = f"<@{game.winner_id}>"
+    return make_embed(
+        title="🪙 AYO Coinflip – Result",
+        description=(f"🎲 **Side:** `{game.side}`\n"
+                     f"🏆 **Winner:** {winner}\n\n"
+                     f"💰 Bet Each: `{game.bet:,}` {CURRENCY_EMOJI}\n"
+                     f"🏦 Total Pot Won: `{game.pot:,}` {CURRENCY_EMOJI}\n\n"
+                     f"{winner}, choose your action:\n"
+                     f"• ✅ **Take Win** - Keep your winnings\n"
+                     f"• 🎲 **Double or Nothing** - Risk it all for double!"),
+    )
 
   # ======================================
   # CLEANUP COMMANDS
@@ -614,8 +519,12 @@ class Coinflip(commands.Cog):
     """Clean up stuck coinflip games (Owner only)."""
     try:
       count = len(self.active_players)
+      for game_id in self.coinflip_games:
+        self.router.cancel_timer(("cf", game_id))
       self.active_players.clear()
       self.coinflip_games.clear()
+      db.get_live_games("coinflip").clear()
+      db.save_live_games()
 
       await ctx.send(f"✅ Cleaned up {count} stuck coinflip games.")
     except Exception as e:
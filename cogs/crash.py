@@ -3,53 +3,82 @@
 import random
 import asyncio
 import math
-from collections import deque
+import time
+import uuid
 
 import discord
 from discord.ext import commands
 
-from utils import db
+from utils import crash_sim, db
 from utils.common import make_embed, send_log
+from utils.crash_math import (
+    BIG_WIN_CAP_RANGE,
+    BIG_WIN_MIN_SAMPLES,
+    BIG_WIN_MULT,
+    BIG_WIN_RATE_CAP,
+    BIG_WIN_WINDOW,
+    CRASH_BANDS,
+    CRASH_MAX,
+    CRASH_MIN,
+    STOP_GRACE,
+    STREAK_FLOORS,
+    ClickClock,
+    build_curve,
+    multiplier_at,
+    time_to_reach,
+)
+from utils.router import get_router, static_view
+from utils.rtp import get_rtp, save_rtp, save_rtp_if_dirty
 
 CURRENCY_EMOJI = "💰"
 MAX_BET = 250_000
 STOP_EMOJI = "⏹️"
 
+# Multiplier growth per second: start slow, then speed up.
+CRASH_CURVE = build_curve([
+    (1.0, 0.40),
+    (2.0, 0.70),
+    (5.0, 1.20),
+])
 
-class CrashView(discord.ui.View):
+
+class CrashGame:
     """
-    STOP button view - sirf game owner use kar sakta hai.
+    Compact record of one running crash game. Stored in the cog table and
+    persisted in live_games, so the STOP button works after a restart.
     """
 
-    def __init__(self, user_id: int, *, timeout: float = 120.0):
-        super().__init__(timeout=timeout)
-        self.user_id = user_id
-        self.stopped = False
-
-    @discord.ui.button(
-        label="STOP",
-        emoji=STOP_EMOJI,
-        style=discord.ButtonStyle.danger,
+    __slots__ = (
+        "game_id",
+        "user_id",
+        "guild_id",
+        "channel_id",
+        "message_id",
+        "bet",
+        "crash_point",
+        "started_at",
+        "crash_at",
+        "stopped_at",  # STOP press, moved onto the host clock
     )
-    async def stop_button(
-        self,
-        interaction: discord.Interaction,
-        button: discord.ui.Button,
-    ):
-        # Sirf game start karne wala banda click kar sakta hai
-        if interaction.user.id != self.user_id:
-            await interaction.response.send_message(
-                "⚠️ This is not your crash game.",
-                ephemeral=True,
-            )
-            return
 
-        if self.stopped:
-            await interaction.response.defer()
-            return
+    def __init__(self, **fields):
+        for name in self.__slots__:
+            setattr(self, name, fields.get(name))
+
+    def to_dict(self) -> dict:
+        return {name: getattr(self, name) for name in self.__slots__}
 
-        self.stopped = True
-        await interaction.response.defer()
+
+def stop_view(game: CrashGame, *, disabled: bool = False) -> discord.ui.View:
+    """STOP button - routed by game id, no per-game View object."""
+    return static_view(
+        discord.ui.Button(
+            label="STOP",
+            emoji=STOP_EMOJI,
+            style=discord.ButtonStyle.danger,
+            custom_id=f"ayo:crash:{game.game_id}:stop",
+            disabled=disabled,
+        ))
 
 
 class Crash(commands.Cog):
@@ -57,20 +86,39 @@ class Crash(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         self.active = set()  # user_id set -> prevent multi-games
-
-        # GLOBAL RTP + STATS
-        self.target_rtp = 0.90  # 90% default RTP (owner command se change hoga)
-        self.global_stats = {
-            "bet_total": 0,
-            "paid_out": 0,
-            "games": 0,
-        }
-
-        # USER streaks: {user_id: {"win": int, "loss": int}}
-        self.user_streaks = {}
-
-        # Recent big wins (True/False) anti-lucky-spam ke liye
-        self.recent_big_wins = deque(maxlen=50)
+        self.router = get_router(bot)
+
+        # game_id -> CrashGame (mirrored in db live_games "crash")
+        self.games: dict[str, CrashGame] = {}
+        # game_id -> ticker task (live multiplier display + settlement)
+        self._tickers: dict[str, asyncio.Task] = {}
+        # games run on time.time(); Discord stamps messages + clicks with
+        # its own clock -> converted, so display / settle / STOP agree
+        self.click_clock = ClickClock()
+
+        # GLOBAL RTP + STATS + streaks + recent big wins (utils/rtp.py,
+        # restart ke baad bhi yaad rehte hain). Target 90% default, owner
+        # command se change hoga.
+        self.rtp = get_rtp("crash", target=0.90, window=BIG_WIN_WINDOW)
+
+    async def cog_load(self):
+        self.router.register_namespace("crash", self._on_component)
+
+        # Restart / reload: pick up games that were still running
+        for data in list(db.get_live_games("crash").values()):
+            game = CrashGame(**data)
+            self.games[game.game_id] = game
+            self.active.add(game.user_id)
+            self._tickers[game.game_id] = asyncio.create_task(
+                self._run_game(game))
+
+    async def cog_unload(self):
+        self.router.unregister_namespace("crash", self._on_component)
+        # Records stay in live_games -> next load resumes them
+        for task in self._tickers.values():
+            task.cancel()
+        self._tickers.clear()
+        save_rtp_if_dirty()
 
     # ======================================
     # OWNER COMMAND: RTP CONTROL
@@ -87,7 +135,7 @@ class Crash(commands.Cog):
         Range: 0.50 - 0.99
         """
         if value is None:
-            current = self.target_rtp
+            current = self.rtp.target
             await ctx.send(embed=make_embed(
                 title="🎯 Crash RTP",
                 description=(f"Current Crash RTP: **{current:.2%}**\n"
@@ -101,12 +149,57 @@ class Crash(commands.Cog):
                 "❌ RTP must be between `0.50` and `0.99` (50% - 99%).")
             return
 
-        self.target_rtp = value
+        self.rtp.target = value
+        save_rtp()
         await ctx.send(embed=make_embed(
             title="✅ Crash RTP Updated",
             description=f"New Crash RTP set to **{value:.2%}**",
         ))
 
+    @commands.command(name="crashsim")
+    @commands.is_owner()
+    async def crash_sim_command(self,
+                                ctx: commands.Context,
+                                games: int = 10_000_000,
+                                strategy: str = "fixed:2"):
+        """
+        Owner only: simulate the crash generator at the current RTP target.
+        ayo crashsim 20000000 fixed:2
+        Strategies: fixed:<x>, range:<lo>:<hi>, martingale:<x>
+        """
+        games = max(10_000, min(games, 50_000_000))
+        try:
+            crash_sim.parse_strategy(strategy)
+        except ValueError:
+            await ctx.send("❌ Strategy must be `fixed:<x>`, `range:<lo>:<hi>` "
+                           "or `martingale:<x>` (targets above x1.00).")
+            return
+
+        msg = await ctx.send(f"⏳ Simulating `{games:,}` crash games "
+                             f"(`{strategy}`)...")
+        try:
+            stats = await crash_sim.run_async(games, strategy, self.rtp.target,
+                                              state=self.rtp.to_dict())
+        except RuntimeError as e:
+            await msg.edit(content=f"❌ Simulator unavailable: {e}.")
+            return
+
+        await msg.edit(content=None, embed=make_embed(
+            title="🧪 Crash RTP Simulation",
+            description=
+            (f"🎮 Games: `{stats['games']:,}` in `{stats['sessions']:,}` sessions "
+             f"of `{crash_sim.SESSION_GAMES}` • strategy `{strategy}`\n"
+             f"🎯 Target RTP: `{self.rtp.target:.2%}`\n\n"
+             f"📊 Realized RTP: **{stats['rtp']:.2%}** "
+             f"(± `{1.96 * stats['stderr']:.2%}`)\n"
+             f"📈 Variance per game: `{stats['variance']:.3f}`\n"
+             f"💀 Ruin (can't cover next bet): `{stats['ruin']:.2%}`\n"
+             f"👤 Player net p5 / median / p95: `{stats['net_p5']:,.0f}` / "
+             f"`{stats['net_p50']:,.0f}` / `{stats['net_p95']:,.0f}` {CURRENCY_EMOJI}\n"
+             f"🏦 House net: `{stats['house_net']:,}` {CURRENCY_EMOJI}\n\n"
+             f"⏱️ `{stats['seconds']:.1f}s`"),
+        ))
+
     # ======================================
     # MAIN GAME COMMAND
     # ======================================
@@ -162,261 +255,285 @@ class Crash(commands.Cog):
         profile["cash"] -= bet
         db.save_users()
 
-        try:
+        game = CrashGame(
+            game_id=uuid.uuid4().hex[:12],
+            user_id=ctx.author.id,
+            guild_id=ctx.guild.id if ctx.guild else None,
+            channel_id=ctx.channel.id,
+            bet=bet,
             # Random crash point with advanced logic
-            crash_point = self._generate_crash_point(ctx.author.id, bet)
-
-            multiplier = 1.0
-            stopped = False
-            cashout_mult = None
-
-            # Initial embed
-            embed = make_embed(
-                title="🚀 AYO Crash",
-                description=
-                (f"👤 Player: {ctx.author.mention}\n"
-                 f"🎯 **Bet:** `{bet:,}` {CURRENCY_EMOJI}\n"
-                 f"📈 **Multiplier:** `1.00x`\n"
-                 f"💵 **Potential Cashout:** `{bet:,}` {CURRENCY_EMOJI}\n\n"
-                 f"Press the **{STOP_EMOJI} STOP** button **anytime to CASHOUT** before it crashes!"
-                 ),
+            crash_point=self._generate_crash_point(ctx.author.id, bet),
+        )
+
+        try:
+            msg = await ctx.send(embed=self._playing_embed(game, 1.0),
+                                 view=stop_view(game))
+        except Exception:
+            # Game never started -> bet wapas
+            profile["cash"] += bet
+            db.save_users()
+            self.active.discard(ctx.author.id)
+            raise
+
+        # Round clock starts at message creation, moved onto the host clock
+        # the ticker runs on (STOP presses get the same conversion)
+        game.message_id = msg.id
+        game.started_at = self.click_clock.host_time(
+            msg.created_at.timestamp())
+        game.crash_at = game.started_at + time_to_reach(
+            CRASH_CURVE, game.crash_point)
+
+        self.games[game.game_id] = game
+        self._persist(game)
+        self._tickers[game.game_id] = asyncio.create_task(
+            self._run_game(game))
+
+    # ======================================
+    # STOP BUTTON + GAME LOOP
+    # ======================================
+
+    async def _on_component(self, interaction: discord.Interaction,
+                            game_id: str, action: str):
+        game = self.games.get(game_id)
+        if game is None or action != "stop":
+            await interaction.response.send_message(
+                "⌛ This crash game is already over.",
+                ephemeral=True,
+            )
+            return
+
+        # Sirf game start karne wala banda click kar sakta hai
+        if interaction.user.id != game.user_id:
+            await interaction.response.send_message(
+                "⚠️ This is not your crash game.",
+                ephemeral=True,
             )
+            return
 
-            view = CrashView(ctx.author.id, timeout=120.0)
-            msg = await ctx.send(embed=embed, view=view)
+        if game.stopped_at is None:
+            game.stopped_at = self.click_clock.host_time(
+                interaction.created_at.timestamp())
+            self._persist(game)
+        # Ticker settles on its next step
+        await interaction.response.defer()
 
-            # GAME LOOP
-            step_time = 0.25  # seconds per step
+    async def _run_game(self, game: CrashGame):
+        """Display loop only - result depends on timestamps."""
+        step_time = 0.25  # seconds per step
+        await self.bot.wait_until_ready()
+        msg = self._game_message(game)
 
+        try:
             while True:
                 await asyncio.sleep(step_time)
 
-                # Agar user ne STOP press kar diya:
-                if view.stopped:
-                    stopped = True
-                    cashout_mult = multiplier
+                now = time.time()
+                if game.stopped_at is not None:
                     break
+                if now >= game.crash_at:
+                    # STOP stamped before the crash can still arrive late:
+                    # settle only once the grace window is over
+                    if now >= game.crash_at + STOP_GRACE:
+                        break
+                    continue
 
-                # multiplier increase
-                multiplier = self._next_multiplier(multiplier)
+                # Live update: multiplier + potential cashout
+                multiplier = multiplier_at(CRASH_CURVE, now - game.started_at)
+                try:
+                    await msg.edit(embed=self._playing_embed(game, multiplier))
+                except discord.HTTPException:
+                    pass
 
-                # crash check
-                if multiplier >= crash_point:
-                    break
+            await self._settle(game, msg)
+        finally:
+            self._tickers.pop(game.game_id, None)
+
+    async def _settle(self, game: CrashGame, msg: discord.PartialMessage):
+        self.games.pop(game.game_id, None)
+        db.get_live_games("crash").pop(game.game_id, None)
+        db.save_live_games()
+        self.active.discard(game.user_id)
+
+        bet = game.bet
+        crash_point = game.crash_point
+
+        # Cashout valued at the moment STOP was pressed, not when we woke up
+        cashout_mult = None
+        if game.stopped_at is not None and game.stopped_at < game.crash_at:
+            cashout_mult = multiplier_at(CRASH_CURVE,
+                                         game.stopped_at - game.started_at)
+
+        profile = db.get_profile(game.user_id)  # reload
+        result_desc = ""
+        roi_percent = -100.0  # default = full loss
+        win_amount = 0
+        profit = 0
+        win = False
+
+        # WIN condition
+        if cashout_mult is not None and cashout_mult < crash_point:
+            win = True
+            win_amount = int(bet * cashout_mult)
+            profit = win_amount - bet
+            profile["cash"] += win_amount
+
+            # XP reward – small (level up message goes to the game channel)
+            from_cog = self.bot.get_cog("Economy")
+            if from_cog:
+                await from_cog._add_xp_and_check_level(msg.channel,
+                                                       profile,
+                                                       xp_gain=8)
+
+            db.save_users()
+
+            roi_percent = (profit / bet) * 100 if bet > 0 else 0
+
+            result_desc = (
+                f"✅ **You CASHED OUT!**\n\n"
+                f"📈 Cashout Multiplier: `{cashout_mult:.2f}x`\n"
+                f"💵 Winnings: `{win_amount:,}` {CURRENCY_EMOJI}\n"
+                f"📊 Profit: `+{profit:,}` {CURRENCY_EMOJI}\n"
+                f"📈 ROI: `+{roi_percent:.1f}%`\n\n"
+                f"💣 Crash Point was: `{crash_point:.2f}x`")
+        else:
+            # crashed
+            result_desc = (
+                f"💥 **CRASHED!**\n\n"
+                f"📉 Crash Point: `{crash_point:.2f}x`\n"
+                f"❌ You lost your bet of `{bet:,}` {CURRENCY_EMOJI}.\n"
+                f"📈 ROI: `-100.0%`")
+
+        # Streaks + big wins (anti-lucky spam) + RTP stats, ek hi call
+        big_win = win and (cashout_mult is not None and cashout_mult >= BIG_WIN_MULT)
+        win_streak, loss_streak = self.rtp.record(game.user_id,
+                                                  bet,
+                                                  win_amount,
+                                                  won=win,
+                                                  big_win=big_win)
+
+        # RTP info (for footer)
+        actual_rtp = self.rtp.rtp()
+
+        # Final embed
+        user = self.bot.get_user(game.user_id)
+        embed = make_embed(
+            title="🚀 AYO Crash – Result",
+            description=
+            (f"👤 Player: <@{game.user_id}>\n"
+             f"🎯 Bet: `{bet:,}` {CURRENCY_EMOJI}\n\n"
+             f"{result_desc}\n"
+             f"📉 Loss Streak: `{loss_streak}` • 🏆 Win Streak: `{win_streak}`"
+             ),
+        )
+        embed.set_footer(
+            text=
+            f"AYO Crash • RTP: {actual_rtp:.1%} (Target: {self.rtp.target:.1%})",
+            icon_url=user.display_avatar.url if user else None,
+        )
 
-                # Live update: multiplier + potential cashout
-                current_cash = int(bet * multiplier)
-
-                embed.description = (
-                    f"👤 Player: {ctx.author.mention}\n"
-                    f"🎯 **Bet:** `{bet:,}` {CURRENCY_EMOJI}\n"
-                    f"📈 **Multiplier:** `{multiplier:.2f}x`\n"
-                    f"💵 **Potential Cashout:** `{current_cash:,}` {CURRENCY_EMOJI}\n\n"
-                    f"Press the **{STOP_EMOJI} STOP** button **anytime to CASHOUT** before it crashes!"
-                )
-                await msg.edit(embed=embed, view=view)
-
-            # Disable button after game ends
-            for child in view.children:
-                child.disabled = True
-
-            profile = db.get_profile(ctx.author.id)  # reload
-            result_desc = ""
-            roi_percent = -100.0  # default = full loss
-            win_amount = 0
-            profit = 0
-            win = False
-
-            # WIN condition
-            if stopped and cashout_mult is not None and cashout_mult < crash_point:
-                win = True
-                win_amount = int(bet * cashout_mult)
-                profit = win_amount - bet
-                profile["cash"] += win_amount
-
-                # XP reward – small
-                from_cog = self.bot.get_cog("Economy")
-                if from_cog:
-                    await from_cog._add_xp_and_check_level(ctx,
-                                                           profile,
-                                                           xp_gain=8)
-
-                db.save_users()
-
-                roi_percent = (profit / bet) * 100 if bet > 0 else 0
-
-                result_desc = (
-                    f"✅ **You CASHED OUT!**\n\n"
-                    f"📈 Cashout Multiplier: `{cashout_mult:.2f}x`\n"
-                    f"💵 Winnings: `{win_amount:,}` {CURRENCY_EMOJI}\n"
-                    f"📊 Profit: `+{profit:,}` {CURRENCY_EMOJI}\n"
-                    f"📈 ROI: `+{roi_percent:.1f}%`\n\n"
-                    f"💣 Crash Point was: `{crash_point:.2f}x`")
-            else:
-                # crashed
-                crash_mult_display = max(multiplier, crash_point)
-
-                result_desc = (
-                    f"💥 **CRASHED!**\n\n"
-                    f"📉 Crash Point: `{crash_mult_display:.2f}x`\n"
-                    f"❌ You lost your bet of `{bet:,}` {CURRENCY_EMOJI}.\n"
-                    f"📈 ROI: `-100.0%`")
-
-            # Update streaks
-            streak = self.user_streaks.get(ctx.author.id, {
-                "win": 0,
-                "loss": 0
-            })
-            if win:
-                streak["win"] += 1
-                streak["loss"] = 0
+        try:
+            await msg.edit(embed=embed, view=stop_view(game, disabled=True))
+        except discord.HTTPException:
+            pass
+
+        # LOGS / STATS to games log channel
+        try:
+            if win and cashout_mult:
+                stats_text = (f"Result: CASHED OUT\n"
+                              f"Bet: {bet:,}\n"
+                              f"Cashout: {cashout_mult:.2f}x\n"
+                              f"Crash: {crash_point:.2f}x\n"
+                              f"ROI: +{roi_percent:.1f}%")
             else:
-                streak["loss"] += 1
-                streak["win"] = 0
-            self.user_streaks[ctx.author.id] = streak
-
-            # Track big wins for anti-lucky spam
-            big_win = win and (cashout_mult is not None
-                               and cashout_mult >= 3.0)
-            self.recent_big_wins.append(big_win)
-
-            # Update global stats for RTP
-            self.global_stats["games"] += 1
-            self.global_stats["bet_total"] += bet
-            if win:
-                self.global_stats["paid_out"] += win_amount
-
-            # RTP info (for footer)
-            bet_total = self.global_stats["bet_total"]
-            paid_out = self.global_stats["paid_out"]
-            actual_rtp = (paid_out / bet_total) if bet_total > 0 else 0.0
-
-            # Final embed
-            embed.title = "🚀 AYO Crash – Result"
-            embed.description = (
-                f"👤 Player: {ctx.author.mention}\n"
-                f"🎯 Bet: `{bet:,}` {CURRENCY_EMOJI}\n\n"
-                f"{result_desc}\n"
-                f"📉 Loss Streak: `{streak['loss']}` • 🏆 Win Streak: `{streak['win']}`"
+                stats_text = (f"Result: CRASHED\n"
+                              f"Bet: {bet:,}\n"
+                              f"Crash: {crash_point:.2f}x")
+
+            guild = self.bot.get_guild(game.guild_id) if game.guild_id else None
+            log_embed = make_embed(
+                title="🎮 Crash Game",
+                description=(f"Player: {user or game.user_id} (`{game.user_id}`)\n"
+                             f"Guild: {guild.name if guild else 'DM'}\n\n"
+                             f"{stats_text}"),
             )
-            embed.set_footer(
-                text=
-                f"AYO Crash • RTP: {actual_rtp:.1%} (Target: {self.target_rtp:.1%})",
-                icon_url=ctx.author.display_avatar.url,
-            )
-
-            await msg.edit(embed=embed, view=view)
-
-            # LOGS / STATS to games log channel
-            try:
-                if win and cashout_mult:
-                    stats_text = (f"Result: CASHED OUT\n"
-                                  f"Bet: {bet:,}\n"
-                                  f"Cashout: {cashout_mult:.2f}x\n"
-                                  f"Crash: {crash_point:.2f}x\n"
-                                  f"ROI: +{roi_percent:.1f}%")
-                else:
-                    stats_text = (f"Result: CRASHED\n"
-                                  f"Bet: {bet:,}\n"
-                                  f"Crash: {crash_point:.2f}x")
-
-                log_embed = make_embed(
-                    title="🎮 Crash Game",
-                    description=(
-                        f"Player: {ctx.author} (`{ctx.author.id}`)\n"
-                        f"Guild: {ctx.guild.name if ctx.guild else 'DM'}\n\n"
-                        f"{stats_text}"),
-                )
-                await send_log(self.bot, ctx.guild, "games", log_embed)
-            except Exception:
-                pass
-
-        finally:
-            self.active.discard(ctx.author.id)
+            await send_log(self.bot,
+                           guild,
+                           "games",
+                           log_embed,
+                           game="crash",
+                           users=[game.user_id],
+                           bet=bet,
+                           payout=win_amount,
+                           crash_point=crash_point,
+                           cashout=cashout_mult)
+        except Exception:
+            pass
 
     # ======================================
     # INTERNAL HELPERS
     # ======================================
 
+    def _persist(self, game: CrashGame):
+        db.get_live_games("crash")[game.game_id] = game.to_dict()
+        db.save_live_games()
+
+    def _game_message(self, game: CrashGame) -> discord.PartialMessage:
+        """Message handle from stored ids (no fetch, works after restart)."""
+        channel = self.bot.get_partial_messageable(game.channel_id)
+        return channel.get_partial_message(game.message_id)
+
+    def _playing_embed(self, game: CrashGame,
+                       multiplier: float) -> discord.Embed:
+        current_cash = int(game.bet * multiplier)
+        return make_embed(
+            title="🚀 AYO Crash",
+            description=
+            (f"👤 Player: <@{game.user_id}>\n"
+             f"🎯 **Bet:** `{game.bet:,}` {CURRENCY_EMOJI}\n"
+             f"📈 **Multiplier:** `{multiplier:.2f}x`\n"
+             f"💵 **Potential Cashout:** `{current_cash:,}` {CURRENCY_EMOJI}\n\n"
+             f"Press the **{STOP_EMOJI} STOP** button **anytime to CASHOUT** before it crashes!"
+             ),
+        )
+
     def _generate_crash_point(self, user_id: int, bet: int) -> float:
         """
         Custom distribution + streak protector + anti-lucky + RTP adjust.
+        (Settings live in utils/crash_math.py, shared with the simulator.)
         """
         r = random.random()
 
         # --- Base distribution (tumhari requirement) ---
-
-        # Very rare instant crash ~1.1
-        if r < 0.03:
-            base = random.uniform(1.10, 1.20)
-        # Most common 1.2 - 1.6
-        elif r < 0.58:  # +55%
-            base = random.uniform(1.20, 1.60)
-        # Medium wins 1.6 - 3.0
-        elif r < 0.78:  # +20%
-            base = random.uniform(1.60, 3.00)
-        # High range 3 - 20x (sometimes goes high)
-        elif r < 0.95:  # +17%
-            base = random.uniform(3.0, 20.0)
-        # Ultra rare jackpots 20x - 100x (1 in 20 games)
-        else:
-            base = random.uniform(20.0, 100.0)
+        for cumulative, low, high in CRASH_BANDS:
+            if r < cumulative:
+                break
+        base = random.uniform(low, high)
 
         # --- Streak protector (user based) ---
-        streak = self.user_streaks.get(user_id, {"win": 0, "loss": 0})
-        loss_streak = streak["loss"]
+        loss_streak = self.rtp.streak(user_id)[1]
 
         # Agar banda bar bar haar raha ho to min multiplier thora safe
-        if loss_streak >= 3:
-            base = max(base, 1.60)
-        if loss_streak >= 5:
-            base = max(base, 2.00)
+        for min_streak, floor in STREAK_FLOORS:
+            if loss_streak >= min_streak:
+                base = max(base, floor)
 
         # --- Anti-lucky spam (global big wins) ---
-        if len(self.recent_big_wins) > 10:
-            big_win_rate = sum(1 for x in self.recent_big_wins if x) / len(
-                self.recent_big_wins)
-        else:
-            big_win_rate = 0.0
+        big_win_rate = self.rtp.big_win_rate(BIG_WIN_MIN_SAMPLES)
 
         # Agar recent games mein bohat zyada 3x+ wins aaye hon
-        if big_win_rate > 0.35 and base > 3.0:
+        if big_win_rate > BIG_WIN_RATE_CAP and base > BIG_WIN_MULT:
             # Cap karo 3x - 8x range mein
-            base = min(base, random.uniform(3.0, 8.0))
+            base = min(base, random.uniform(*BIG_WIN_CAP_RANGE))
 
         # --- RTP Adjust (global) ---
-        stats = self.global_stats
-        bet_total = stats["bet_total"]
-        paid_out = stats["paid_out"]
-
-        if bet_total > 0:
-            actual_rtp = paid_out / bet_total
-            target = self.target_rtp
-
-            # 5% ka buffer
-            if actual_rtp < target - 0.05:
-                # Players ko thoda buff (house bohat zyada jeet raha)
-                base *= 1.15
-            elif actual_rtp > target + 0.05:
-                # House ko buff (players bohat jeet rahe)
-                base *= 0.85
+        # Smooth factor: target se jitna door, utna zyada (max ±15%).
+        # >1 players ko buff, <1 house ko buff.
+        base *= self.rtp.factor()
 
         # Final clamp
-        base = max(1.10, min(base, 100.0))
+        base = max(CRASH_MIN, min(base, CRASH_MAX))
         return round(base, 2)
 
-    def _next_multiplier(self, current: float) -> float:
-        """
-        Smooth curve: start slow, then speed up.
-        """
-        if current < 2:
-            step = random.uniform(0.05, 0.15)
-        elif current < 5:
-            step = random.uniform(0.10, 0.25)
-        else:
-            step = random.uniform(0.20, 0.40)
-        return current + step
-
 
 async def setup(bot):
     await bot.add_cog(Crash(bot))
@@ -158,8 +158,13 @@ class Economy(commands.Cog):
             value=
             ("`ayo cf <amount> <h/t>` – Coinflip (e.g. `ayo cf 5000 t`, `ayo cf t 5000`, `ayocf all h`)\n"
              "`ayo slots <amount>` – Slots (e.g. `ayo slots 5000`, `ayos all`)\n"
-             "`ayobj <amount>` – Blackjack (reactions: 1️⃣ hit, 2️⃣ stand, 3️⃣ double)\n"
-             "`ayocrash <amount>` – Crash game"),
+             "`ayobj <amount>` – Blackjack (buttons: hit, stand, double, split, insurance, hint)\n"
+             "`ayo bjtable <amount>` – Blackjack table, up to 7 players on one message (others press Join)\n"
+             "`ayocrash <amount>` – Crash game\n"
+             "`ayo crashauto <x/off>` – Global crash auto cashout (e.g. `ayo crashauto 2.5`)\n"
+             "`ayo crashhistory [rounds]` – Global crash stats (histogram, streaks, house edge)\n"
+             "`ayo crashreplay <seed> [sec]` – Replay a global crash round from its seed\n"
+             "`ayo crashfair` / `ayo crashverify <round> <seed>` – Provably fair hash chain"),
             inline=False,
         )
         embed.add_field(
@@ -393,7 +398,13 @@ class Economy(commands.Cog):
                 description=
                 f"{ctx.author} claimed **{amount:,} {CURRENCY_EMOJI}** (streak {streak}).",
             )
-            await send_log(self.bot, ctx.guild, "daily", log_embed)
+            await send_log(self.bot,
+                           ctx.guild,
+                           "daily",
+                           log_embed,
+                           users=[ctx.author.id],
+                           amount=amount,
+                           streak=streak)
 
     @commands.command(name="streak")
     async def streak_command(self,
@@ -466,7 +477,13 @@ class Economy(commands.Cog):
                  f"Sender new cash: {sender_profile['cash']:,} {CURRENCY_EMOJI}"
                  ),
             )
-            await send_log(self.bot, ctx.guild, "cash", log_embed)
+            await send_log(self.bot,
+                           ctx.guild,
+                           "cash",
+                           log_embed,
+                           action="give",
+                           users=[ctx.author.id, member.id],
+                           amount=amount_int)
 
     @commands.command(name="gift")
     async def gift_command(self, ctx: commands.Context, member: discord.Member,
@@ -522,7 +539,13 @@ class Economy(commands.Cog):
                 (f"{ctx.author} 🎁 {member}: **{amount_int:,} {CURRENCY_EMOJI}**"
                  ),
             )
-            await send_log(self.bot, ctx.guild, "cash", log_embed)
+            await send_log(self.bot,
+                           ctx.guild,
+                           "cash",
+                           log_embed,
+                           action="gift",
+                           users=[ctx.author.id, member.id],
+                           amount=amount_int)
 
     @commands.command(name="topcash")
     async def topcash_command(self, ctx: commands.Context):
@@ -651,7 +674,14 @@ class Economy(commands.Cog):
                 description=
                 f"{ctx.author} bought {item_name} for {info['price']:,} {CURRENCY_EMOJI}.",
             )
-            await send_log(self.bot, ctx.guild, "cash", log_embed)
+            await send_log(self.bot,
+                           ctx.guild,
+                           "cash",
+                           log_embed,
+                           action="buy",
+                           users=[ctx.author.id],
+                           item=item_id,
+                           amount=info["price"])
 
     @commands.command(name="inventory", aliases=["inv"])
     async def inventory_command(self,
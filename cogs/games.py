@@ -127,7 +127,14 @@ class Games(commands.Cog):
                 description=
                 f"{ctx.author} bet **{bet:,}** on **{choice}** → result **{result}**.",
             )
-            await send_log(self.bot, ctx.guild, "games", log_embed)
+            await send_log(self.bot,
+                           ctx.guild,
+                           "games",
+                           log_embed,
+                           game="cf",
+                           users=[ctx.author.id],
+                           bet=bet,
+                           payout=bet * 2 if win else 0)
 
     @commands.command(name="slots", aliases=["s"])
     async def slots_command(self, ctx: commands.Context, *args):
@@ -162,6 +169,7 @@ class Games(commands.Cog):
             symbols), random.choice(symbols)
 
         profile["cash"] -= bet
+        win_amount = 0
         win_text = f"💸 `{a} {b} {c}` – No match, you lost **{bet:,} {CURRENCY_EMOJI}**."
         if a == b == c:
             win_amount = bet * 3
@@ -184,7 +192,14 @@ class Games(commands.Cog):
                 title="Slots Game",
                 description=f"{ctx.author} bet **{bet:,} {CURRENCY_EMOJI}**.",
             )
-            await send_log(self.bot, ctx.guild, "games", log_embed)
+            await send_log(self.bot,
+                           ctx.guild,
+                           "games",
+                           log_embed,
+                           game="slots",
+                           users=[ctx.author.id],
+                           bet=bet,
+                           payout=win_amount)
 
 
 async def setup(bot):
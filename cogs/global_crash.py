@@ -4,13 +4,23 @@ import os
 import json
 import random
 import asyncio
+import datetime
+import hashlib
+import heapq
 import time
+from collections import deque
+from itertools import islice
 
 import discord
 from discord.ext import commands
 
 from utils import db
-from utils.common import make_embed, send_log
+from utils.common import make_embed, paginate_embeds, send_log
+from utils.crash_history import HISTOGRAM_EDGES, STREAK_LINE, CrashHistory
+from utils.crash_ledger import CrashLedger
+from utils.crash_math import STOP_GRACE, ClickClock, RoundSchedule, build_curve
+from utils.eventlog import log_error, log_event
+from utils.fair import FairChain
 
 CURRENCY_EMOJI = "💰"
 MAX_BET = 250_000
@@ -20,6 +30,39 @@ GLOBAL_CRASH_FILE = os.path.join(DATA_DIR, "global_crash.json")
 
 # Minimum multiplier jahan se cashout allowed hoga
 MIN_CASHOUT_MULT = 1.20
+MAX_AUTO_CASHOUT = 100.0
+
+# Multiplier growth per second (slow start, faster at high multipliers)
+GLOBAL_CRASH_CURVE = build_curve([
+    (1.0, 0.067),
+    (1.5, 0.092),
+    (3.0, 0.142),
+    (10.0, 0.35),
+])
+
+BET_WINDOW = 5.0  # seconds the betting window stays open
+CRASH_PAUSE = 3.0  # crashed frame stays up this long before the next window
+TICK_INTERVAL = 0.5  # one scheduler tick drives every table
+RENDER_STEP = 0.08  # re-render when the multiplier moved this much
+CONFIG_SAVE_GAP = 5.0  # seconds between global_crash.json writes
+
+# channel chatter: deleted in bulk, this many seconds after it was sent
+CLEANUP_DELAY = 7.0
+CLEANUP_INTERVAL = 3.0
+BULK_DELETE_MAX = 100  # Discord limit per bulk delete call
+
+# per-table edit budget (adaptive on 429)
+MIN_EDIT_GAP = 1.0
+MAX_EDIT_GAP = 10.0
+
+# big rounds: aggregates + top bets + recent cashouts instead of every row
+FULL_LIST_MAX = 15
+TOP_BETS = 5
+RECENT_CASHOUTS = 5
+RESULT_LINES_MAX = 200  # per-player result lines; the rest is summarised
+
+WAITING_STATUS = "Waiting for someone to place a bet to start the next round."
+WINDOW_STATUS = "🕒 Betting window open (~5s). Place your bets to join this round."
 
 
 def _load_config():
@@ -44,9 +87,187 @@ def _save_config(cfg: dict):
         pass
 
 
+class CrashPlayer:
+    """One player's bet in a running round."""
+
+    __slots__ = ("bet", "status", "cashout_mult", "win_amount", "auto",
+                 "auto_hit")
+
+    def __init__(self, bet: int, auto: float | None = None):
+        self.bet = bet
+        self.status = "playing"  # "playing" / "cashed" / "lost"
+        self.cashout_mult: float | None = None
+        self.win_amount = 0
+        self.auto = auto  # auto cashout target (preset at round start)
+        self.auto_hit = False
+
+
+class BetBoard:
+    """
+    Running totals of one round's bets + its biggest bets (bounded, kept
+    exact because a user's total only ever grows within a round).
+    """
+
+    __slots__ = ("count", "total", "top")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0
+        self.top: dict[int, int] = {}  # at most TOP_BETS entries
+
+    def add(self, user_id: int, amount: int, new_total: int):
+        if new_total == amount:
+            self.count += 1
+        self.total += amount
+
+        top = self.top
+        if user_id in top or len(top) < TOP_BETS:
+            top[user_id] = new_total
+            return
+        low = min(top, key=top.get)
+        if new_total > top[low]:
+            del top[low]
+            top[user_id] = new_total
+
+    def biggest(self) -> list[tuple[int, int]]:
+        return heapq.nlargest(len(self.top), self.top.items(),
+                              key=lambda kv: kv[1])
+
+
+class CrashScreen:
+    """
+    One channel showing a table: its main message + edit budget. A table
+    has its own channel as first screen; mirrors just add more screens.
+    """
+
+    __slots__ = ("channel_id", "guild_id", "message_id", "shown", "editing",
+                 "next_edit_at", "edit_gap")
+
+    def __init__(self, channel_id: int, data: dict | None = None):
+        data = data or {}
+        self.channel_id = channel_id
+        self.guild_id: int | None = data.get("guild_id")
+        self.message_id: int | None = data.get("message_id")
+        self.shown = -1  # last frame number this channel received
+        self.editing = False
+        self.next_edit_at = 0.0
+        self.edit_gap = MIN_EDIT_GAP
+
+    def to_config(self) -> dict:
+        return {"guild_id": self.guild_id, "message_id": self.message_id}
+
+
+class CrashTable:
+    """
+    One crash table = one authoritative round + the screens it is shown on.
+    Plain slotted state, no tasks of its own: the cog's scheduler ticks every
+    table, renders each frame once and fans it out to the screens.
+    """
+
+    __slots__ = (
+        "channel_id",  # home channel (key of the table)
+        "screens",  # channel_id -> CrashScreen (home first, then mirrors)
+        "last_crashes",
+        # phases: "idle" -> "cooldown" -> "running" -> "crashed" -> ...
+        "phase",
+        "phase_ends_at",
+        "round_id",
+        "intake",  # bet clicks waiting for the next frame
+        "bets",  # cooldown bets: user_id -> amount
+        "board",  # totals / top bets of the current round
+        "next_round_id",
+        "next_bets",  # queued while running / crashed
+        "next_board",
+        "players",  # user_id -> CrashPlayer
+        "playing",  # players still in the air
+        "cashed",
+        "paid",
+        "recent",  # last cashouts: (user_id, mult, win, auto)
+        "auto_heap",  # (target, user_id)
+        "schedule",  # RoundSchedule: crash point + trajectory from the seed
+        "fair",  # (chain number, index, seed) from the hash chain
+        "crash_point",
+        "started_at",
+        "crash_at",
+        "multiplier",
+        "all_cashed",
+        # rendering
+        "status",
+        "dirty",
+        "frame",
+        "frame_hash",
+        "frame_embed",
+        "rows",  # user_id -> (row key, rendered line)
+        "rendered_mult",
+    )
+
+    def __init__(self, channel_id: int, data: dict | None = None):
+        data = data or {}
+        self.channel_id = channel_id
+        screens = data.get("screens")
+        if screens is None:
+            # single-screen config (before mirrors)
+            screens = {str(channel_id): data}
+        self.screens: dict[int, CrashScreen] = {
+            int(cid): CrashScreen(int(cid), sdata)
+            for cid, sdata in screens.items()
+        }
+        self.screens.setdefault(channel_id, CrashScreen(channel_id))
+        self.last_crashes: list[float] = data.get("last_crashes", [])
+
+        self.phase = "idle"
+        self.phase_ends_at = 0.0
+        self.round_id: int | None = None
+        self.intake: deque[tuple[discord.Interaction, int]] = deque()
+        self.bets: dict[int, int] = {}
+        self.board = BetBoard()
+        self.next_round_id: int | None = None
+        self.next_bets: dict[int, int] = {}
+        self.next_board = BetBoard()
+        self.players: dict[int, CrashPlayer] = {}
+        self.playing = 0
+        self.cashed = 0
+        self.paid = 0
+        self.recent: deque[tuple[int, float, int, bool]] = deque(
+            maxlen=RECENT_CASHOUTS)
+        self.auto_heap: list[tuple[float, int]] = []
+        self.schedule: RoundSchedule | None = None
+        self.fair: tuple[int, int, bytes] | None = None
+        self.crash_point = 1.0
+        self.started_at = 0.0
+        self.crash_at = 0.0
+        self.multiplier = 1.0
+        self.all_cashed = False
+
+        self.status = WAITING_STATUS
+        self.dirty = True
+        self.frame = 0
+        self.frame_hash: int | None = None
+        self.frame_embed: discord.Embed | None = None
+        self.rows: dict[int, tuple[tuple, str]] = {}
+        self.rendered_mult = 1.0
+
+    @property
+    def home(self) -> CrashScreen:
+        return self.screens[self.channel_id]
+
+    def to_config(self) -> dict:
+        return {
+            "screens": {
+                str(cid): screen.to_config()
+                for cid, screen in self.screens.items()
+            },
+            "last_crashes": self.last_crashes,
+        }
+
+    def multiplier_at(self, ts: float) -> float:
+        return self.schedule.multiplier_at(ts - self.started_at)
+
+
 class GlobalCrashBetView(discord.ui.View):
     """
-    Persistent view with bet buttons + STOP.
+    Persistent view with bet buttons + STOP (shared by every table; the
+    table is looked up from the channel of the click).
     """
 
     def __init__(self, cog, *, timeout=None):
@@ -103,66 +324,99 @@ class GlobalCrashBetView(discord.ui.View):
 
 class GlobalCrash(commands.Cog):
     """
-    Global crash game (event-driven).
+    Global crash game: any number of tables (one per configured channel),
+    all driven by a single scheduler task.
     """
 
     def __init__(self, bot):
         self.bot = bot
         self.config = _load_config()
-        self.channel_id: int | None = self.config.get("channel_id")
-        self.message_id: int | None = self.config.get("message_id")
-        self.main_message: discord.Message | None = None
-
-        # phases: "idle", "cooldown", "running"
-        self.phase: str = "idle"
-
-        # cooldown phase bets: user_id -> bet amount
-        self.bets: dict[int, int] = {}
-        self.bets_lock = asyncio.Lock()
-
-        # running round data
-        self.current_round: dict[int, dict] = {}
-        self.round_lock = asyncio.Lock()
-
-        # crash round info
-        self.current_multiplier: float = 1.0
-        self.crash_point: float = 1.0
-
-        # last 3 crash points
-        self.last_crashes: list[float] = self.config.get("last_crashes", [])
-
-        # pause flag
+        self._migrate_config()
+
+        # channel_id -> table
+        self.tables: dict[int, CrashTable] = {
+            int(cid): CrashTable(int(cid), data)
+            for cid, data in self.config["tables"].items()
+        }
+        # any screen channel (home or mirror) -> its table
+        self._by_channel: dict[int, CrashTable] = {
+            cid: table
+            for table in self.tables.values() for cid in table.screens
+        }
+        # tables the scheduler has to look at (non-idle or unrendered)
+        self._active: set[int] = set()
+        self._scheduler_task: asyncio.Task | None = None
+
+        # channel_id -> message ids waiting for the cleanup worker (in order)
+        self._chatter: dict[int, deque[int]] = {}
+        self._cleanup_task: asyncio.Task | None = None
+
+        # money side of every round: holds + write-ahead log, one save per round
+        self.ledger = CrashLedger()
+        self._last_round_id = 0
+        # provably fair seeds (precomputed hash chain)
+        self.fair = FairChain()
+        # rounds run on time.time(); clicks come stamped by Discord's clock
+        self.click_clock = ClickClock()
+        # every finished round, binary ring file (crashhistory command)
+        self.history = CrashHistory()
+
+        # pause flag (all tables)
         self.paused: bool = self.config.get("paused", False)
 
-        # betting window task
-        self._window_task: asyncio.Task | None = None
+        # per-user auto cashout preset: str(user_id) -> target multiplier
+        self.auto_targets: dict[str, float] = self.config.setdefault(
+            "auto_cashout", {})
 
-        # adaptive rate-limit throttle
-        self._min_edit_gap: float = 1.0
-        self._last_edit_ts: float = 0.0
-        self._pending_embed: discord.Embed | None = None
-        self._flush_task: asyncio.Task | None = None
+        self._config_dirty = False
+        self._config_saved_at = 0.0
 
         # persistent view
         self.bet_view = GlobalCrashBetView(self, timeout=None)
 
+    def _migrate_config(self):
+        """Old single-channel config -> {"tables": {channel_id: {...}}}."""
+        tables = self.config.setdefault("tables", {})
+        channel_id = self.config.pop("channel_id", None)
+        message_id = self.config.pop("message_id", None)
+        last_crashes = self.config.pop("last_crashes", [])
+        if channel_id and str(channel_id) not in tables:
+            tables[str(channel_id)] = {
+                "guild_id": None,
+                "message_id": message_id,
+                "last_crashes": last_crashes,
+            }
+            _save_config(self.config)
+
     async def cog_load(self):
+        await self.fair.prepare()
+
+        # Round left open by a crash / restart -> pay cashouts, refund bets
+        for summary in self.ledger.recover():
+            log_event("global_crash_recovery", **summary)
+
         self.bot.add_view(self.bet_view)
 
-        if self.channel_id:
-            channel = self.bot.get_channel(self.channel_id)
-            if isinstance(channel, discord.TextChannel):
-                await self.ensure_main_message(channel)
-                await self.update_main_embed(
-                    status=
-                    "Waiting for someone to place a bet to start the next round.",
-                    show_multiplier=False,
-                    force=True,
-                )
+        # every table re-renders its waiting frame once the bot is ready
+        for table in self.tables.values():
+            self._activate(table)
+
+    async def cog_unload(self):
+        for task in (self._scheduler_task, self._cleanup_task):
+            if task is not None:
+                task.cancel()
+        # rounds in the air / queued -> cashouts paid, bets refunded
+        for round_id in list(self.ledger.rounds):
+            summary = self.ledger.void(round_id)
+            log_event("global_crash_void", round=round_id, **summary)
+        self.ledger.close()
+        self.history.close()
+        self.fair.close()
+        self._save_tables()
 
     # ------------------ Owner commands ------------------
 
-    @commands.command(name="ayocrashchannelset")
+    @commands.command(name="ayocrashchannelset", aliases=["ayocrashtableadd"])
     @commands.is_owner()
     async def set_crash_channel(
         self,
@@ -172,22 +426,124 @@ class GlobalCrash(commands.Cog):
         if channel is None:
             channel = ctx.channel
 
-        self.channel_id = channel.id
-        self.message_id = None
-        self.main_message = None
-        self.config["channel_id"] = channel.id
-        self.config["message_id"] = None
-        _save_config(self.config)
+        table = self._by_channel.get(channel.id)
+        if table is not None and table.channel_id != channel.id:
+            await ctx.send(
+                f"❌ {channel.mention} is mirroring the table of "
+                f"<#{table.channel_id}>. Remove the mirror first.")
+            return
 
-        await self.ensure_main_message(channel)
-        await self.update_main_embed(
-            status=
-            "Waiting for someone to place a bet to start the next round.",
-            show_multiplier=False,
-            force=True,
-        )
+        if table is None:
+            table = CrashTable(channel.id)
+            self.tables[channel.id] = table
+            self._by_channel[channel.id] = table
+        screen = table.home
+        screen.guild_id = channel.guild.id
+        # fresh main message (old one, if any, is left alone)
+        screen.message_id = None
+        self._save_tables()
+        self._activate(table)
+
+        await ctx.send(
+            f"✅ Global crash table set up in {channel.mention}. "
+            f"(`{len(self.tables)}` table(s) running)")
+
+    @commands.command(name="ayocrashmirror")
+    @commands.is_owner()
+    async def mirror_crash_table(
+        self,
+        ctx: commands.Context,
+        source: discord.TextChannel,
+        channel: discord.TextChannel | None = None,
+    ):
+        """
+        ayocrashmirror #source [#channel] -> #channel shows the same round as
+        #source (bets + cashouts go into one shared round).
+        """
+        if channel is None:
+            channel = ctx.channel
+
+        table = self._by_channel.get(source.id)
+        if table is None:
+            await ctx.send(f"❌ There is no global crash table in {source.mention}.")
+            return
+        if channel.id in self._by_channel:
+            await ctx.send(
+                f"❌ {channel.mention} already shows a global crash table.")
+            return
+
+        table.screens[channel.id] = CrashScreen(channel.id,
+                                                {"guild_id": channel.guild.id})
+        self._by_channel[channel.id] = table
+        self._save_tables()
+        self._activate(table)
+
+        await ctx.send(
+            f"✅ {channel.mention} now mirrors the round of <#{table.channel_id}> "
+            f"(`{len(table.screens)}` screen(s)).")
+
+    @commands.command(name="ayocrashtableremove",
+                      aliases=["ayocrashchannelremove"])
+    @commands.is_owner()
+    async def remove_crash_table(
+        self,
+        ctx: commands.Context,
+        channel: discord.TextChannel | None = None,
+    ):
+        channel_id = channel.id if channel else ctx.channel.id
+        table = self._by_channel.get(channel_id)
+        if table is None:
+            await ctx.send("❌ There is no global crash table in that channel.")
+            return
+
+        if channel_id != table.channel_id:
+            # just a mirror: the round goes on in the other screens
+            del table.screens[channel_id]
+            del self._by_channel[channel_id]
+            self._save_tables()
+            await ctx.send(f"🗑️ Mirror in <#{channel_id}> removed.")
+            return
 
-        await ctx.send(f"✅ Global crash channel set to {channel.mention}.")
+        del self.tables[channel_id]
+        for cid in table.screens:
+            self._by_channel.pop(cid, None)
+        self._active.discard(channel_id)
+        if table.intake:
+            asyncio.get_running_loop().create_task(
+                self._ack_bets([(interaction, "❌ This global crash table was removed.")
+                                for interaction, _ in table.intake]))
+        for round_id in (table.round_id, table.next_round_id):
+            if round_id is not None and self.ledger.is_open(round_id):
+                summary = self.ledger.void(round_id)
+                log_event("global_crash_void", round=round_id, **summary)
+        self._save_tables()
+
+        await ctx.send(
+            f"🗑️ Global crash table in <#{channel_id}> removed "
+            f"(with `{len(table.screens) - 1}` mirror(s)). Open bets were refunded.")
+
+    @commands.command(name="ayocrashtables")
+    @commands.is_owner()
+    async def list_crash_tables(self, ctx: commands.Context):
+        if not self.tables:
+            await ctx.send("No global crash tables configured.")
+            return
+
+        lines = []
+        for table in list(self.tables.values())[:25]:
+            lines.append(
+                f"• <#{table.channel_id}> – `{table.phase}` • "
+                f"players: `{table.board.count}` • "
+                f"screens: `{len(table.screens)}` • "
+                f"slowest edit gap: "
+                f"`{max(sc.edit_gap for sc in table.screens.values()):.1f}s`")
+        if len(self.tables) > 25:
+            lines.append(f"... and `{len(self.tables) - 25}` more")
+
+        await ctx.send(embed=make_embed(
+            title=f"🚀 Global Crash Tables ({len(self.tables)})",
+            description="\n".join(lines),
+        ))
 
     @commands.command(name="ayocrashpause")
     @commands.is_owner()
@@ -195,11 +551,10 @@ class GlobalCrash(commands.Cog):
         self.paused = True
         self.config["paused"] = True
         _save_config(self.config)
-        await self.update_main_embed(
-            status="⏸️ Global Crash is currently **paused** by the owner.",
-            show_multiplier=False,
-            force=True,
-        )
+        for table in self.tables.values():
+            if table.phase == "idle":
+                table.status = "⏸️ Global Crash is currently **paused** by the owner."
+                self._activate(table)
         await ctx.send("⏸️ Global Crash has been **paused** by the owner.")
 
     @commands.command(name="ayocrashresume")
@@ -208,209 +563,396 @@ class GlobalCrash(commands.Cog):
         self.paused = False
         self.config["paused"] = False
         _save_config(self.config)
-        await self.update_main_embed(
-            status=
-            "Waiting for someone to place a bet to start the next round.",
-            show_multiplier=False,
-            force=True,
-        )
+        for table in self.tables.values():
+            if table.phase == "idle":
+                table.status = WAITING_STATUS
+                self._activate(table)
         await ctx.send("▶️ Global Crash has been **resumed**.")
 
-    # ------------------ Auto-delete extra messages ------------------
+    # ------------------ Auto cashout ------------------
 
-    @commands.Cog.listener()
-    async def on_message(self, message: discord.Message):
-        if not self.channel_id:
-            return
-        if message.channel.id != self.channel_id:
-            return
-        if self.message_id and message.id == self.message_id:
-            return
-        await asyncio.sleep(7)
-        try:
-            if self.message_id and message.id == self.message_id:
-                return
-            await message.delete()
-        except Exception:
-            pass
-
-    # ------------------ Helpers ------------------
+    @commands.command(name="crashauto", aliases=["autocashout"])
+    async def crash_auto(self, ctx: commands.Context, target: str = None):
+        """
+        ayo crashauto 2.5  -> global crash bets auto cashout at x2.50
+        ayo crashauto off
+        """
+        key = str(ctx.author.id)
+        current = self.auto_targets.get(key)
 
-    async def ensure_main_message(self, channel: discord.TextChannel):
-        if self.main_message is None and self.message_id:
-            try:
-                self.main_message = await channel.fetch_message(self.message_id
-                                                                )
-            except Exception:
-                self.main_message = None
-
-        if self.main_message is None:
-            embed = make_embed(
-                title="🚀 AYO Global Crash",
+        if target is None:
+            now_text = f"`x{current:.2f}`" if current else "`off`"
+            await ctx.send(embed=make_embed(
+                title="🎯 Global Crash Auto Cashout",
                 description=
-                ("Waiting for someone to place a bet to start the next round.\n\n"
-                 "Use the buttons below to place your bet.\n"
-                 "This channel is reserved for the global crash game."),
-            )
-            try:
-                msg = await channel.send(embed=embed, view=self.bet_view)
-            except Exception:
-                return
-            self.main_message = msg
-            self.message_id = msg.id
-            self.config["message_id"] = msg.id
-            _save_config(self.config)
-
-    async def _edit_main_message(self, embed: discord.Embed, *, force: bool):
-        if not self.main_message:
+                (f"Current target: {now_text}\n\n"
+                 f"Use `ayo crashauto 2.5` to cash out automatically at **x2.50**,\n"
+                 f"or `ayo crashauto off` to disable it.\n"
+                 f"Allowed range: `x{MIN_CASHOUT_MULT:.2f}` - `x{MAX_AUTO_CASHOUT:.0f}`."
+                 ),
+            ))
             return
 
-        now = time.monotonic()
+        if target.lower() in ("off", "none", "0"):
+            self.auto_targets.pop(key, None)
+            _save_config(self.config)
+            await ctx.send("✅ Auto cashout **disabled**.")
+            return
 
-        if force:
-            self._pending_embed = None
-            try:
-                await self.main_message.edit(embed=embed, view=self.bet_view)
-            except discord.HTTPException as e:
-                if e.status == 429:
-                    self._min_edit_gap = min(self._min_edit_gap * 2.0, 10.0)
-            except Exception:
-                pass
-            else:
-                self._last_edit_ts = now
-                self._min_edit_gap = max(self._min_edit_gap * 0.9, 1.0)
+        try:
+            value = round(float(target.lower().lstrip("x")), 2)
+        except ValueError:
+            await ctx.send("❌ Target must be a multiplier like `2.5` or `off`.")
             return
 
-        gap = now - self._last_edit_ts
-        if gap >= self._min_edit_gap and self._flush_task is None:
-            try:
-                await self.main_message.edit(embed=embed, view=self.bet_view)
-            except discord.HTTPException as e:
-                if e.status == 429:
-                    self._min_edit_gap = min(self._min_edit_gap * 2.0, 10.0)
-            except Exception:
-                pass
-            else:
-                self._last_edit_ts = now
-                self._min_edit_gap = max(self._min_edit_gap * 0.9, 1.0)
+        if not (MIN_CASHOUT_MULT <= value <= MAX_AUTO_CASHOUT):
+            await ctx.send(
+                f"❌ Target must be between `x{MIN_CASHOUT_MULT:.2f}` and "
+                f"`x{MAX_AUTO_CASHOUT:.0f}`.")
             return
 
-        self._pending_embed = embed
-        if self._flush_task is None:
-            self._flush_task = self.bot.loop.create_task(self._flush_pending())
+        self.auto_targets[key] = value
+        _save_config(self.config)
+        await ctx.send(
+            f"✅ Auto cashout set to **x{value:.2f}**. Your global crash bets "
+            f"will cash out automatically once the plane reaches it.")
+
+    # ------------------ Replay ------------------
 
-    async def _flush_pending(self):
+    @commands.command(name="crashreplay")
+    async def crash_replay(self, ctx: commands.Context, seed: str,
+                           at: float = None):
+        """
+        ayo crashreplay <seed> [seconds] -> rebuild a global crash round from
+        the seed shown in its results (disputes / checks).
+        """
         try:
-            await asyncio.sleep(self._min_edit_gap)
-            if not self.main_message:
-                return
-            if not self._pending_embed:
-                return
-            embed = self._pending_embed
-            self._pending_embed = None
-            now = time.monotonic()
-            try:
-                await self.main_message.edit(embed=embed, view=self.bet_view)
-            except discord.HTTPException as e:
-                if e.status == 429:
-                    self._min_edit_gap = min(self._min_edit_gap * 2.0, 10.0)
-            except Exception:
-                pass
-            else:
-                self._last_edit_ts = now
-                self._min_edit_gap = max(self._min_edit_gap * 0.9, 1.0)
-        finally:
-            self._flush_task = None
+            schedule = self._schedule(int(seed, 16))
+        except ValueError:
+            await ctx.send("❌ Seed must be the hex value from the round results.")
+            return
 
-    async def update_main_embed(
-        self,
-        status: str,
-        show_multiplier: bool = False,
-        multiplier: float | None = None,
-        crashed: bool = False,
-        *,
-        force: bool = False,
-    ):
-        if not self.main_message:
+        lines = [
+            f"🔑 Seed: `{seed}`",
+            f"💥 Crash point: **x{schedule.crash_point:.2f}** "
+            f"after `{schedule.duration:.2f}s`",
+        ]
+        if at is not None:
+            state = "crashed" if schedule.crashed(at) else "flying"
+            lines.append(
+                f"⏱️ At `{at:.2f}s`: **x{schedule.multiplier_at(at):.2f}** ({state})")
+
+        lines.append("\n📈 **Reached:**")
+        for target in (MIN_CASHOUT_MULT, 1.5, 2.0, 3.0, 5.0, 10.0, 50.0):
+            t = schedule.time_to(target)
+            if t == float("inf"):
+                break
+            lines.append(f"• `x{target:.2f}` at `{t:.2f}s`")
+
+        await ctx.send(embed=make_embed(
+            title="🔁 Global Crash Replay",
+            description="\n".join(lines),
+        ))
+
+    # ------------------ Provably fair ------------------
+
+    @commands.command(name="crashfair")
+    async def crash_fair(self, ctx: commands.Context):
+        """Published hash of the current seed chain + how to verify."""
+        chain = self.fair
+        await ctx.send(embed=make_embed(
+            title="🔐 Global Crash • Provably Fair",
+            description=
+            (f"Every round's seed comes from a precomputed hash chain "
+             f"(`seed[i] = sha256(seed[i+1])`), used front to back.\n\n"
+             f"⛓️ Chain: `#{chain.number}` • rounds played: "
+             f"`{chain.next_index:,}` / `{chain.length:,}`\n"
+             f"🏁 Terminating hash (`sha256(seed[0])`):\n`{chain.terminating_hash.hex()}`\n\n"
+             f"After each round its seed is revealed in the results. Check it with "
+             f"one hash: `sha256(seed)` must equal the previous round's seed "
+             f"(or the terminating hash for round 0), then `ayo crashreplay <seed>` "
+             f"gives the crash point."),
+        ))
+
+    @commands.command(name="crashverify")
+    async def crash_verify(self, ctx: commands.Context, fair_round: str,
+                           seed: str):
+        """ayo crashverify <chain-index> <seed> (both from the round results)."""
+        try:
+            chain_no, index = (int(x) for x in fair_round.lstrip("#").split("-"))
+            seed_bytes = bytes.fromhex(seed)
+        except ValueError:
+            await ctx.send(
+                "❌ Usage: `ayo crashverify <chain-index> <seed>` "
+                "(e.g. `ayo crashverify 1-42 9f3a...`).")
             return
 
-        if self.last_crashes:
-            last_str = " | ".join(f"x{v:.2f}" for v in self.last_crashes[-3:])
-        else:
-            last_str = "no data"
+        if chain_no != self.fair.number:
+            await ctx.send(
+                f"❌ Round `#{fair_round}` is not from the current chain "
+                f"(`#{self.fair.number}`).")
+            return
 
-        lines: list[str] = []
+        ok = self.fair.verify(index, seed_bytes)
+        if ok is None:
+            await ctx.send(f"❌ Round `#{fair_round}` hasn't been played yet.")
+            return
 
-        current_mult_for_display = (multiplier if show_multiplier
-                                    and multiplier is not None else
-                                    self.current_multiplier)
-
-        if self.phase == "cooldown":
-            async with self.bets_lock:
-                items = list(self.bets.items())
-            if items:
-                for user_id, amount in items[:15]:
-                    user = self.bot.get_user(user_id)
-                    name = user.mention if user else f"`{user_id}`"
-                    lines.append(f"• {name} – `{amount:,}` {CURRENCY_EMOJI}")
-            else:
-                lines.append("No bets yet.")
-        elif self.phase == "running":
-            async with self.round_lock:
-                items = list(self.current_round.items())
-            if items:
-                for user_id, info in items[:15]:
-                    user_obj = self.bot.get_user(user_id)
-                    name = user_obj.mention if user_obj else f"`{user_id}`"
-                    bet = info["bet"]
-                    status_flag = info["status"]
-
-                    if status_flag == "cashed":
-                        cm = info["cashout_mult"] or 1.0
-                        win = info["win_amount"]
-                        profit = win - bet
-                        lines.append(
-                            f"• {name} – CASHED at `x{cm:.2f}` → "
-                            f"`{win:,}` ({'+' if profit >= 0 else ''}{profit:,}) {CURRENCY_EMOJI}"
-                        )
-                    elif status_flag == "lost":
-                        lines.append(
-                            f"• {name} – LOST, bet `{bet:,}` {CURRENCY_EMOJI}")
-                    else:
-                        potential = int(bet *
-                                        max(1.0, current_mult_for_display))
-                        lines.append(
-                            f"• {name} – BET `{bet:,}` {CURRENCY_EMOJI} "
-                            f"(potential now: `{potential:,}` {CURRENCY_EMOJI})"
-                        )
-            else:
-                lines.append("No players this round.")
-        else:
-            lines.append("No bets yet. Place a bet to start the next round.")
+        previous = ("terminating hash" if index == 0 else
+                    f"seed of round `#{chain_no}-{index - 1}`")
+        schedule = self._schedule(int.from_bytes(seed_bytes, "big"))
+        await ctx.send(embed=make_embed(
+            title=f"🔐 Verify • Round #{fair_round}",
+            description=
+            (f"`sha256(seed)` = `{hashlib.sha256(seed_bytes).hexdigest()}`\n"
+             f"{'✅ matches' if ok else '❌ does NOT match'} the {previous}.\n\n"
+             f"💥 Crash point from this seed: **x{schedule.crash_point:.2f}**"),
+        ))
+
+    # ------------------ History ------------------
+
+    @commands.command(name="crashhistory", aliases=["crashstats"])
+    async def crash_history(self, ctx: commands.Context, rounds: int = 100):
+        """
+        ayo crashhistory [rounds] -> crash point histogram, streaks and
+        realized house edge of the last N global crash rounds.
+        """
+        rounds = max(1, min(rounds, self.history.capacity))
+        stats = await asyncio.to_thread(self.history.summarize, rounds)
+        if not stats["rounds"]:
+            await ctx.send("📭 No global crash rounds recorded yet.")
+            return
 
-        bets_text = "\n".join(lines)
+        total = stats["rounds"]
+        top = max(stats["histogram"]) or 1
+        bars = []
+        for i, count in enumerate(stats["histogram"]):
+            low = HISTOGRAM_EDGES[i]
+            label = (f"x{low:.1f}–{HISTOGRAM_EDGES[i + 1]:.1f}"
+                     if i + 1 < len(HISTOGRAM_EDGES) else f"x{low:.0f}+")
+            bar = "█" * round(12 * count / top)
+            bars.append(
+                f"`{label:>9}` {bar} {count:,} ({100 * count / total:.1f}%)")
+
+        edge = stats["house_edge"]
+        edge_text = f"`{edge * 100:.2f}%`" if edge is not None else "`n/a`"
+        current = "≥" if stats["current_high"] else "<"
+
+        await ctx.send(embed=make_embed(
+            title=f"📈 Global Crash History (last {total:,} rounds)",
+            description=
+            ("**Crash points:**\n" + "\n".join(bars) + "\n\n"
+             f"📍 Median crash: `x{stats['median']:.2f}`\n"
+             f"🔻 Longest run below x{STREAK_LINE:.0f}: `{stats['longest_low']}` rounds\n"
+             f"🔺 Longest run x{STREAK_LINE:.0f}+: `{stats['longest_high']}` rounds\n"
+             f"🔁 Current run: `{stats['current_run']}` round(s) {current} x{STREAK_LINE:.0f}\n\n"
+             f"👥 Player bets: `{stats['players']:,}`\n"
+             f"💰 Wagered: `{stats['wagered']:,}` {CURRENCY_EMOJI} • "
+             f"Paid: `{stats['payout']:,}` {CURRENCY_EMOJI}\n"
+             f"🏦 Realized house edge: {edge_text}"),
+        ))
+
+    def _run_auto_cashouts(self, table: CrashTable, reached: float, *,
+                           strict: bool = False) -> int:
+        """
+        Settle every auto target crossed up to `reached` in one pass, lowest
+        target first. Cashout is valued at the exact target. With strict=True
+        (round crashed at `reached`) only targets below it count.
+        """
+        heap = table.auto_heap
+        settled = 0
+        while heap and (heap[0][0] < reached if strict else
+                        heap[0][0] <= reached):
+            target, user_id = heapq.heappop(heap)
+            player = table.players.get(user_id)
+            if player is None or player.status != "playing":
+                continue  # manual STOP came first
+
+            self._cash_out(table, user_id, player, target, auto=True)
+            settled += 1
+        return settled
+
+    def _cash_out(self, table: CrashTable, user_id: int, player: CrashPlayer,
+                  mult: float, *, auto: bool = False):
+        player.status = "cashed"
+        player.cashout_mult = mult
+        player.win_amount = int(player.bet * mult)
+        player.auto_hit = auto
+        table.playing -= 1
+        table.cashed += 1
+        table.paid += player.win_amount
+        table.recent.append((user_id, mult, player.win_amount, auto))
+        # paid with the round commit
+        self.ledger.record_cashout(table.round_id, user_id, mult,
+                                   player.win_amount)
 
-        desc_parts = [
-            f"📊 **Last crashes:** {last_str}\n",
-            status,
-            "\n\n💸 **Players / Bets (this round):**\n",
-            bets_text,
-        ]
+    # ------------------ Auto-delete extra messages ------------------
 
-        if show_multiplier and multiplier is not None:
-            state = "💥 CRASHED" if crashed else "📈 Climbing"
-            desc_parts.insert(1, f"{state} – **x{multiplier:.2f}**\n")
+    @commands.Cog.listener()
+    async def on_message(self, message: discord.Message):
+        # fast path: one dict lookup for every message outside crash channels
+        table = self._by_channel.get(message.channel.id)
+        if table is None:
+            return
+        if message.id == table.screens[message.channel.id].message_id:
+            return
 
-        embed = make_embed(
-            title="🚀 AYO Global Crash",
-            description="".join(desc_parts),
-        )
+        pending = self._chatter.get(message.channel.id)
+        if pending is None:
+            pending = self._chatter[message.channel.id] = deque()
+        pending.append(message.id)
+
+        if self._cleanup_task is None or self._cleanup_task.done():
+            self._cleanup_task = asyncio.get_running_loop().create_task(
+                self._cleanup_worker())
+
+    async def _cleanup_worker(self):
+        """Every few seconds, bulk delete the chatter that is old enough."""
+        while self._chatter:
+            await asyncio.sleep(CLEANUP_INTERVAL)
+            # snowflake ids grow with time: compare ids instead of timestamps
+            cutoff = discord.utils.time_snowflake(
+                discord.utils.utcnow() -
+                datetime.timedelta(seconds=CLEANUP_DELAY))
+
+            for channel_id, pending in list(self._chatter.items()):
+                table = self._by_channel.get(channel_id)
+                if table is None:
+                    del self._chatter[channel_id]  # table removed
+                    continue
+
+                keep = table.screens[channel_id].message_id
+                due: list[int] = []
+                while pending and pending[0] <= cutoff:
+                    message_id = pending.popleft()
+                    if message_id != keep:
+                        due.append(message_id)
+                if not pending:
+                    del self._chatter[channel_id]
+                if not due:
+                    continue
+
+                channel = self.bot.get_channel(channel_id)
+                if not isinstance(channel, discord.TextChannel):
+                    continue
+                for i in range(0, len(due), BULK_DELETE_MAX):
+                    try:
+                        await channel.delete_messages([
+                            discord.Object(id=message_id)
+                            for message_id in due[i:i + BULK_DELETE_MAX]
+                        ])
+                    except Exception:
+                        pass
+
+    # ------------------ Scheduler ------------------
+
+    def _activate(self, table: CrashTable):
+        table.dirty = True
+        self._active.add(table.channel_id)
+        if self._scheduler_task is None or self._scheduler_task.done():
+            self._scheduler_task = asyncio.get_running_loop().create_task(
+                self._scheduler())
+
+    async def _scheduler(self):
+        """One task ticks + renders every active table."""
+        await self.bot.wait_until_ready()
+        loop = asyncio.get_running_loop()
+
+        while self._active:
+            await asyncio.sleep(TICK_INTERVAL)
+            now = time.time()
+            mono = loop.time()
+
+            for channel_id in list(self._active):
+                table = self.tables.get(channel_id)
+                if table is None:
+                    self._active.discard(channel_id)
+                    continue
+
+                replies = []
+                try:
+                    if table.intake:
+                        replies = self._drain_bets(table)
+                    self._tick(table, now)
+                except Exception as e:
+                    log_error("global_crash_tick", e, channel=channel_id)
+                finally:
+                    # popped clicks always get their answer, tick failed or not
+                    if replies:
+                        loop.create_task(self._ack_bets(replies))
+
+                if table.dirty:
+                    # rendered once per frame, whatever the number of screens;
+                    # same content as the last frame -> nothing to send
+                    table.dirty = False
+                    description = self._render(table)
+                    digest = hash(description)
+                    if digest != table.frame_hash:
+                        table.frame += 1
+                        table.frame_hash = digest
+                        table.frame_embed = make_embed(
+                            title="🚀 AYO Global Crash",
+                            description=description,
+                        )
+
+                # fan-out: each screen takes the latest frame when its own
+                # budget allows, frames in between are dropped for it
+                settled = True
+                for screen in table.screens.values():
+                    if screen.shown == table.frame and not screen.editing:
+                        continue
+                    settled = False
+                    if not screen.editing and mono >= screen.next_edit_at:
+                        screen.editing = True
+                        loop.create_task(
+                            self._push_frame(screen, table.frame,
+                                             table.frame_embed))
+
+                if table.phase == "idle" and settled:
+                    self._active.discard(channel_id)
+
+            if self._config_dirty and now - self._config_saved_at >= CONFIG_SAVE_GAP:
+                self._save_tables()
+
+    def _tick(self, table: CrashTable, now: float):
+        if table.phase == "cooldown":
+            if now >= table.phase_ends_at:
+                self._start_round(table, now)
+
+        elif table.phase == "running":
+            if table.playing <= 0:
+                table.all_cashed = True
+                self._end_round(table, now)
+                return
+            if now >= table.crash_at:
+                # crash shown at once, settled after the grace window: STOP
+                # clicks stamped before crash_at may still be on their way
+                if now >= table.crash_at + STOP_GRACE:
+                    self._end_round(table, now)
+                elif table.multiplier != table.crash_point:
+                    table.multiplier = table.crash_point
+                    table.status = "💥 The plane has crashed!"
+                    table.dirty = True
+                return
+
+            # display + auto cashouts only: STOP clicks are valued at their
+            # own interaction timestamps against the fixed round curve
+            table.multiplier = table.multiplier_at(now)
+            auto_settled = self._run_auto_cashouts(table, table.multiplier)
+            if auto_settled or abs(table.multiplier -
+                                   table.rendered_mult) >= RENDER_STEP:
+                table.status = ""
+                table.rendered_mult = table.multiplier
+                table.dirty = True
 
-        await self._edit_main_message(embed, force=force)
+        elif table.phase == "crashed":
+            if now >= table.phase_ends_at:
+                table.phase = "idle"
+                self._promote_next_round(table, now)
 
-    # ------------------ Crash Logic ------------------
+    # ------------------ Round flow ------------------
 
-    def generate_crash_point(self) -> float:
+    def generate_crash_point(self, rng: random.Random = random) -> float:
         """
         More realistic / harsher distribution:
         - 1.01–1.20 : 20%
@@ -418,212 +960,382 @@ class GlobalCrash(commands.Cog):
         - 2.00–10.0 : 20%
         - 10.0–100  : 5%
         """
-        r = random.random()
+        r = rng.random()
         if r < 0.20:
-            return round(random.uniform(1.01, 1.20), 2)
+            return round(rng.uniform(1.01, 1.20), 2)
         elif r < 0.75:
-            return round(random.uniform(1.20, 2.0), 2)
+            return round(rng.uniform(1.20, 2.0), 2)
         elif r < 0.95:
-            return round(random.uniform(2.0, 10.0), 2)
+            return round(rng.uniform(2.0, 10.0), 2)
         else:
-            return round(random.uniform(10.0, 100.0), 2)
-
-    async def start_betting_window(self, channel: discord.TextChannel):
-        self.phase = "cooldown"
-        await self.update_main_embed(
-            status=
-            "🕒 Betting window open (~5s). Place your bets to join this round.",
-            show_multiplier=False,
-            force=True,
-        )
-
-        await asyncio.sleep(5)
-
-        async with self.bets_lock:
-            round_bets = dict(self.bets)
-            self.bets = {}
-
-        if not round_bets:
-            self.phase = "idle"
-            await self.update_main_embed(
-                status=
-                "❌ No bets placed. Waiting for someone to place a bet to start the next round.",
-                show_multiplier=False,
-                force=True,
+            return round(rng.uniform(10.0, 100.0), 2)
+
+    def _schedule(self, seed: int) -> RoundSchedule:
+        return RoundSchedule(seed, GLOBAL_CRASH_CURVE, self.generate_crash_point)
+
+    def _new_round_id(self) -> int:
+        # ids stay unique + increasing across all tables
+        round_id = max(int(time.time() * 1000), self._last_round_id + 1)
+        self._last_round_id = round_id
+        self.ledger.open_round(round_id)
+        return round_id
+
+    def _open_window(self, table: CrashTable, now: float):
+        table.phase = "cooldown"
+        table.phase_ends_at = now + BET_WINDOW
+        table.status = WINDOW_STATUS
+        self._activate(table)
+
+    def _start_round(self, table: CrashTable, now: float):
+        if not table.bets:
+            if table.round_id is not None:
+                self.ledger.void(table.round_id)
+            table.round_id = None
+            table.phase = "idle"
+            table.status = (
+                "❌ No bets placed. Waiting for someone to place a bet to start the next round."
             )
-            self._window_task = None
+            table.dirty = True
             return
 
-        async with self.round_lock:
-            self.current_round = {}
-            for uid, bet in round_bets.items():
-                self.current_round[uid] = {
-                    "bet": bet,
-                    "status": "playing",
-                    "cashout_mult": None,
-                    "win_amount": 0,
-                }
+        table.players = {
+            uid: CrashPlayer(bet, self.auto_targets.get(str(uid)))
+            for uid, bet in table.bets.items()
+        }
+        table.bets = {}
+        table.rows = {}
+        table.playing = len(table.players)
+        table.cashed = 0
+        table.paid = 0
+        table.recent.clear()
+        table.auto_heap = [(p.auto, uid) for uid, p in table.players.items()
+                           if p.auto]
+        heapq.heapify(table.auto_heap)
+
+        # whole round fixed up front from the next hash chain seed
+        table.fair = self.fair.next_seed()
+        table.schedule = self._schedule(int.from_bytes(table.fair[2], "big"))
+        table.crash_point = table.schedule.crash_point
+        # host clock; STOP clicks are moved onto it by self.click_clock
+        table.started_at = now
+        table.crash_at = now + table.schedule.duration
+        table.multiplier = 1.0
+        table.rendered_mult = 1.0
+        table.all_cashed = False
+        table.phase = "running"
+        table.status = "🚀 Round started! Plane taking off..."
+        table.dirty = True
+
+    def _end_round(self, table: CrashTable, now: float):
+        # targets crossed between the last tick and the crash
+        self._run_auto_cashouts(table, table.crash_point, strict=True)
+
+        total_bet = table.board.total
+        total_payout = table.paid
+        lines: list[str] = []
+        for user_id, player in table.players.items():
+            if player.status != "cashed":
+                player.status = "lost"
+            if len(lines) >= RESULT_LINES_MAX:
+                continue
+            bet = player.bet
+
+            if player.status == "cashed":
+                win = player.win_amount
+                profit = win - bet
+                if player.cashout_mult > table.crash_point:
+                    # can't happen with a fixed schedule: flag it for review
+                    log_event("global_crash_audit",
+                              round=table.round_id,
+                              user=user_id,
+                              cashout=player.cashout_mult,
+                              crash_point=table.crash_point)
+                how = "AUTO-CASHED" if player.auto_hit else "CASHED"
+                lines.append(
+                    f"✅ <@{user_id}> {how} at `x{player.cashout_mult:.2f}` → "
+                    f"Win: `{win:,}` ({'+' if profit >= 0 else ''}{profit:,}) {CURRENCY_EMOJI}"
+                )
+            else:
+                lines.append(
+                    f"❌ <@{user_id}> CRASHED – Bet: `{bet:,}` ({-bet:,} {CURRENCY_EMOJI})"
+                )
+        if len(table.players) > RESULT_LINES_MAX:
+            lines.append(
+                f"… and `{len(table.players) - RESULT_LINES_MAX:,}` more player(s) "
+                f"(`{table.cashed:,}` cashed out in total)")
+        table.playing = 0
+
+        # Commit the whole round: holds released, cashouts paid, one save
+        round_id = table.round_id
+        self.ledger.settle(round_id)
+        table.round_id = None
 
-        self.phase = "running"
         try:
-            await self.run_crash_round(channel)
-        finally:
-            self.phase = "idle"
-            self._window_task = None
+            self.history.append(table.crash_point, len(table.players),
+                                total_bet, total_payout, table.channel_id)
+        except OSError as e:
+            log_error("global_crash_history", e, round=round_id)
+
+        table.last_crashes.append(round(float(table.crash_point), 2))
+        table.last_crashes = table.last_crashes[-3:]
+        self._config_dirty = True
+
+        if table.all_cashed:
+            table.status = (
+                f"✅ All players cashed out!\n"
+                f"💥 Plane would have crashed at **x{table.crash_point:.2f}**.")
+        else:
+            table.status = "💥 The plane has crashed!"
+        table.multiplier = table.crash_point
+        table.phase = "crashed"
+        table.phase_ends_at = now + CRASH_PAUSE
+        table.dirty = True
+
+        self.bot.loop.create_task(
+            self._post_results(table, round_id, list(table.players), lines,
+                               total_bet, total_payout))
+
+    def _promote_next_round(self, table: CrashTable, now: float):
+        """Queued bets become the next round; its window opens right away."""
+        table.players = {}
+        table.rows = {}
+        if table.next_round_id is None:
+            table.board = BetBoard()
+            table.status = WAITING_STATUS
+            table.dirty = True
+            return
+        table.round_id, table.bets = table.next_round_id, table.next_bets
+        table.board = table.next_board
+        table.next_round_id, table.next_bets = None, {}
+        table.next_board = BetBoard()
+        self._open_window(table, now)
+
+    async def _post_results(self, table: CrashTable, round_id: int,
+                            user_ids: list[int], lines: list[str],
+                            total_bet: int, total_payout: int):
+        crash_point = table.crash_point
+        chain, index, seed_bytes = table.fair
+        seed = seed_bytes.hex()
+        # big rounds -> several embeds / messages (4096 / 6000 char limits)
+        pages = paginate_embeds(
+            "🏁 Global Crash Results",
+            f"📉 Final Multiplier (crash): **x{crash_point:.2f}**\n"
+            f"💰 Total Bet: `{total_bet:,}` {CURRENCY_EMOJI}\n"
+            f"💵 Total Paid Out (cashouts): `{total_payout:,}` {CURRENCY_EMOJI}\n"
+            f"🔑 Round `#{chain}-{index}` seed: `{seed}`\n"
+            f"Verify: `ayo crashverify {chain}-{index} {seed}`\n",
+            lines or ["No players this round."],
+        )
 
-    async def run_crash_round(self, channel: discord.TextChannel):
-        self.current_multiplier = 1.0
-        self.crash_point = self.generate_crash_point()
+        async def send_pages(channel_id: int):
+            channel = self.bot.get_partial_messageable(channel_id)
+            for embeds in pages:
+                await channel.send(embeds=embeds)
+
+        # same results to every screen of the round
+        await asyncio.gather(
+            *(send_pages(cid) for cid in list(table.screens)),
+            return_exceptions=True,
+        )
 
         try:
-            await self.update_main_embed(
-                status="🚀 Round started! Plane taking off...",
-                show_multiplier=True,
-                multiplier=self.current_multiplier,
-                force=True,
-            )
-            await asyncio.sleep(0.5)
-
-            ended_because_all_cashed = False
-            last_update_mult = self.current_multiplier
-
-            while self.current_multiplier < self.crash_point:
-                await asyncio.sleep(0.6)
-
-                async with self.round_lock:
-                    active_left = any(info["status"] == "playing"
-                                      for info in self.current_round.values())
-                if not active_left:
-                    ended_because_all_cashed = True
-                    break
-
-                cur = self.current_multiplier
-                if cur < 1.5:
-                    step = random.uniform(0.02, 0.06)
-                elif cur < 3.0:
-                    step = random.uniform(0.03, 0.08)
-                elif cur < 10.0:
-                    step = random.uniform(0.05, 0.12)
-                else:
-                    step = random.uniform(0.12, 0.30)
-
-                self.current_multiplier += step
-
-                if abs(self.current_multiplier - last_update_mult) >= 0.08:
-                    await self.update_main_embed(
-                        status="",
-                        show_multiplier=True,
-                        multiplier=self.current_multiplier,
-                    )
-                    last_update_mult = self.current_multiplier
-
-            if ended_because_all_cashed:
-                final_mult = self.crash_point
-                status_line = (
-                    f"✅ All players cashed out!\n"
-                    f"💥 Plane would have crashed at **x{self.crash_point:.2f}**."
-                )
-            else:
-                final_mult = max(self.current_multiplier, self.crash_point)
-                status_line = "💥 The plane has crashed!"
-
-            await self.update_main_embed(
-                status=status_line,
-                show_multiplier=True,
-                multiplier=final_mult,
-                crashed=True,
-                force=True,
+            home = table.home
+            guild = self.bot.get_guild(home.guild_id) if home.guild_id else None
+            desc = (f"Channel: <#{table.channel_id}> ({table.channel_id})\n"
+                    f"Screens: {len(table.screens)}\n"
+                    f"Crash Point: x{crash_point:.2f}\n"
+                    f"Fair: #{chain}-{index} {seed}\n"
+                    f"Total Bet: {total_bet:,} {CURRENCY_EMOJI}\n"
+                    f"Total Payout: {total_payout:,} {CURRENCY_EMOJI}\n"
+                    f"Players: {len(user_ids)}\n"
+                    f"Ended because all cashed: {table.all_cashed}")
+            log_embed = make_embed(
+                title="Global Crash Round",
+                description=desc,
             )
+            await send_log(self.bot,
+                           guild,
+                           "games",
+                           log_embed,
+                           game="global_crash",
+                           round=round_id,
+                           channel=table.channel_id,
+                           users=user_ids,
+                           crash_point=crash_point,
+                           fair_round=f"{chain}-{index}",
+                           seed=seed,
+                           bet=total_bet,
+                           payout=total_payout)
+        except Exception:
+            pass
 
-            total_bet = 0
-            total_payout = 0
-            lines: list[str] = []
+    # ------------------ Rendering ------------------
 
-            async with self.round_lock:
-                for user_id, info in self.current_round.items():
-                    bet = info["bet"]
-                    total_bet += bet
+    def _save_tables(self):
+        self.config["tables"] = {
+            str(cid): table.to_config()
+            for cid, table in self.tables.items()
+        }
+        _save_config(self.config)
+        self._config_dirty = False
+        self._config_saved_at = time.time()
+
+    def _player_row(self, table: CrashTable, user_id: int, key: tuple,
+                    render) -> str:
+        """Cached row of one player: rebuilt only when its `key` changed."""
+        cached = table.rows.get(user_id)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        user = self.bot.get_user(user_id)
+        line = render(user.mention if user else f"`{user_id}`")
+        table.rows[user_id] = (key, line)
+        return line
+
+    def _round_row(self, table: CrashTable, user_id: int,
+                   player: CrashPlayer) -> str:
+        bet = player.bet
+        if player.status == "cashed":
+            key = ("cashed", player.cashout_mult, player.auto_hit)
+            cm = player.cashout_mult or 1.0
+            win = player.win_amount
+            profit = win - bet
+            how = "AUTO-CASHED" if player.auto_hit else "CASHED"
+            render = (
+                lambda name, how=how, cm=cm, win=win, profit=profit:
+                f"• {name} – {how} at `x{cm:.2f}` → "
+                f"`{win:,}` ({'+' if profit >= 0 else ''}{profit:,}) {CURRENCY_EMOJI}"
+            )
+        elif player.status == "lost" or table.phase == "crashed":
+            key = ("lost", )
+            render = (lambda name, bet=bet:
+                      f"• {name} – LOST, bet `{bet:,}` {CURRENCY_EMOJI}")
+        else:
+            potential = int(bet * max(1.0, table.multiplier))
+            key = ("playing", potential)
+            auto = f" • auto `x{player.auto:.2f}`" if player.auto else ""
+            render = (
+                lambda name, bet=bet, potential=potential, auto=auto:
+                f"• {name} – BET `{bet:,}` {CURRENCY_EMOJI} "
+                f"(potential now: `{potential:,}` {CURRENCY_EMOJI}){auto}")
+        return self._player_row(table, user_id, key, render)
+
+    def _render(self, table: CrashTable) -> str:
+        """
+        Description of the table's main embed for the current state. Only
+        counters + bounded lists are read, so a round with thousands of
+        players costs the same as one with five.
+        """
+        if table.last_crashes:
+            last_str = " | ".join(f"x{v:.2f}" for v in table.last_crashes[-3:])
+        else:
+            last_str = "no data"
 
-                    if info["status"] == "cashed":
-                        win = info["win_amount"]
-                        profit = win - bet
-                        total_payout += win
-                        lines.append(
-                            f"✅ <@{user_id}> CASHED at `x{info['cashout_mult']:.2f}` → "
-                            f"Win: `{win:,}` ({'+' if profit >= 0 else ''}{profit:,}) {CURRENCY_EMOJI}"
-                        )
-                    elif info["status"] == "lost":
-                        profit = -bet
-                        lines.append(
-                            f"❌ <@{user_id}> CRASHED – Bet: `{bet:,}` ({profit:,} {CURRENCY_EMOJI})"
-                        )
-                    else:
-                        info["status"] = "lost"
-                        profit = -bet
-                        lines.append(
-                            f"❌ <@{user_id}> CRASHED – Bet: `{bet:,}` ({profit:,} {CURRENCY_EMOJI})"
-                        )
+        board = table.board
+        lines: list[str] = []
 
-            if not lines:
-                result_text = "No players this round."
+        if table.phase == "cooldown":
+            if board.count:
+                lines.append(
+                    f"👥 `{board.count:,}` player(s) • "
+                    f"`{board.total:,}` {CURRENCY_EMOJI} wagered\n")
+            if board.count > FULL_LIST_MAX:
+                lines.append("🏆 **Biggest bets:**")
+                items = board.biggest()
             else:
-                result_text = "\n".join(lines)
+                items = islice(table.bets.items(), FULL_LIST_MAX)
+            for user_id, amount in items:
+                lines.append(
+                    self._player_row(
+                        table, user_id, ("bet", amount),
+                        lambda name, amount=amount:
+                        f"• {name} – `{amount:,}` {CURRENCY_EMOJI}"))
+            if not board.count:
+                lines.append("No bets yet.")
+        elif table.phase in ("running", "crashed"):
+            players = table.players
+            if players:
+                lines.append(
+                    f"👥 `{len(players):,}` player(s) • ✈️ `{table.playing:,}` flying • "
+                    f"✅ `{table.cashed:,}` cashed\n"
+                    f"💰 Wagered: `{board.total:,}` • Paid: `{table.paid:,}` {CURRENCY_EMOJI}\n"
+                )
+                if len(players) > FULL_LIST_MAX:
+                    lines.append("🏆 **Biggest bets:**")
+                    for user_id, _ in board.biggest():
+                        lines.append(
+                            self._round_row(table, user_id, players[user_id]))
+                    if table.recent:
+                        lines.append("\n⚡ **Recent cashouts:**")
+                        for user_id, mult, win, auto in reversed(table.recent):
+                            user = self.bot.get_user(user_id)
+                            name = user.mention if user else f"`{user_id}`"
+                            lines.append(
+                                f"• {name} – {'auto ' if auto else ''}`x{mult:.2f}` → "
+                                f"`{win:,}` {CURRENCY_EMOJI}")
+                else:
+                    for user_id, player in players.items():
+                        lines.append(self._round_row(table, user_id, player))
+            else:
+                lines.append("No players this round.")
 
-            try:
-                await channel.send(embed=make_embed(
-                    title="🏁 Global Crash Results",
-                    description=
-                    (f"📉 Final Multiplier (crash): **x{self.crash_point:.2f}**\n"
-                     f"💰 Total Bet: `{total_bet:,}` {CURRENCY_EMOJI}\n"
-                     f"💵 Total Paid Out (cashouts): `{total_payout:,}` {CURRENCY_EMOJI}\n\n"
-                     f"{result_text}"),
-                ))
-            except Exception:
-                pass
+            if table.next_bets:
+                lines.append(
+                    f"\n⏭️ **Next round:** {table.next_board.count:,} player(s) queued – "
+                    f"`{table.next_board.total:,}` {CURRENCY_EMOJI}")
+        else:
+            lines.append("No bets yet. Place a bet to start the next round.")
 
-            try:
-                crash_val = round(float(self.crash_point), 2)
-            except Exception:
-                crash_val = self.crash_point
+        desc_parts = [
+            f"📊 **Last crashes:** {last_str}\n",
+            table.status,
+            "\n\n💸 **Players / Bets (this round):**\n",
+            "\n".join(lines),
+        ]
 
-            self.last_crashes.append(crash_val)
-            self.last_crashes = self.last_crashes[-3:]
-            self.config["last_crashes"] = self.last_crashes
-            _save_config(self.config)
+        if table.phase in ("running", "crashed"):
+            state = "💥 CRASHED" if table.phase == "crashed" else "📈 Climbing"
+            desc_parts.insert(1, f"{state} – **x{table.multiplier:.2f}**\n")
 
-            db.save_users()
-
-            try:
-                guild = channel.guild
-                desc = (
-                    f"Channel: {channel.mention} ({channel.id})\n"
-                    f"Crash Point: x{self.crash_point:.2f}\n"
-                    f"Total Bet: {total_bet:,} {CURRENCY_EMOJI}\n"
-                    f"Total Payout: {total_payout:,} {CURRENCY_EMOJI}\n"
-                    f"Players: {len(self.current_round)}\n"
-                    f"Ended because all cashed: {ended_because_all_cashed}")
-                log_embed = make_embed(
-                    title="Global Crash Round",
-                    description=desc,
-                )
-                await send_log(self.bot, guild, "games", log_embed)
-            except Exception:
-                pass
+        return "".join(desc_parts)
 
+    async def _push_frame(self, screen: CrashScreen, frame: int,
+                          embed: discord.Embed):
+        """Edit one screen's message with a frame (one edit in flight)."""
+        loop = asyncio.get_running_loop()
+        try:
+            if screen.message_id is None:
+                if not await self._send_main_message(screen, embed):
+                    return  # channel not resolvable yet, retry next tick
+            else:
+                channel = self.bot.get_partial_messageable(screen.channel_id)
+                await channel.get_partial_message(screen.message_id).edit(
+                    embed=embed)
+        except discord.NotFound:
+            # main message deleted -> post a new one next frame
+            screen.message_id = None
+        except discord.HTTPException as e:
+            if e.status == 429:
+                screen.edit_gap = min(screen.edit_gap * 2.0, MAX_EDIT_GAP)
+        except Exception:
+            pass
+        else:
+            screen.shown = frame
+            screen.edit_gap = max(screen.edit_gap * 0.9, MIN_EDIT_GAP)
         finally:
-            async with self.round_lock:
-                self.current_round = {}
+            screen.editing = False
+            screen.next_edit_at = loop.time() + screen.edit_gap
 
-            self.phase = "idle"
-            try:
-                await self.update_main_embed(
-                    status=
-                    "Waiting for someone to place a bet to start the next round.",
-                    show_multiplier=False,
-                    force=True,
-                )
-            except Exception:
-                pass
+    async def _send_main_message(self, screen: CrashScreen,
+                                 embed: discord.Embed) -> bool:
+        """Post a fresh main message; False if the channel is not known."""
+        channel = self.bot.get_channel(screen.channel_id)
+        if not isinstance(channel, discord.TextChannel):
+            return False
+        msg = await channel.send(embed=embed, view=self.bet_view)
+        screen.message_id = msg.id
+        screen.guild_id = channel.guild.id
+        self._config_dirty = True
+        return True
 
     # ------------------ Button handlers ------------------
 
@@ -632,8 +1344,6 @@ class GlobalCrash(commands.Cog):
         interaction: discord.Interaction,
         amount: int,
     ):
-        user = interaction.user
-
         if not isinstance(interaction.channel, discord.TextChannel):
             await interaction.response.send_message(
                 "❌ This can only be used in a server channel.",
@@ -641,9 +1351,10 @@ class GlobalCrash(commands.Cog):
             )
             return
 
-        if not self.channel_id or interaction.channel.id != self.channel_id:
+        table = self._by_channel.get(interaction.channel.id)
+        if table is None:
             await interaction.response.send_message(
-                "❌ This is not the configured global crash channel.",
+                "❌ This is not a global crash channel.",
                 ephemeral=True,
             )
             return
@@ -662,63 +1373,83 @@ class GlobalCrash(commands.Cog):
             )
             return
 
-        if self.phase == "running":
-            await interaction.response.send_message(
-                "⏳ A round is already running. Wait for it to finish.",
-                ephemeral=True,
-            )
-            return
-
-        profile = db.get_profile(user.id)
-        balance = profile["cash"]
+        # no state touched here: the scheduler drains the buffer once per
+        # frame, so a burst of clicks costs one pass + one render
+        self.click_clock.observe(interaction.created_at.timestamp())
+        table.intake.append((interaction, amount))
+        self._activate(table)
 
-        async with self.bets_lock:
-            current = self.bets.get(user.id, 0)
-            new_total = current + amount
-
-            if new_total > MAX_BET:
-                await interaction.response.send_message(
-                    f"❌ Max bet per round is `{MAX_BET:,}` {CURRENCY_EMOJI}.\n"
-                    f"Your total this round would be `{new_total:,}`.",
-                    ephemeral=True,
-                )
-                return
-
-            if balance < amount:
-                await interaction.response.send_message(
-                    "❌ You don't have enough cash for that bet.",
-                    ephemeral=True,
-                )
-                return
-
-            profile["cash"] -= amount
-            self.bets[user.id] = new_total
-
-        db.save_users()
-
-        # ✅ SUCCESS PATH:
-        # bas interaction ko ACK karo, koi text-msg nahi
-        try:
-            await interaction.response.defer(ephemeral=True, thinking=False)
-        except Exception:
-            pass
-
-        channel = interaction.channel
-        if not isinstance(channel, discord.TextChannel):
-            return
-
-        await self.ensure_main_message(channel)
-
-        if self.phase == "idle":
-            if self._window_task is None or self._window_task.done():
-                self._window_task = self.bot.loop.create_task(
-                    self.start_betting_window(channel))
+    def _drain_bets(self, table: CrashTable) -> list[tuple]:
+        """
+        Apply every buffered bet click in arrival order. Returns the
+        (interaction, reply) pairs to ACK; reply None = silent defer.
+        Every popped click gets a reply, even if applying it blew up.
+        """
+        replies = []
+        intake = table.intake
+        while intake:
+            interaction, amount = intake.popleft()
+            try:
+                reply = self._apply_bet(table, interaction, amount)
+            except Exception as e:
+                log_error("global_crash_bet", e, channel=table.channel_id,
+                          user=interaction.user.id)
+                reply = "❌ Couldn't place that bet, please try again."
+            replies.append((interaction, reply))
+        return replies
+
+    def _apply_bet(self, table: CrashTable, interaction: discord.Interaction,
+                   amount: int) -> str | None:
+        """One bet click -> reply text, None = accepted (silent ACK)."""
+        user_id = interaction.user.id
+        balance = db.get_profile(user_id)["cash"]
+
+        # round flying -> bet is queued for the next round
+        queued = table.phase in ("running", "crashed")
+        target = table.next_bets if queued else table.bets
+
+        current = target.get(user_id, 0)
+        new_total = current + amount
+
+        if new_total > MAX_BET:
+            return (f"❌ Max bet per round is `{MAX_BET:,}` {CURRENCY_EMOJI}.\n"
+                    f"Your total {'next' if queued else 'this'} round would be `{new_total:,}`.")
+
+        if balance < amount:
+            return "❌ You don't have enough cash for that bet."
+
+        # Reserved in memory + write-ahead log; saved once at settlement.
+        if queued:
+            if table.next_round_id is None:
+                table.next_round_id = self._new_round_id()
+            round_id = table.next_round_id
+        else:
+            if table.round_id is None:
+                table.round_id = self._new_round_id()
+            round_id = table.round_id
+        self.ledger.reserve(round_id, user_id, amount)
+        target[user_id] = new_total
+        (table.next_board if queued else table.board).add(
+            user_id, amount, new_total)
+
+        if table.phase == "idle":
+            self._open_window(table, time.time())
+        table.dirty = True
+
+        if queued:
+            return f"⏭️ Bet `{new_total:,}` {CURRENCY_EMOJI} queued for the **next round**."
+        # ✅ SUCCESS PATH: bas ACK, koi text-msg nahi
+        return None
+
+    async def _ack_bets(self, replies: list[tuple]):
+        async def ack(interaction: discord.Interaction, reply: str | None):
+            if reply is None:
+                await interaction.response.defer(ephemeral=True, thinking=False)
+            else:
+                await interaction.response.send_message(reply, ephemeral=True)
 
-        await self.update_main_embed(
-            status=
-            "🕒 Betting window open (~5s). Place your bets to join this round.",
-            show_multiplier=False,
-        )
+        await asyncio.gather(*(ack(i, reply) for i, reply in replies),
+                             return_exceptions=True)
 
     async def handle_stop_button(self, interaction: discord.Interaction):
         user = interaction.user
@@ -730,88 +1461,85 @@ class GlobalCrash(commands.Cog):
             )
             return
 
-        if not self.channel_id or interaction.channel.id != self.channel_id:
+        table = self._by_channel.get(interaction.channel.id)
+        if table is None:
             await interaction.response.send_message(
-                "❌ This is not the configured global crash channel.",
+                "❌ This is not a global crash channel.",
                 ephemeral=True,
             )
             return
 
-        if self.phase != "running":
+        if table.phase != "running":
             await interaction.response.send_message(
                 "⏳ There is no active flying round right now.",
                 ephemeral=True,
             )
             return
 
-        if self.current_multiplier < MIN_CASHOUT_MULT:
+        # value the cashout at the moment of the click, not at the last tick;
+        # Discord stamps the click, the round runs on our clock -> convert
+        clicked_at = self.click_clock.host_time(
+            interaction.created_at.timestamp())
+        cashout_mult = table.multiplier_at(clicked_at)
+
+        if cashout_mult < MIN_CASHOUT_MULT:
             await interaction.response.send_message(
                 f"⚠️ Too early to cashout. Minimum cashout is **x{MIN_CASHOUT_MULT:.2f}**.",
                 ephemeral=True,
             )
             return
 
-        async with self.round_lock:
-            info = self.current_round.get(user.id)
+        player = table.players.get(user.id)
 
-            if not info:
-                await interaction.response.send_message(
-                    "❌ You don't have an active bet in this round.",
-                    ephemeral=True,
-                )
-                return
-
-            if info["status"] == "cashed":
-                cm = info.get("cashout_mult", self.current_multiplier)
-                await interaction.response.send_message(
-                    f"⚠️ You already cashed out at `x{cm:.2f}`.",
-                    ephemeral=True,
-                )
-                return
-
-            if info["status"] == "lost":
-                await interaction.response.send_message(
-                    "❌ This round is already finished for you.",
-                    ephemeral=True,
-                )
-                return
-
-            if self.current_multiplier >= self.crash_point:
-                info["status"] = "lost"
-                await interaction.response.send_message(
-                    "💥 Too late! The plane already crashed.",
-                    ephemeral=True,
-                )
-                return
+        if not player:
+            await interaction.response.send_message(
+                "❌ You don't have an active bet in this round.",
+                ephemeral=True,
+            )
+            return
 
-            bet = info["bet"]
-            cashout_mult = self.current_multiplier
-            win_amount = int(bet * cashout_mult)
+        if player.status == "cashed":
+            await interaction.response.send_message(
+                f"⚠️ You already cashed out at `x{player.cashout_mult:.2f}`.",
+                ephemeral=True,
+            )
+            return
 
-            info["status"] = "cashed"
-            info["cashout_mult"] = cashout_mult
-            info["win_amount"] = win_amount
+        if player.status == "lost":
+            await interaction.response.send_message(
+                "❌ This round is already finished for you.",
+                ephemeral=True,
+            )
+            return
 
-        profile = db.get_profile(user.id)
-        profile["cash"] += win_amount
-        db.save_users()
+        if clicked_at >= table.crash_at:
+            await interaction.response.send_message(
+                "💥 Too late! The plane already crashed.",
+                ephemeral=True,
+            )
+            return
 
+        # auto target already crossed, next tick just hasn't settled it:
+        # it pays at exactly the target, not at the later click
+        auto = bool(player.auto) and player.auto <= cashout_mult
+        if auto:
+            cashout_mult = player.auto
+        self._cash_out(table, user.id, player, cashout_mult, auto=auto)
+        table.status = "🚀 Round running... players are cashing out!"
+        table.dirty = True
+
+        bet = player.bet
+        win_amount = player.win_amount
         profit = win_amount - bet
 
         await interaction.response.send_message(
-            f"✅ You CASHED OUT at `x{cashout_mult:.2f}`!\n"
+            f"✅ You {'AUTO-CASHED' if auto else 'CASHED OUT'} at `x{cashout_mult:.2f}`!\n"
             f"💰 Bet: `{bet:,}` {CURRENCY_EMOJI}\n"
-            f"🏦 Win: `{win_amount:,}` {CURRENCY_EMOJI}\n"
+            f"🏦 Win: `{win_amount:,}` {CURRENCY_EMOJI} *(credited when the round ends)*\n"
             f"📊 Profit: `{'+' if profit >= 0 else ''}{profit:,}` {CURRENCY_EMOJI}",
             ephemeral=True,
         )
 
-        await self.update_main_embed(
-            status="🚀 Round running... players are cashing out!",
-            show_multiplier=True,
-            multiplier=self.current_multiplier,
-        )
-
 
 async def setup(bot):
     cog = GlobalCrash(bot)
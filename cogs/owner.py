@@ -1,15 +1,79 @@
 import os
+import json
 import time
 import asyncio
+from collections import deque
+
 import discord
 from discord.ext import commands
 
 from utils import db
 from utils.common import make_embed, send_log
+from utils.eventlog import get_event_log, log_event
+from utils.logpipe import get_pipeline
 
 OWNER_ID = int(os.getenv("OWNER_ID") or 0)
 CURRENCY_EMOJI = "💰"
 
+# Global announcement broadcast job (resumable after restart)
+BROADCAST_FILE = os.path.join(db.DATA_DIR, "broadcast_job.json")
+# one line per finished guild since the last checkpoint ("<id> sent|failed")
+BROADCAST_DONE_FILE = os.path.join(db.DATA_DIR, "broadcast_done.log")
+BROADCAST_CONCURRENCY = 10  # sends in flight at once
+BROADCAST_RATE = 40.0  # sends per second (Discord global limit is 50/s)
+BROADCAST_PROGRESS_EVERY = 3.0  # seconds between progress edits + checkpoints
+
+
+def _load_broadcast_job():
+    if not os.path.exists(BROADCAST_FILE):
+        return None
+    try:
+        with open(BROADCAST_FILE, "r") as f:
+            job = json.load(f)
+    except Exception:
+        return None
+
+    # guilds finished after the last checkpoint: not sent twice on resume
+    # (only ids still pending count, so replaying the log is harmless)
+    done = {}
+    try:
+        with open(BROADCAST_DONE_FILE, "r") as f:
+            for line in f:
+                guild_id, _, status = line.strip().partition(" ")
+                if guild_id.isdigit() and status in ("sent", "failed"):
+                    done[int(guild_id)] = status
+    except OSError:
+        pass
+    if done:
+        pending = []
+        for guild_id in job.get("pending", []):
+            status = done.get(guild_id)
+            if status is None:
+                pending.append(guild_id)
+            else:
+                job[status] = job.get(status, 0) + 1
+        job["pending"] = pending
+    return job
+
+
+def _save_broadcast_job(job):
+    db.ensure_data_dir()
+    try:
+        with open(BROADCAST_FILE, "w") as f:
+            json.dump(job, f)
+        # job file is exact now -> the done log starts over
+        open(BROADCAST_DONE_FILE, "w").close()
+    except Exception:
+        pass
+
+
+def _clear_broadcast_job():
+    for path in (BROADCAST_FILE, BROADCAST_DONE_FILE):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
 
 def is_owner():
 
@@ -27,6 +91,26 @@ class Owner(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
 
+        # running global announcement job
+        self._broadcast_task: asyncio.Task | None = None
+        self._broadcast_cancel = False
+        self._broadcast_checkpoint = None  # exact save of the running job
+        self._next_send_at = 0.0
+
+    async def cog_load(self):
+        # resume a broadcast that was interrupted by a restart
+        job = _load_broadcast_job()
+        if job and job.get("pending"):
+            self._broadcast_task = self.bot.loop.create_task(
+                self._run_broadcast(job, resumed=True))
+
+    async def cog_unload(self):
+        # exact job file stays on disk -> resumes on next load
+        if self._broadcast_task and not self._broadcast_task.done():
+            if self._broadcast_checkpoint is not None:
+                self._broadcast_checkpoint()
+            self._broadcast_task.cancel()
+
     # ================= OWNER HELP =================
 
     @commands.command(name="ownerhelp")
@@ -50,12 +134,17 @@ class Owner(commands.Cog):
             "`ayo panel` – Owner control panel / dashboard\n\n"
             "**Games**\n"
             "`ayo disablegames` – Turn off games\n"
-            "`ayo enablegames` – Turn games back on\n\n"
+            "`ayo enablegames` – Turn games back on\n"
+            "`ayo crashrtp <0.50-0.99>` – Crash RTP target\n"
+            "`ayo crashsim [games] [strategy]` – Simulate crash RTP (e.g. `fixed:2`)\n"
+            "`ayo bjsim [hands] [strategy] [natural pay]` – Simulate blackjack house edge\n\n"
             "**Logs**\n"
             "`ayo setlog <type> #channel` – Set log (cash/games/daily/admin/all)\n"
-            "`ayo logtest <type> <msg>` – Send test log\n\n"
+            "`ayo logtest <type> <msg>` – Send test log\n"
+            "`ayo logsearch <user_id/all> [hours]` – Search local event archive\n\n"
             "**Announcements**\n"
             "`ayo announce <message>` – Global embed to all servers\n"
+            "`ayo announcecancel` – Stop the running global announcement\n"
             "`ayo announcehere <message>` – Aesthetic embed in this channel")
         embed = make_embed(
             title="Owner Commands",
@@ -97,6 +186,11 @@ class Owner(commands.Cog):
                 log_lines.append(f"**{t}:** {ch.mention}")
             else:
                 log_lines.append(f"**{t}:** `Not set`")
+        pipeline = get_pipeline(self.bot)
+        log_lines.append(
+            f"Queued: `{pipeline.backlog()}` • Sent: `{pipeline.sent_embeds}` in "
+            f"`{pipeline.sent_messages}` msgs • Dropped: `{pipeline.dropped_total}`"
+        )
         logs_text = "\n".join(
             log_lines) if log_lines else "No logs configured."
 
@@ -190,56 +284,211 @@ class Owner(commands.Cog):
         """
         Send one nice embed to every server where the bot is.
         No @everyone spam, just clean announcement.
+        Runs as a background job (progress message, resumable, cancellable).
         """
         if not message.strip():
             await ctx.send("❌ Please provide a message.")
             return
 
-        sent = 0
-        failed = 0
-
-        for guild in self.bot.guilds:
-            # try system channel first
-            channel = guild.system_channel
-
-            # if no system channel or no perms, find first usable text channel
-            if channel is None or not channel.permissions_for(
-                    guild.me).send_messages:
-                channel = None
-                for ch in guild.text_channels:
-                    if ch.permissions_for(guild.me).send_messages:
-                        channel = ch
-                        break
-
-            if not channel:
-                failed += 1
-                continue
-
-            embed = make_embed(
-                title="📢 AYO Global Announcement",
-                description=message,
-            )
-            embed.set_footer(text=f"Sent by {ctx.author} • AYO GAMES")
+        if self._broadcast_task and not self._broadcast_task.done():
+            await ctx.send(
+                "❌ An announcement is already being sent. "
+                "Use `ayo announcecancel` to stop it first.")
+            return
+
+        job = {
+            "message": message,
+            "author": str(ctx.author),
+            "author_id": ctx.author.id,
+            "report_channel_id": ctx.channel.id,
+            "pending": [g.id for g in self.bot.guilds],
+            "sent": 0,
+            "failed": 0,
+            "started_at": time.time(),
+        }
+        _save_broadcast_job(job)
+        self._broadcast_task = self.bot.loop.create_task(
+            self._run_broadcast(job))
+
+    @commands.command(name="announcecancel", aliases=["broadcastcancel"])
+    @is_owner()
+    async def announce_cancel(self, ctx: commands.Context):
+        if not self._broadcast_task or self._broadcast_task.done():
+            await ctx.send("No global announcement is running.")
+            return
+        self._broadcast_cancel = True
+        _clear_broadcast_job()
+        await ctx.send("🛑 Cancelling global announcement...")
+
+    # ---------- broadcast job internals ----------
+
+    def _announce_channel(self, guild: discord.Guild, cache: dict):
+        """Cached announcement channel for a guild (rescan only on miss)."""
+        me = guild.me
+        cached = guild.get_channel(cache.get(str(guild.id), 0))
+        if cached is not None and cached.permissions_for(me).send_messages:
+            return cached
+
+        # try system channel first, then first usable text channel
+        channel = guild.system_channel
+        if channel is None or not channel.permissions_for(me).send_messages:
+            channel = None
+            for ch in guild.text_channels:
+                if ch.permissions_for(me).send_messages:
+                    channel = ch
+                    break
+
+        if channel is None:
+            cache.pop(str(guild.id), None)
+        else:
+            cache[str(guild.id)] = channel.id
+        return channel
+
+    async def _wait_send_slot(self):
+        # simple global pacing so all workers together stay under the limit
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        slot = max(now, self._next_send_at)
+        self._next_send_at = slot + 1.0 / BROADCAST_RATE
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+    def _broadcast_status(self, job, total: int, state: str) -> discord.Embed:
+        done = job["sent"] + job["failed"]
+        pct = (done / total * 100) if total else 100.0
+        return make_embed(
+            title="📡 Global Announcement",
+            description=(f"{state}\n\n"
+                         f"✅ Sent: `{job['sent']}`\n"
+                         f"❌ Failed: `{job['failed']}`\n"
+                         f"⏳ Remaining: `{total - done}`\n"
+                         f"📊 Progress: `{pct:.1f}%`"),
+        )
+
+    async def _run_broadcast(self, job, *, resumed: bool = False):
+        await self.bot.wait_until_ready()
+        self._broadcast_cancel = False
+
+        pending = deque(job["pending"])
+        in_flight: set[int] = set()
+        total = len(pending) + job["sent"] + job["failed"]
+        cache = db.get_announce_channels()
+
+        embed = make_embed(
+            title="📢 AYO Global Announcement",
+            description=job["message"],
+        )
+        embed.set_footer(text=f"Sent by {job['author']} • AYO GAMES")
+
+        report_channel = self.bot.get_channel(job["report_channel_id"])
+        progress_msg = None
+        state = "▶️ Resumed after restart..." if resumed else "🚀 Sending..."
+        if report_channel is not None:
+            try:
+                progress_msg = await report_channel.send(
+                    embed=self._broadcast_status(job, total, state))
+            except Exception:
+                progress_msg = None
+
+        def checkpoint():
+            # cancelled: job file is gone and must stay gone
+            if self._broadcast_cancel:
+                return
+            job["pending"] = list(in_flight) + list(pending)
+            _save_broadcast_job(job)
+            db.save_config()  # persists the channel cache
+
+        db.ensure_data_dir()
+        done_log = open(BROADCAST_DONE_FILE, "a", buffering=1)
+
+        def finish(guild_id: int, status: str):
+            job[status] += 1
+            # dropped from the saved pending list right away (done log)
+            done_log.write(f"{guild_id} {status}\n")
+
+        async def worker():
+            while pending and not self._broadcast_cancel:
+                guild_id = pending.popleft()
+                in_flight.add(guild_id)
+                try:
+                    guild = self.bot.get_guild(guild_id)
+                    channel = (self._announce_channel(guild, cache)
+                               if guild else None)
+                    if channel is None:
+                        finish(guild_id, "failed")
+                        continue
+                    await self._wait_send_slot()
+                    try:
+                        await channel.send(embed=embed)
+                        finish(guild_id, "sent")
+                    except (discord.Forbidden, discord.NotFound):
+                        cache.pop(str(guild_id), None)
+                        finish(guild_id, "failed")
+                    except Exception:
+                        finish(guild_id, "failed")
+                except asyncio.CancelledError:
+                    # not finished -> stays pending for the resume
+                    pending.appendleft(guild_id)
+                    raise
+                finally:
+                    in_flight.discard(guild_id)
+
+        async def reporter():
+            while True:
+                await asyncio.sleep(BROADCAST_PROGRESS_EVERY)
+                checkpoint()
+                if progress_msg is not None:
+                    try:
+                        await progress_msg.edit(embed=self._broadcast_status(
+                            job, total, "🚀 Sending..."))
+                    except Exception:
+                        pass
+
+        self._broadcast_checkpoint = checkpoint
+        reporter_task = self.bot.loop.create_task(reporter())
+        try:
+            await asyncio.gather(
+                *(worker() for _ in range(BROADCAST_CONCURRENCY)))
+        except asyncio.CancelledError:
+            # unload / shutdown: exact state for the resume
+            checkpoint()
+            raise
+        finally:
+            self._broadcast_checkpoint = None
+            reporter_task.cancel()
+            done_log.close()
+
+        cancelled = self._broadcast_cancel
+        self._broadcast_cancel = False
+        _clear_broadcast_job()
+        db.save_config()
+
+        state = "🛑 Cancelled." if cancelled else "✅ Finished."
+        if progress_msg is not None:
             try:
-                await channel.send(embed=embed)
-                sent += 1
-                await asyncio.sleep(0.3)  # small delay to avoid rate limits
+                await progress_msg.edit(
+                    embed=self._broadcast_status(job, total, state))
             except Exception:
-                failed += 1
-                continue
+                pass
 
         # log admin usage
-        if ctx.guild:
-            log_embed = make_embed(
-                title="Global Announcement Sent",
-                description=
-                f"By: {ctx.author} (`{ctx.author.id}`)\nSent to `{sent}` servers, failed `{failed}`.",
-            )
-            await send_log(self.bot, ctx.guild, "admin", log_embed)
-
-        await ctx.send(
-            f"✅ Announcement sent to **{sent}** server(s). Failed: `{failed}`."
+        guild = getattr(report_channel, "guild", None)
+        log_embed = make_embed(
+            title="Global Announcement Sent",
+            description=
+            (f"By: {job['author']} (`{job['author_id']}`)\n"
+             f"Sent to `{job['sent']}` servers, failed `{job['failed']}`."
+             + (" (cancelled)" if cancelled else "")),
         )
+        await send_log(self.bot,
+                       guild,
+                       "admin",
+                       log_embed,
+                       action="announce",
+                       users=[job["author_id"]],
+                       sent=job["sent"],
+                       failed=job["failed"],
+                       cancelled=cancelled)
 
     # ================= ECONOMY ADMIN =================
 
@@ -268,7 +517,13 @@ class Owner(commands.Cog):
                 description=
                 f"{ctx.author} → {member}: +**{amount:,} {CURRENCY_EMOJI}**",
             )
-            await send_log(self.bot, ctx.guild, "admin", log_embed)
+            await send_log(self.bot,
+                           ctx.guild,
+                           "admin",
+                           log_embed,
+                           action="addmoney",
+                           users=[ctx.author.id, member.id],
+                           amount=amount)
 
     @commands.command(name="removemoney")
     @is_owner()
@@ -296,7 +551,14 @@ class Owner(commands.Cog):
                 description=
                 f"{ctx.author} → {member}: -**{amount:,} {CURRENCY_EMOJI}** (from {old:,})",
             )
-            await send_log(self.bot, ctx.guild, "admin", log_embed)
+            await send_log(self.bot,
+                           ctx.guild,
+                           "admin",
+                           log_embed,
+                           action="removemoney",
+                           users=[ctx.author.id, member.id],
+                           amount=amount,
+                           old=old)
 
     @commands.command(name="setmoney")
     @is_owner()
@@ -324,7 +586,14 @@ class Owner(commands.Cog):
                 description=
                 f"{ctx.author} set {member} cash from {old:,} to {amount:,}.",
             )
-            await send_log(self.bot, ctx.guild, "admin", log_embed)
+            await send_log(self.bot,
+                           ctx.guild,
+                           "admin",
+                           log_embed,
+                           action="setmoney",
+                           users=[ctx.author.id, member.id],
+                           amount=amount,
+                           old=old)
 
     @commands.command(name="resetuser")
     @is_owner()
@@ -335,6 +604,9 @@ class Owner(commands.Cog):
         users.pop(uid, None)
         db.get_profile(member.id)
         db.save_users()
+        log_event("admin",
+                  action="resetuser",
+                  users=[ctx.author.id, member.id])
 
         embed = make_embed(
             title="Reset User",
@@ -359,6 +631,10 @@ class Owner(commands.Cog):
         low = new_prefix.lower()
         if low in {"off", "none", "disable"}:
             db.set_second_prefix(None)
+            log_event("admin",
+                      action="setprefix",
+                      users=[ctx.author.id],
+                      prefix=None)
             await ctx.send("✅ Second prefix disabled. Only `ayo` works now.")
             return
 
@@ -367,6 +643,10 @@ class Owner(commands.Cog):
             return
 
         db.set_second_prefix(new_prefix)
+        log_event("admin",
+                  action="setprefix",
+                  users=[ctx.author.id],
+                  prefix=new_prefix)
         await ctx.send(
             f"✅ Second prefix set to `{new_prefix}`.\n"
             f"Examples: `{new_prefix}profile`, `{new_prefix} profile`, `{new_prefix}cash`."
@@ -451,6 +731,11 @@ class Owner(commands.Cog):
                 db.set_log_channel(t, channel.id)
         else:
             db.set_log_channel(log_type, channel.id)
+        log_event("admin",
+                  action="setlog",
+                  users=[ctx.author.id],
+                  log_type=log_type,
+                  channel_id=channel.id)
 
         await ctx.send(
             f"✅ Log channel for `{log_type}` set to {channel.mention}.")
@@ -469,18 +754,66 @@ class Owner(commands.Cog):
         else:
             await ctx.send("Must be used in a server.")
 
+    @commands.command(name="logsearch", aliases=["logs"])
+    @is_owner()
+    async def logsearch_command(self,
+                                ctx: commands.Context,
+                                user: str = "all",
+                                hours: float = 24.0):
+        """
+        ayo logsearch 123456789 48  -> last 48h of events for that user
+        ayo logsearch all 1         -> everything from the last hour
+        """
+        user_id = None
+        if user.lower() not in {"all", "*"}:
+            if not user.strip("<@!>").isdigit():
+                await ctx.send("Usage: `ayo logsearch <user_id/all> [hours]`")
+                return
+            user_id = int(user.strip("<@!>"))
+
+        since = time.time() - hours * 3600
+        event_log = get_event_log()
+        await event_log.flush()
+        events = await asyncio.to_thread(event_log.search,
+                                         user_id=user_id,
+                                         since=since,
+                                         limit=15)
+
+        if not events:
+            await ctx.send("No events found for that search.")
+            return
+
+        lines = []
+        for ev in events:
+            what = ev.get("title") or ev.get("action") or ev.get("where") or ""
+            extra = ev.get("game") or ev.get("action") or ev.get("error") or ""
+            line = f"<t:{int(ev['ts'])}:f> `{ev['kind']}` {what}"
+            if extra and extra != what:
+                line += f" • {extra}"
+            lines.append(line[:250])
+
+        embed = make_embed(
+            title="🗂️ Event Archive",
+            description="\n".join(lines),
+        )
+        embed.set_footer(text=f"User: {user_id or 'all'} • Last {hours:g}h • "
+                         f"newest first • max 15")
+        await ctx.send(embed=embed)
+
     # ========== GAMES ON/OFF ==========
 
     @commands.command(name="disablegames")
     @is_owner()
     async def disablegames_command(self, ctx: commands.Context):
         db.set_games_enabled(False)
+        log_event("admin", action="disablegames", users=[ctx.author.id])
         await ctx.send("✅ Games have been **disabled** for now.")
 
     @commands.command(name="enablegames")
     @is_owner()
     async def enablegames_command(self, ctx: commands.Context):
         db.set_games_enabled(True)
+        log_event("admin", action="enablegames", users=[ctx.author.id])
         await ctx.send("✅ Games are **enabled** again.")
 
     # ========== CASHALL ==========
@@ -496,6 +829,11 @@ class Owner(commands.Cog):
         for pdata in users.values():
             pdata["cash"] = pdata.get("cash", 0) + amount
         db.save_users()
+        log_event("admin",
+                  action="cashall",
+                  users=[ctx.author.id],
+                  amount=amount,
+                  affected=len(users))
 
         sign = "+" if amount > 0 else ""
         embed = make_embed(
@@ -515,6 +853,10 @@ class Owner(commands.Cog):
             return
 
         db.set_claim(amount, duration_seconds=24 * 60 * 60)
+        log_event("admin",
+                  action="setclaim",
+                  users=[ctx.author.id],
+                  amount=amount)
         embed = make_embed(
             title="Claim Event Started",
             description=(f"✅ Claim enabled for 24h.\n"
@@ -527,6 +869,7 @@ class Owner(commands.Cog):
     @is_owner()
     async def disableclaim_command(self, ctx: commands.Context):
         db.disable_claim()
+        log_event("admin", action="disableclaim", users=[ctx.author.id])
         embed = make_embed(
             title="Claim Event Disabled",
             description="✅ Claim has been turned off.",
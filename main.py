@@ -3,6 +3,7 @@ import discord
 from discord.ext import commands
 
 from utils import db
+from utils.eventlog import get_event_log
 
 TOKEN = os.getenv("DISCORD_TOKEN")
 
@@ -39,6 +40,11 @@ class AyoBot(commands.Bot):
         await self.load_extension("cogs.coinflip")
         await self.load_extension("cogs.global_crash")
 
+    async def close(self):
+        # write out buffered archive events before shutting down
+        await get_event_log().flush()
+        await super().close()
+
 
 bot = AyoBot(
     command_prefix=dynamic_prefix,
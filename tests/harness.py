@@ -0,0 +1,143 @@
+"""
+Stand-in Discord objects for driving cogs without a gateway.
+
+Only what the cogs actually touch: a bot with partial messageables, an
+interaction with a response that records every ACK, and a text channel
+that passes the cogs' isinstance checks. Message edits take a little
+time like the real API so the edit budget / in-flight logic gets used.
+"""
+
+import asyncio
+import os
+import tempfile
+import time
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest import mock
+
+import discord
+
+from utils import db
+
+EDIT_LATENCY = 0.05  # seconds a fake message edit "takes"
+
+
+def use_temp_data_dir() -> tempfile.TemporaryDirectory:
+    """chdir into a fresh directory so data/ files never touch the repo."""
+    tmp = tempfile.TemporaryDirectory()
+    os.chdir(tmp.name)
+    db._users = None
+    db._config = None
+    db._live_games = None
+    return tmp
+
+
+class FakeResponse:
+    """interaction.response: every call is recorded, double ACKs too."""
+
+    def __init__(self):
+        self.calls: list[tuple[str, tuple, dict]] = []
+
+    def is_done(self) -> bool:
+        return bool(self.calls)
+
+    async def defer(self, *args, **kwargs):
+        self.calls.append(("defer", args, kwargs))
+
+    async def send_message(self, *args, **kwargs):
+        self.calls.append(("send_message", args, kwargs))
+
+    async def edit_message(self, *args, **kwargs):
+        self.calls.append(("edit_message", args, kwargs))
+
+
+class FakeFollowup:
+
+    def __init__(self):
+        self.sent: list[tuple[tuple, dict]] = []
+
+    async def send(self, *args, **kwargs):
+        self.sent.append((args, kwargs))
+
+
+def make_channel(channel_id: int, guild_id: int = 1):
+    channel = mock.Mock(spec=discord.TextChannel)
+    channel.id = channel_id
+    channel.guild = SimpleNamespace(id=guild_id)
+    return channel
+
+
+def make_interaction(user_id: int, channel, created_at: float | None = None):
+    """Interaction clicked at created_at (epoch seconds, default now)."""
+    stamp = time.time() if created_at is None else created_at
+    return SimpleNamespace(
+        user=SimpleNamespace(id=user_id, mention=f"<@{user_id}>",
+                             display_name=f"user{user_id}"),
+        channel=channel,
+        guild=getattr(channel, "guild", None),
+        created_at=datetime.fromtimestamp(stamp, timezone.utc),
+        response=FakeResponse(),
+        followup=FakeFollowup(),
+    )
+
+
+class FakeMessage:
+
+    def __init__(self, bot, channel_id: int, message_id: int):
+        self.bot = bot
+        self.channel_id = channel_id
+        self.id = message_id
+
+    async def edit(self, **kwargs):
+        await asyncio.sleep(EDIT_LATENCY)
+        self.bot.edits.append((self.channel_id, self.id, kwargs))
+
+
+class FakeMessageable:
+
+    def __init__(self, bot, channel_id: int):
+        self.bot = bot
+        self.id = channel_id
+
+    def get_partial_message(self, message_id: int) -> FakeMessage:
+        return FakeMessage(self.bot, self.id, message_id)
+
+    async def send(self, *args, **kwargs):
+        self.bot.sent.append((self.id, args, kwargs))
+
+
+class FakeBot:
+    """Just enough of commands.Bot for the cogs' hot paths."""
+
+    def __init__(self):
+        self.loop = asyncio.get_running_loop()
+        self.edits: list[tuple[int, int, dict]] = []
+        self.sent: list[tuple[int, tuple, dict]] = []
+        self.channels: dict[int, object] = {}
+
+    async def wait_until_ready(self):
+        return None
+
+    def get_channel(self, channel_id: int):
+        return self.channels.get(channel_id)
+
+    def get_partial_messageable(self, channel_id: int, **kwargs):
+        return FakeMessageable(self, channel_id)
+
+    def get_user(self, user_id: int):
+        return None
+
+    def get_guild(self, guild_id: int):
+        return None
+
+    def add_view(self, view, **kwargs):
+        pass
+
+    def add_listener(self, func, name=None):
+        pass
+
+    def remove_listener(self, func, name=None):
+        pass
+
+    def get_cog(self, name: str):
+        return None
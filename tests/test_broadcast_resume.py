@@ -0,0 +1,137 @@
+"""
+Global announcement: an interrupted job resumes without double sends.
+
+Run from the repo root:  python -m unittest tests.test_broadcast_resume
+"""
+
+import asyncio
+import os
+import unittest
+from collections import Counter
+from types import SimpleNamespace
+from unittest import mock
+
+import cogs.owner as owner
+
+from tests.harness import FakeBot, use_temp_data_dir
+
+GUILDS = 120
+SEND_LATENCY = 0.02
+
+
+class FakeAnnounceChannel:
+
+    def __init__(self, guild_id: int, sends: Counter):
+        self.id = guild_id * 10
+        self.guild_id = guild_id
+        self.sends = sends
+
+    def permissions_for(self, member):
+        return SimpleNamespace(send_messages=True)
+
+    async def send(self, **kwargs):
+        await asyncio.sleep(SEND_LATENCY)  # cancelled here = never delivered
+        self.sends[self.guild_id] += 1
+
+
+class BroadcastBot(FakeBot):
+
+    def __init__(self, sends: Counter):
+        super().__init__()
+        self.guilds_by_id = {}
+        for guild_id in range(1, GUILDS + 1):
+            channel = FakeAnnounceChannel(guild_id, sends)
+            self.guilds_by_id[guild_id] = SimpleNamespace(
+                id=guild_id, me=None, system_channel=channel,
+                text_channels=[channel],
+                get_channel=lambda cid, ch=channel: ch if cid == ch.id else None)
+
+    @property
+    def guilds(self):
+        return list(self.guilds_by_id.values())
+
+    def get_guild(self, guild_id: int):
+        return self.guilds_by_id.get(guild_id)
+
+
+def new_job(bot) -> dict:
+    return {
+        "message": "hello",
+        "author": "owner",
+        "author_id": 1,
+        "report_channel_id": 0,
+        "pending": [g.id for g in bot.guilds],
+        "sent": 0,
+        "failed": 0,
+        "started_at": 0.0,
+    }
+
+
+class BroadcastResumeTest(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self._cwd = os.getcwd()
+        self._tmp = use_temp_data_dir()
+        # many checkpoints would hide the gap: only the exact ones count
+        self._every = mock.patch.object(owner, "BROADCAST_PROGRESS_EVERY",
+                                        3600.0)
+        self._every.start()
+
+    async def asyncTearDown(self):
+        self._every.stop()
+        os.chdir(self._cwd)
+        self._tmp.cleanup()
+
+    async def test_unload_and_resume_sends_each_guild_once(self):
+        sends = Counter()
+        bot = BroadcastBot(sends)
+        cog = owner.Owner(bot)
+        job = new_job(bot)
+        owner._save_broadcast_job(job)
+        cog._broadcast_task = asyncio.create_task(cog._run_broadcast(job))
+        await asyncio.sleep(0.6)
+        await cog.cog_unload()
+        await asyncio.gather(cog._broadcast_task, return_exceptions=True)
+        self.assertGreater(sum(sends.values()), 0)
+        self.assertLess(sum(sends.values()), GUILDS)
+
+        # restart: a new cog picks the job up from disk
+        cog = owner.Owner(bot)
+        await cog.cog_load()
+        await asyncio.wait_for(cog._broadcast_task, timeout=30)
+
+        self.assertEqual(set(sends), set(range(1, GUILDS + 1)))
+        self.assertEqual(max(sends.values()), 1)
+        self.assertFalse(os.path.exists(owner.BROADCAST_FILE))
+
+    async def test_done_log_covers_a_crash_between_checkpoints(self):
+        sends = Counter()
+        bot = BroadcastBot(sends)
+        job = new_job(bot)
+        owner._save_broadcast_job(job)
+        # crash after 3 sends: only the done log knows about them
+        with open(owner.BROADCAST_DONE_FILE, "a") as f:
+            f.write("1 sent\n2 sent\n3 failed\n")
+
+        resumed = owner._load_broadcast_job()
+        self.assertEqual(resumed["pending"], list(range(4, GUILDS + 1)))
+        self.assertEqual((resumed["sent"], resumed["failed"]), (2, 1))
+
+    async def test_cancel_keeps_job_file_gone(self):
+        bot = BroadcastBot(Counter())
+        cog = owner.Owner(bot)
+        job = new_job(bot)
+        owner._save_broadcast_job(job)
+        cog._broadcast_task = asyncio.create_task(cog._run_broadcast(job))
+        await asyncio.sleep(0.2)
+
+        cog._broadcast_cancel = True
+        owner._clear_broadcast_job()
+        cog._broadcast_checkpoint()  # reporter waking up right now
+        self.assertFalse(os.path.exists(owner.BROADCAST_FILE))
+        await asyncio.wait_for(cog._broadcast_task, timeout=5)
+        self.assertFalse(os.path.exists(owner.BROADCAST_FILE))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+"""
+Single-player crash: round + STOP presses on one clock.
+
+Run from the repo root:  python -m unittest tests.test_crash_stop
+"""
+
+import os
+import time
+import unittest
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import cogs.crash as crash
+from utils import db
+
+from tests.harness import FakeBot, make_channel, make_interaction, use_temp_data_dir
+
+CHANNEL_ID = 2001
+USER_ID = 11
+CRASHED_AT = crash.time_to_reach(crash.CRASH_CURVE, 2.0)  # x2.00 game
+
+
+class CrashStopTest(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self._cwd = os.getcwd()
+        self._tmp = use_temp_data_dir()
+        self.channel = make_channel(CHANNEL_ID)
+        self.cog = crash.Crash(FakeBot())
+        self.cog._generate_crash_point = lambda user_id, bet: 2.0
+
+    async def asyncTearDown(self):
+        for task in self.cog._tickers.values():
+            task.cancel()
+        os.chdir(self._cwd)
+        self._tmp.cleanup()
+
+    async def _start(self, skew: float) -> crash.CrashGame:
+        """Start a game, Discord's clock `skew` s off ours."""
+        async def send(**kwargs):
+            return SimpleNamespace(id=99, created_at=datetime.fromtimestamp(
+                time.time() + skew, timezone.utc))
+
+        ctx = SimpleNamespace(author=SimpleNamespace(id=USER_ID),
+                              guild=None, channel=self.channel, send=send)
+        await self.cog.crash_command.callback(self.cog, ctx, "1000")
+        (game,) = self.cog.games.values()
+        self.cog._tickers.pop(game.game_id).cancel()
+        return game
+
+    async def test_round_on_host_clock(self):
+        for skew in (-5.0, 0.0, 5.0):
+            with self.subTest(skew=skew):
+                self.cog.click_clock = crash.ClickClock()
+                game = await self._start(skew)
+                self.assertAlmostEqual(game.started_at, time.time(), delta=0.5)
+                self.assertAlmostEqual(game.crash_at - game.started_at,
+                                       CRASHED_AT)
+
+                # game crashed 0.5s ago; STOP pressed 0.2s before the crash
+                # (Discord time), delivered now
+                game.started_at -= CRASHED_AT + 0.5
+                game.crash_at -= CRASHED_AT + 0.5
+                stop = make_interaction(USER_ID, self.channel,
+                                        created_at=game.crash_at - 0.2 + skew)
+                await self.cog._on_component(stop, game.game_id, "stop")
+                self.assertLess(game.stopped_at, game.crash_at)
+                self.assertAlmostEqual(game.stopped_at,
+                                       game.crash_at - 0.2, delta=0.5)
+
+                self.cog.games.pop(game.game_id)
+                self.cog.active.discard(USER_ID)
+                db.get_live_games("crash").clear()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,149 @@
+"""
+Load test: 1,000 bet clicks/sec through handle_bet_button -> _drain_bets.
+
+Run from the repo root:  python -m unittest tests.test_global_crash_load
+"""
+
+import asyncio
+import os
+import random
+import unittest
+from unittest import mock
+
+import cogs.global_crash as gc
+from utils import db
+
+from tests.harness import FakeBot, make_channel, make_interaction, use_temp_data_dir
+
+CHANNEL_ID = 1001
+MESSAGE_ID = 9
+USERS = 400
+AMOUNTS = (1_000, 100_000, 250_000)
+
+CLICKS_PER_SEC = 1000
+BURST_EVERY = 0.05  # seconds between bursts
+LOAD_SECONDS = 3.0
+
+
+class GlobalCrashLoadTest(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self._cwd = os.getcwd()
+        self._tmp = use_temp_data_dir()
+        # keep the betting window open: only bets change the frame
+        self._window = mock.patch.object(gc, "BET_WINDOW", 3600.0)
+        self._window.start()
+
+        self.bot = FakeBot()
+        self.cog = gc.GlobalCrash(self.bot)
+        self.channel = make_channel(CHANNEL_ID)
+        self.bot.channels[CHANNEL_ID] = self.channel
+        self.table = gc.CrashTable(CHANNEL_ID, {"message_id": MESSAGE_ID})
+        self.cog.tables[CHANNEL_ID] = self.table
+        self.cog._by_channel[CHANNEL_ID] = self.table
+
+        self.start_cash = {
+            uid: db.get_profile(uid)["cash"]
+            for uid in range(USERS)
+        }
+
+        # per scheduler tick: (frame when the tick started, clicks drained,
+        # clicks accepted) -> frames rendered by a tick = next start - start
+        self.ticks: list[tuple[int, int, int]] = []
+        self._batch = (0, 0)
+        self.pushed: list[int] = []
+
+        drain, tick, push = (self.cog._drain_bets, self.cog._tick,
+                             self.cog._push_frame)
+
+        def counting_drain(table):
+            replies = drain(table)
+            accepted = sum(1 for _, reply in replies if reply is None)
+            self._batch = (len(replies), accepted)
+            return replies
+
+        def counting_tick(table, now):
+            self.ticks.append((table.frame, *self._batch))
+            self._batch = (0, 0)
+            tick(table, now)
+
+        async def counting_push(screen, frame, embed):
+            self.pushed.append(frame)
+            await push(screen, frame, embed)
+
+        self.cog._drain_bets = counting_drain
+        self.cog._tick = counting_tick
+        self.cog._push_frame = counting_push
+
+    async def asyncTearDown(self):
+        await self.cog.cog_unload()
+        self._window.stop()
+        os.chdir(self._cwd)
+        self._tmp.cleanup()
+
+    async def _wait_for(self, predicate, timeout: float):
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while not predicate():
+            if loop.time() > deadline:
+                self.fail("timed out waiting for the scheduler")
+            await asyncio.sleep(0.05)
+
+    async def test_thousand_clicks_per_second(self):
+        rng = random.Random(41)
+        per_burst = int(CLICKS_PER_SEC * BURST_EVERY)
+        interactions = []
+
+        for _ in range(int(LOAD_SECONDS / BURST_EVERY)):
+            for _ in range(per_burst):
+                interaction = make_interaction(rng.randrange(USERS),
+                                               self.channel)
+                interactions.append(interaction)
+                await self.cog.handle_bet_button(interaction,
+                                                 rng.choice(AMOUNTS))
+            await asyncio.sleep(BURST_EVERY)
+
+        screen = self.table.screens[CHANNEL_ID]
+        await self._wait_for(
+            lambda: all(i.response.is_done() for i in interactions)
+            and not self.table.intake, timeout=5.0)
+        await self._wait_for(
+            lambda: screen.shown == self.table.frame and not screen.editing,
+            timeout=5.0)
+
+        # every click ACKed exactly once
+        for interaction in interactions:
+            self.assertEqual(len(interaction.response.calls), 1)
+        self.assertEqual(sum(n for _, n, _ in self.ticks), len(interactions))
+
+        # money: cash + holds per user never changes while bets are held
+        for uid, start in self.start_cash.items():
+            profile = db.get_profile(uid)
+            held = sum(profile.get("gc_hold", {}).values())
+            self.assertEqual(profile["cash"] + held, start)
+        held_total = sum(
+            sum(r["bets"].values()) for r in self.cog.ledger.rounds.values())
+        self.assertEqual(
+            sum(db.get_profile(uid)["cash"] for uid in range(USERS))
+            + held_total, sum(self.start_cash.values()))
+
+        # frames: one per drained batch, however many clicks it held
+        self.assertEqual(self.table.phase, "cooldown")
+        batches = 0
+        for (frame, drained, accepted), (next_frame, _, _) in zip(
+                self.ticks, self.ticks[1:]):
+            self.assertLessEqual(next_frame - frame, 1)
+            if accepted:
+                batches += 1
+                self.assertEqual(next_frame - frame, 1)
+        self.assertGreater(batches, 0)
+        self.assertLessEqual(self.table.frame, len(self.ticks))
+        self.assertLess(self.table.frame, len(interactions) / 50)
+
+        # screen: pushes are frames in order, never one frame twice
+        self.assertEqual(self.pushed, sorted(set(self.pushed)))
+        self.assertEqual(len(self.bot.edits), len(self.pushed))
+
+
+if __name__ == "__main__":
+    unittest.main()
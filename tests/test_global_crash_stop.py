@@ -0,0 +1,137 @@
+"""
+STOP clicks in global crash: valued on the round's clock.
+
+Run from the repo root:  python -m unittest tests.test_global_crash_stop
+"""
+
+import os
+import time
+import unittest
+
+import cogs.global_crash as gc
+from utils.crash_math import time_to_reach
+
+from tests.harness import FakeBot, make_channel, make_interaction, use_temp_data_dir
+
+CHANNEL_ID = 1002
+USER_ID = 7
+BET = 10_000
+CRASHED_AT = time_to_reach(gc.GLOBAL_CRASH_CURVE, 2.0)  # x2.00 round
+
+
+class GlobalCrashStopTest(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self._cwd = os.getcwd()
+        self._tmp = use_temp_data_dir()
+        self.channel = make_channel(CHANNEL_ID)
+
+    async def asyncTearDown(self):
+        os.chdir(self._cwd)
+        self._tmp.cleanup()
+
+    def _make_cog(self) -> gc.GlobalCrash:
+        cog = gc.GlobalCrash(FakeBot())
+        cog.generate_crash_point = lambda rng=None: 100.0
+        table = gc.CrashTable(CHANNEL_ID, {"message_id": 9})
+        cog.tables[CHANNEL_ID] = table
+        cog._by_channel[CHANNEL_ID] = table
+        return cog
+
+    def _fly(self, cog: gc.GlobalCrash, skew: float, elapsed: float) -> float:
+        """
+        One bet, round started `elapsed` s ago on the host clock, Discord's
+        clock `skew` s off ours. Returns host now.
+        """
+        table = cog.tables[CHANNEL_ID]
+        now = time.time()
+        bet = make_interaction(USER_ID, self.channel, created_at=now + skew)
+        cog.click_clock.observe(bet.created_at.timestamp(), now)
+        table.intake.append((bet, BET))
+        self.assertEqual(cog._drain_bets(table), [(bet, None)])
+        cog._start_round(table, now - elapsed)
+        return now
+
+    async def test_stop_valued_on_round_clock(self):
+        for skew in (-5.0, 0.0, 5.0):
+            with self.subTest(skew=skew):
+                cog = self._make_cog()
+                try:
+                    table = cog.tables[CHANNEL_ID]
+                    now = self._fly(cog, skew, elapsed=8.0)
+                    stop = make_interaction(USER_ID, self.channel,
+                                            created_at=now + skew)
+                    await cog.handle_stop_button(stop)
+
+                    player = table.players[USER_ID]
+                    self.assertEqual(player.status, "cashed")
+                    self.assertAlmostEqual(player.cashout_mult,
+                                           table.multiplier_at(now),
+                                           places=2)
+                finally:
+                    await cog.cog_unload()
+
+    async def test_late_stop_inside_grace_window(self):
+        cog = self._make_cog()
+        try:
+            cog.generate_crash_point = lambda rng=None: 2.0
+            table = cog.tables[CHANNEL_ID]
+            # round crashed 0.5s ago (host clock)
+            now = self._fly(cog, 0.0, elapsed=CRASHED_AT + 0.5)
+            cog._tick(table, now)
+            self.assertEqual(table.phase, "running")
+            self.assertEqual(table.multiplier, table.crash_point)
+
+            # clicked before the crash, delivered after it
+            stop = make_interaction(USER_ID, self.channel,
+                                    created_at=table.crash_at - 0.2)
+            await cog.handle_stop_button(stop)
+            player = table.players[USER_ID]
+            self.assertEqual(player.status, "cashed")
+            self.assertLess(player.cashout_mult, table.crash_point)
+
+            cog._tick(table, table.crash_at + gc.STOP_GRACE)
+            self.assertEqual(table.phase, "crashed")
+            self.assertEqual(player.status, "cashed")
+        finally:
+            await cog.cog_unload()
+
+    async def test_stop_after_crash_rejected(self):
+        cog = self._make_cog()
+        try:
+            cog.generate_crash_point = lambda rng=None: 2.0
+            table = cog.tables[CHANNEL_ID]
+            now = self._fly(cog, 0.0, elapsed=CRASHED_AT + 0.5)
+            cog._tick(table, now)
+
+            stop = make_interaction(USER_ID, self.channel,
+                                    created_at=table.crash_at + 0.1)
+            await cog.handle_stop_button(stop)
+            self.assertNotEqual(table.players[USER_ID].status, "cashed")
+        finally:
+            await cog.cog_unload()
+
+    async def test_stop_past_auto_target_pays_target(self):
+        cog = self._make_cog()
+        try:
+            cog.auto_targets[str(USER_ID)] = 1.30
+            table = cog.tables[CHANNEL_ID]
+            # curve is past x1.30, no tick has settled the target yet
+            now = self._fly(cog, 0.0, elapsed=8.0)
+            stop = make_interaction(USER_ID, self.channel, created_at=now)
+            await cog.handle_stop_button(stop)
+
+            player = table.players[USER_ID]
+            self.assertEqual(player.status, "cashed")
+            self.assertTrue(player.auto_hit)
+            self.assertEqual(player.cashout_mult, 1.30)
+            self.assertEqual(player.win_amount, int(BET * 1.30))
+
+            cog._tick(table, now)
+            self.assertEqual(table.paid, int(BET * 1.30))
+        finally:
+            await cog.cog_unload()
+
+
+if __name__ == "__main__":
+    unittest.main()
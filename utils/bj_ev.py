@@ -0,0 +1,212 @@
+"""
+Exact blackjack EV tables for live hints.
+
+Memoized dynamic programming over (hand value, soft flag, dealer upcard)
+under the cog's rules (utils/bj_math.py), with an infinite deck: every
+draw is a fresh random rank, within a fraction of a percent of the cog's
+6 deck shoe.
+
+- dealer final totals (17..21 / bust) per upcard, dealer stands on all 17
+  and has no blackjack check
+- player EV of stand / hit / double per state, hit = best play afterwards
+- split: both hands play with double allowed, no re-split
+- insurance: EV of one unit insured (pays on ANY dealer 21)
+
+Tables are built once (a few ms) and cached in data/bj_ev.json together
+with the rules they were built for; a hint is then one dict lookup per
+action, never a simulation during play.
+"""
+
+import json
+import os
+from functools import lru_cache
+
+from . import db
+from .bj_math import (
+    DEALER_STANDS,
+    INSURANCE_PAY,
+    RANKS,
+    VALUES,
+)
+
+EV_FILE = os.path.join(db.DATA_DIR, "bj_ev.json")
+
+UPCARDS = tuple(range(2, 12))  # dealer upcard value, Ace = 11
+# card value -> probability of drawing it (10 J Q K all count 10)
+CARD_PROBS = {v: (4 if v == 10 else 1) / 13 for v in range(2, 12)}
+DEALER_OUTCOMES = (17, 18, 19, 20, 21, 22)  # 22 = bust
+
+# what the tables depend on (a natural is paid before any decision)
+RULES = {
+    "insurance_pay": INSURANCE_PAY,
+    "dealer_stands": DEALER_STANDS,
+}
+
+
+def add_card(total: int, soft: bool, card: int) -> tuple[int, bool]:
+    """Hand total after one more card; soft = an ace still counts 11."""
+    total += card
+    if card == 11:
+        if total > 21:
+            total -= 10  # new ace counts 1
+        else:
+            soft = True
+    if total > 21 and soft:
+        total -= 10
+        soft = False
+    return total, soft
+
+
+def _key(total: int, soft: bool) -> str:
+    return f"{'s' if soft else 'h'}{total}"
+
+
+# ---------- dealer ----------
+
+
+@lru_cache(maxsize=None)
+def dealer_dist(total: int, soft: bool) -> tuple[float, ...]:
+    """P(dealer ends on 17, 18, 19, 20, 21, bust) from this hand."""
+    if total > 21:
+        return (0.0, 0.0, 0.0, 0.0, 0.0, 1.0)
+    if total >= DEALER_STANDS:
+        return tuple(1.0 if total == o else 0.0 for o in DEALER_OUTCOMES)
+    dist = [0.0] * len(DEALER_OUTCOMES)
+    for card, p in CARD_PROBS.items():
+        for i, q in enumerate(dealer_dist(*add_card(total, soft, card))):
+            dist[i] += p * q
+    return tuple(dist)
+
+
+def dealer_from_upcard(up: int) -> tuple[float, ...]:
+    # hole card drawn like any other card (no peek, no blackjack check)
+    return dealer_dist(up, up == 11)
+
+
+# ---------- player ----------
+
+
+@lru_cache(maxsize=None)
+def ev_stand(total: int, up: int) -> float:
+    if total > 21:
+        return -1.0
+    ev = 0.0
+    for outcome, p in zip(DEALER_OUTCOMES, dealer_from_upcard(up)):
+        if outcome > 21 or total > outcome:
+            ev += p
+        elif total < outcome:
+            ev -= p
+    return ev
+
+
+@lru_cache(maxsize=None)
+def ev_hit(total: int, soft: bool, up: int) -> float:
+    """Take a card, then play on perfectly (stand / hit only)."""
+    ev = 0.0
+    for card, p in CARD_PROBS.items():
+        new_total, new_soft = add_card(total, soft, card)
+        if new_total > 21:
+            ev -= p
+        else:
+            ev += p * max(ev_stand(new_total, up),
+                          ev_hit(new_total, new_soft, up))
+    return ev
+
+
+@lru_cache(maxsize=None)
+def ev_double(total: int, soft: bool, up: int) -> float:
+    ev = 0.0
+    for card, p in CARD_PROBS.items():
+        ev += p * ev_stand(add_card(total, soft, card)[0], up)
+    return 2 * ev
+
+
+def ev_first_turn(total: int, soft: bool, up: int) -> float:
+    return max(ev_stand(total, up), ev_hit(total, soft, up),
+               ev_double(total, soft, up))
+
+
+@lru_cache(maxsize=None)
+def ev_split(card: int, up: int) -> float:
+    """Two hands of `card` + a new card each (double ok, no re-split)."""
+    ev = 0.0
+    for second, p in CARD_PROBS.items():
+        ev += p * ev_first_turn(*add_card(card, card == 11, second), up)
+    return 2 * ev
+
+
+def ev_insurance() -> float:
+    """EV of one unit of insurance (dealer shows an Ace)."""
+    return dealer_from_upcard(11)[4] * INSURANCE_PAY - 1
+
+
+def build_tables() -> dict:
+    states = [(t, False) for t in range(4, 22)] + [(t, True)
+                                                   for t in range(12, 22)]
+    tables = {"rules": RULES, "stand": {}, "hit": {}, "double": {}, "split": {}}
+    for total, soft in states:
+        key = _key(total, soft)
+        tables["stand"][key] = [ev_stand(total, up) for up in UPCARDS]
+        tables["hit"][key] = [ev_hit(total, soft, up) for up in UPCARDS]
+        tables["double"][key] = [ev_double(total, soft, up) for up in UPCARDS]
+    for card in UPCARDS:
+        tables["split"][str(card)] = [ev_split(card, up) for up in UPCARDS]
+    tables["dealer"] = {
+        str(up): list(dealer_from_upcard(up))
+        for up in UPCARDS
+    }
+    tables["insurance"] = ev_insurance()
+    return tables
+
+
+# ---------- cache + lookup ----------
+
+
+class EvTables:
+
+    def __init__(self, path: str = EV_FILE):
+        self.path = path
+        self.tables: dict | None = None
+
+    def load(self):
+        """Cached tables if they match the current rules, else rebuild
+        (blocking but tiny, call it on a worker thread)."""
+        if os.path.exists(self.path):
+            try:
+                with open(self.path, "r") as f:
+                    tables = json.load(f)
+                if tables.get("rules") == RULES:
+                    self.tables = tables
+                    return
+            except Exception:
+                pass
+
+        self.tables = build_tables()
+        db.ensure_data_dir()
+        try:
+            with open(self.path, "w") as f:
+                json.dump(self.tables, f)
+        except OSError:
+            pass
+
+    def hint(self, total: int, soft: bool, first_card: int, upcard: int,
+             actions: set[str]) -> dict[str, float]:
+        """
+        EV (per unit of the hand's bet) of every allowed action. Cards are
+        rank codes (index into RANKS), first_card only matters for split.
+        """
+        if self.tables is None:
+            return {}
+        key = _key(total, soft)
+        col = UPCARDS.index(VALUES[RANKS[upcard]])
+
+        evs = {}
+        for action in ("stand", "hit", "double"):
+            if action in actions and key in self.tables[action]:
+                evs[action] = self.tables[action][key][col]
+        if "split" in actions:
+            evs["split"] = self.tables["split"][str(VALUES[RANKS[first_card]])][col]
+        if "insurance" in actions:
+            # per unit insured; insurance is half the bet
+            evs["insurance"] = self.tables["insurance"] / 2
+        return evs
@@ -0,0 +1,113 @@
+"""
+Blackjack cards + rules shared by the blackjack cog and the simulator
+(utils/bj_sim.py), so both always model the same game.
+
+House rules (what the cog actually does):
+- cards come from a SHOE_DECKS deck shoe (dealer included); a solo game
+  always starts from a freshly shuffled shoe, a table reshuffles between
+  rounds once PENETRATION of it has been dealt
+- a player natural pays NATURAL_PAY x bet at once, the dealer never checks
+- dealer has no blackjack of its own: a two card 21 is just 21
+- dealer stands on every 17 (soft included)
+- double on any first turn (also after a split), one split per game and
+  only on the same rank (K-K yes, K-Q no)
+- insurance up to half the bet vs an Ace, pays INSURANCE_PAY x if the
+  dealer ENDS on 21 (not only on a two card blackjack)
+
+Cards are rank codes (0 = A ... 12 = K, index into RANKS): a shoe is one
+bytearray, a Hand keeps its running total so its value is O(1).
+"""
+
+import random
+
+RANKS = ["A", "2", "3", "4", "5", "6", "7", "8", "9", "10", "J", "Q", "K"]
+VALUES = {
+    "A": 11,
+    "2": 2,
+    "3": 3,
+    "4": 4,
+    "5": 5,
+    "6": 6,
+    "7": 7,
+    "8": 8,
+    "9": 9,
+    "10": 10,
+    "J": 10,
+    "Q": 10,
+    "K": 10,
+}
+
+NATURAL_PAY = 2.5  # returned on a natural (bet included)
+INSURANCE_PAY = 3  # returned on a won insurance bet (bet included)
+DEALER_STANDS = 17
+
+SHOE_DECKS = 6
+PENETRATION = 0.75  # reshuffle once this much of the shoe is dealt
+
+ACE = 0  # rank code of "A"
+# rank code -> card value with the ace as 1 (hand totals add 10 when soft)
+CARD_VALUES = bytes(1 if r == "A" else VALUES[r] for r in RANKS)
+
+
+class Shoe:
+    """N decks of rank codes in one bytearray, dealt front to back."""
+
+    __slots__ = ("cards", "pos", "cut")
+
+    def __init__(self, decks: int = SHOE_DECKS,
+                 penetration: float = PENETRATION):
+        self.cards = bytearray(range(len(RANKS))) * (4 * decks)
+        self.cut = int(len(self.cards) * penetration)
+        self.shuffle()
+
+    def shuffle(self):
+        random.shuffle(self.cards)
+        self.pos = 0
+
+    def start_round(self):
+        """
+        Call before dealing a game: reshuffle once past the cut card. Only
+        call it when no game still holds cards from this shoe.
+        """
+        if self.pos >= self.cut:
+            self.shuffle()
+
+    def draw(self) -> int:
+        if self.pos >= len(self.cards):
+            self.shuffle()  # only if one round eats the whole rest
+        card = self.cards[self.pos]
+        self.pos += 1
+        return card
+
+
+class Hand:
+    """One hand: cards + running hard total (aces as 1) + state flags."""
+
+    __slots__ = ("cards", "bet", "hard", "aces", "finished", "busted",
+                 "doubled")
+
+    def __init__(self, cards=(), bet: int = 0):
+        self.cards = bytearray()
+        self.bet = bet
+        self.hard = 0
+        self.aces = 0
+        self.finished = False
+        self.busted = False
+        self.doubled = False
+        for card in cards:
+            self.add(card)
+
+    def add(self, card: int):
+        self.cards.append(card)
+        self.hard += CARD_VALUES[card]
+        if card == ACE:
+            self.aces += 1
+
+    @property
+    def soft(self) -> bool:
+        """An ace counts 11 (one ace kept high while that stays <= 21)."""
+        return self.aces > 0 and self.hard + 10 <= 21
+
+    @property
+    def value(self) -> int:
+        return self.hard + 10 if self.soft else self.hard
@@ -0,0 +1,387 @@
+"""
+Monte Carlo house edge simulator for blackjack.
+
+Plays the cog's exact rules (utils/bj_math.py) with a player strategy,
+vectorized over games: every game in a chunk is dealt from its own fresh
+shoe (per-rank card counts, drawn without replacement) and all of them
+take each step at once with numpy. The cog deals several games from one
+shoe before the cut card; with flat bets that doesn't move the EV. Hand
+totals are kept like Hand does it: hard total with aces as 1, plus 10
+for one ace when that stays <= 21. Chunks run in a process pool.
+
+The net of every game is also split by where it came from (naturals,
+insurance, doubled hands, split games, everything else); the parts add
+up to the total EV, so a payout tweak shows exactly what it moves.
+
+    python -m utils.bj_sim --hands 10000000 --strategy basic
+    python -m utils.bj_sim --strategy basic+ins --natural-pay 2.0
+
+Strategies:
+    basic        standard S17 / double after split chart
+    stand:<n>    hit below n, never double or split
+    mimic        play like the dealer (stand:17)
+    ...+ins      take insurance whenever the dealer shows an Ace
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import numpy as np
+except ImportError:  # optional: only the simulator needs it
+    np = None
+
+from .bj_math import (
+    ACE,
+    CARD_VALUES,
+    DEALER_STANDS,
+    INSURANCE_PAY,
+    NATURAL_PAY,
+    RANKS,
+    SHOE_DECKS,
+)
+
+CHUNK_HANDS = 200_000  # games per worker task
+PARTS = ("natural", "insurance", "double", "split", "other")
+
+# rule knobs, defaults = what the cog does
+DEFAULT_RULES = {
+    "natural_pay": NATURAL_PAY,
+    "insurance_pay": INSURANCE_PAY,
+    "double": True,
+    "split": True,
+    "decks": SHOE_DECKS,
+}
+
+# ---------- basic strategy ----------
+# dealer upcard columns: 2 3 4 5 6 7 8 9 10 A
+# S stand, H hit, D double (else hit), d double (else stand), P split
+_HARD = {
+    8: "HHHHHHHHHH",
+    9: "HDDDDHHHHH",
+    10: "DDDDDDDDHH",
+    11: "DDDDDDDDDH",
+    12: "HHSSSHHHHH",
+    13: "SSSSSHHHHH",
+    14: "SSSSSHHHHH",
+    15: "SSSSSHHHHH",
+    16: "SSSSSHHHHH",
+}
+_SOFT = {
+    13: "HHHDDHHHHH",
+    14: "HHHDDHHHHH",
+    15: "HHDDDHHHHH",
+    16: "HHDDDHHHHH",
+    17: "HDDDDHHHHH",
+    18: "SddddSSHHH",
+}
+# pair card value -> upcards to split against
+_PAIRS = {
+    11: "PPPPPPPPPP",
+    2: "PPPPPPHHHH",
+    3: "PPPPPPHHHH",
+    4: "HHHPPHHHHH",
+    6: "PPPPPHHHHH",
+    7: "PPPPPPHHHH",
+    8: "PPPPPPPPPP",
+    9: "PPPPPSPPSS",
+}
+_STAND, _HIT, _DOUBLE, _DOUBLE_OR_STAND = 0, 1, 2, 3
+_CODES = {"S": _STAND, "H": _HIT, "D": _DOUBLE, "d": _DOUBLE_OR_STAND}
+
+
+def _tables():
+    """(hard, soft) action tables [value 0..31, upcard 0..11] + pair table."""
+    hard = np.full((32, 12), _STAND, dtype=np.int8)
+    hard[:8] = _HIT
+    soft = np.full((32, 12), _STAND, dtype=np.int8)
+    soft[:13] = _HIT
+    pair = np.zeros((12, 12), dtype=bool)
+    for value, row in _HARD.items():
+        hard[value, 2:] = [_CODES[a] for a in row]
+    for value, row in _SOFT.items():
+        soft[value, 2:] = [_CODES[a] for a in row]
+    for value, row in _PAIRS.items():
+        pair[value, 2:] = [a == "P" for a in row]
+    return hard, soft, pair
+
+
+def parse_strategy(text: str) -> tuple[str, int, bool]:
+    """'stand:16+ins' -> ("stand", 16, True). Raises ValueError if invalid."""
+    text = text.lower()
+    insure = text.endswith("+ins")
+    if insure:
+        text = text[:-len("+ins")]
+    kind, _, rest = text.partition(":")
+    if kind == "basic" and not rest:
+        return kind, 0, insure
+    if kind == "mimic" and not rest:
+        return "stand", DEALER_STANDS, insure
+    if kind == "stand" and rest.isdigit() and 12 <= int(rest) <= 21:
+        return kind, int(rest), insure
+    raise ValueError(f"unknown strategy: {text}")
+
+
+# ---------- engine ----------
+
+
+def _value(hard, ace):
+    """hand_value on (hard total, has ace) arrays -> (value, soft)."""
+    soft = ace & (hard + 10 <= 21)
+    return hard + 10 * soft, soft
+
+
+def simulate_chunk(hands: int, strategy: str, rules: dict, seed) -> dict:
+    """Play `hands` games; returns raw sums (per unit base bet)."""
+    kind, stand_on, insure = parse_strategy(strategy)
+    rules = {**DEFAULT_RULES, **rules}
+    rng = np.random.default_rng(seed)
+    hard_table, soft_table, pair_table = _tables()
+
+    # rank code (0 = A ... 12 = K) -> card value with A as 1
+    rank_value = np.frombuffer(CARD_VALUES, dtype=np.uint8).astype(np.int16)
+
+    # one fresh shoe per game as per-rank counts: a draw picks rank r with
+    # probability counts[r] / left, so a game costs O(ranks) per card
+    # instead of shuffling hundreds of cards
+    counts = np.full((hands, len(RANKS)), 4 * rules["decks"], dtype=np.int16)
+    left = np.full(hands, 52 * rules["decks"], dtype=np.int64)
+    everyone = np.ones(hands, bool)
+
+    def draw(mask):
+        u = rng.random(hands) * left
+        card = (np.cumsum(counts, axis=1) <= u[:, None]).sum(axis=1)
+        card = np.minimum(card, len(RANKS) - 1)
+        counts[mask, card[mask]] -= 1
+        left[mask] -= 1
+        return card
+
+    p1, p2, up, hole = (draw(everyone) for _ in range(4))
+    up_value = np.where(up == ACE, 11, rank_value[up])
+
+    natural = _value(rank_value[p1] + rank_value[p2], (p1 == ACE) |
+                     (p2 == ACE))[0] == 21
+    live = ~natural
+
+    # ---------- split ----------
+    split = np.zeros(hands, bool)
+    if kind == "basic" and rules["split"]:
+        split = live & (p1 == p2) & pair_table[np.where(
+            p1 == ACE, 11, rank_value[p1]), up_value]
+    # split hands get their second cards first (hand 1, then hand 2)
+    second_a = np.where(split, draw(split), p2)
+    second_b = draw(split)
+
+    def play(first, second, mask):
+        """Play one hand per game where mask; returns (value, bet, busted)."""
+        hard = rank_value[first] + rank_value[second]
+        ace = (first == ACE) | (second == ACE)
+        bet = np.ones(hands)
+        cards = 2
+        going = mask.copy()
+        busted = np.zeros(hands, bool)
+        while going.any():
+            value, soft = _value(hard, ace)
+            if kind == "basic":
+                act = np.where(soft, soft_table[value, up_value],
+                               hard_table[value, up_value])
+            else:
+                act = np.where(value < stand_on, _HIT, _STAND)
+            if cards == 2 and rules["double"]:
+                act = np.where(act == _DOUBLE_OR_STAND, _DOUBLE, act)
+            else:
+                act = np.where(act == _DOUBLE, _HIT,
+                               np.where(act == _DOUBLE_OR_STAND, _STAND, act))
+
+            take = going & (act != _STAND)
+            card = draw(take)
+            hard = np.where(take, hard + rank_value[card], hard)
+            ace |= take & (card == ACE)
+            bet = np.where(going & (act == _DOUBLE), 2.0, bet)
+
+            value = _value(hard, ace)[0]
+            busted |= take & (value > 21)
+            going &= (act == _HIT) & (value < 21)
+            cards += 1
+        return _value(hard, ace)[0], np.where(mask, bet, 0.0), busted
+
+    value_a, bet_a, bust_a = play(p1, second_a, live)
+    value_b, bet_b, bust_b = play(p2, second_b, split)
+
+    # ---------- dealer (draws from the same shoe) ----------
+    d_hard = rank_value[up] + rank_value[hole]
+    d_ace = (up == ACE) | (hole == ACE)
+    while True:
+        d_value = _value(d_hard, d_ace)[0]
+        drawing = live & (d_value < DEALER_STANDS)
+        if not drawing.any():
+            break
+        card = draw(drawing)
+        d_hard = np.where(drawing, d_hard + rank_value[card], d_hard)
+        d_ace |= drawing & (card == ACE)
+
+    # ---------- settle ----------
+    def result(value, bet, busted):
+        won = ~busted & ((d_value > 21) | (value > d_value))
+        lost = busted | (~won & (value < d_value))
+        return bet * (won.astype(float) - lost)
+
+    net_a = result(value_a, bet_a, bust_a)
+    net_b = result(value_b, bet_b, bust_b)
+
+    insured = live & (up == ACE) if insure else np.zeros(hands, bool)
+    net_ins = np.where(insured,
+                       np.where(d_value == 21, 0.5 * (rules["insurance_pay"] - 1),
+                                -0.5), 0.0)
+    net_natural = np.where(natural, rules["natural_pay"] - 1, 0.0)
+    net = net_natural + net_ins + net_a + net_b
+
+    doubled = ~split & (bet_a == 2.0)
+    parts = {
+        "natural": float(net_natural.sum()),
+        "insurance": float(net_ins.sum()),
+        "double": float(net_a[doubled].sum()),
+        "split": float((net_a + net_b)[split].sum()),
+        "other": float(net_a[live & ~split & ~doubled].sum()),
+    }
+    return {
+        "hands": hands,
+        "net": float(net.sum()),
+        "net2": float((net * net).sum()),
+        "wagered": float((np.where(natural, 1.0, bet_a + bet_b) +
+                          0.5 * insured).sum()),
+        "parts": parts,
+        "counts": {
+            "natural": int(natural.sum()),
+            "insurance": int(insured.sum()),
+            "double": int((bet_a == 2.0).sum() + (bet_b == 2.0).sum()),
+            "split": int(split.sum()),
+        },
+    }
+
+
+def summarize(chunks: list[dict], seconds: float) -> dict:
+    hands = sum(c["hands"] for c in chunks)
+    mean = sum(c["net"] for c in chunks) / max(hands, 1)
+    variance = sum(c["net2"] for c in chunks) / max(hands, 1) - mean * mean
+    return {
+        "hands": hands,
+        "ev": mean,
+        "house_edge": -mean,
+        "variance": variance,
+        "stderr": (variance / max(hands, 1))**0.5,
+        "rtp": 1 + sum(c["net"] for c in chunks) /
+        max(sum(c["wagered"] for c in chunks), 1),
+        "parts": {
+            p: sum(c["parts"][p] for c in chunks) / max(hands, 1)
+            for p in PARTS
+        },
+        "rates": {
+            k: sum(c["counts"][k] for c in chunks) / max(hands, 1)
+            for k in chunks[0]["counts"]
+        },
+        "seconds": seconds,
+    }
+
+
+def _chunks(hands: int) -> list[int]:
+    sizes = [CHUNK_HANDS] * (hands // CHUNK_HANDS)
+    if hands % CHUNK_HANDS or not sizes:
+        sizes.append(hands % CHUNK_HANDS or hands)
+    return sizes
+
+
+def _pool(processes: int | None) -> ProcessPoolExecutor:
+    # spawn: don't fork a process that runs the bot's event loop / threads
+    return ProcessPoolExecutor(
+        max_workers=processes or os.cpu_count(),
+        mp_context=multiprocessing.get_context("spawn"),
+    )
+
+
+def _seeds(n: int) -> list:
+    """Independent, fresh random streams for n chunks."""
+    return np.random.SeedSequence().spawn(n)
+
+
+async def run_async(hands: int, strategy: str, rules: dict | None = None, *,
+                    processes: int | None = None) -> dict:
+    """Simulate from the bot: chunks go to a process pool."""
+    if np is None:
+        raise RuntimeError("numpy is not installed")
+    parse_strategy(strategy)  # fail fast, before spawning workers
+
+    loop = asyncio.get_running_loop()
+    started = time.perf_counter()
+    sizes = _chunks(hands)
+    pool = _pool(processes)
+    try:
+        chunks = await asyncio.gather(*(loop.run_in_executor(
+            pool, simulate_chunk, size, strategy, rules or {}, seed)
+                                        for size, seed in zip(
+                                            sizes, _seeds(len(sizes)))))
+    finally:
+        pool.shutdown(wait=False)
+    return summarize(chunks, time.perf_counter() - started)
+
+
+def run(hands: int, strategy: str, rules: dict | None = None, *,
+        processes: int | None = None) -> dict:
+    if np is None:
+        raise RuntimeError("numpy is not installed")
+    parse_strategy(strategy)
+
+    started = time.perf_counter()
+    sizes = _chunks(hands)
+    with _pool(processes) as pool:
+        chunks = list(
+            pool.map(simulate_chunk, sizes, [strategy] * len(sizes),
+                     [rules or {}] * len(sizes), _seeds(len(sizes))))
+    return summarize(chunks, time.perf_counter() - started)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Monte Carlo house edge simulator for AYO blackjack")
+    parser.add_argument("--hands", type=int, default=10_000_000)
+    parser.add_argument("--strategy", default="basic")
+    parser.add_argument("--natural-pay", type=float, default=NATURAL_PAY,
+                        help="returned on a natural, bet included")
+    parser.add_argument("--insurance-pay", type=float, default=INSURANCE_PAY,
+                        help="returned on a won insurance bet, bet included")
+    parser.add_argument("--no-double", action="store_true")
+    parser.add_argument("--no-split", action="store_true")
+    parser.add_argument("--decks", type=int, default=SHOE_DECKS)
+    parser.add_argument("--processes", type=int, default=None)
+    args = parser.parse_args()
+
+    rules = {
+        "natural_pay": args.natural_pay,
+        "insurance_pay": args.insurance_pay,
+        "double": not args.no_double,
+        "split": not args.no_split,
+        "decks": args.decks,
+    }
+    try:
+        stats = run(args.hands, args.strategy, rules,
+                    processes=args.processes)
+    except (RuntimeError, ValueError) as e:
+        parser.error(str(e))
+
+    print(f"hands        {stats['hands']:,}")
+    print(f"EV / bet     {stats['ev']:+.4%} ± {1.96 * stats['stderr']:.4%} (95%)")
+    print(f"RTP          {stats['rtp']:.4%} (of everything wagered)")
+    print(f"variance     {stats['variance']:.4f} (per game)")
+    for part in PARTS:
+        print(f"  {part:<10} {stats['parts'][part]:+.4%}")
+    rates = " • ".join(f"{k} {v:.2%}" for k, v in stats["rates"].items())
+    print(f"rates        {rates}")
+    print(f"time         {stats['seconds']:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,9 @@
 import discord
 from . import db
+from .eventlog import log_event
+from .logpipe import MAX_CHARS_PER_MESSAGE, MAX_EMBEDS_PER_MESSAGE, get_pipeline
+
+EMBED_DESCRIPTION_LIMIT = 4096
 
 
 def make_embed(title: str = None, description: str = None) -> discord.Embed:
@@ -12,6 +16,49 @@ def make_embed(title: str = None, description: str = None) -> discord.Embed:
     return embed
 
 
+def paginate_embeds(title: str, header: str,
+                    lines: list[str]) -> list[list[discord.Embed]]:
+    """
+    Pack `lines` into embeds (4096 chars per description) and the embeds
+    into messages (10 embeds / 6000 chars per message). `header` goes on top
+    of the first page. Returns one list of embeds per message to send.
+    """
+    footer = len("AYO Cash • by Ali YT")
+    # the 6000 char message budget is the real limit: two pages just under
+    # half of it fit one message (better than one 4096 page per message)
+    budget = min(EMBED_DESCRIPTION_LIMIT,
+                 MAX_CHARS_PER_MESSAGE // 2 - len(title) - footer - 10)
+
+    descriptions: list[str] = []
+    page = header
+    for line in lines:
+        line = line[:budget]
+        if page and len(page) + 1 + len(line) > budget:
+            descriptions.append(page)
+            page = line
+        else:
+            page = f"{page}\n{line}" if page else line
+    if page or not descriptions:
+        descriptions.append(page)
+
+    messages: list[list[discord.Embed]] = []
+    batch: list[discord.Embed] = []
+    size = 0
+    for i, description in enumerate(descriptions):
+        embed = make_embed(
+            title=title if i == 0 else f"{title} ({i + 1}/{len(descriptions)})",
+            description=description,
+        )
+        if batch and (len(batch) >= MAX_EMBEDS_PER_MESSAGE
+                      or size + len(embed) > MAX_CHARS_PER_MESSAGE):
+            messages.append(batch)
+            batch, size = [], 0
+        batch.append(embed)
+        size += len(embed)
+    messages.append(batch)
+    return messages
+
+
 def fmt_time(seconds: int) -> str:
     seconds = int(seconds)
     h = seconds // 3600
@@ -27,17 +74,20 @@ def fmt_time(seconds: int) -> str:
     return " ".join(parts)
 
 
-async def send_log(bot, guild, log_type: str, embed: discord.Embed):
+async def send_log(bot, guild, log_type: str, embed: discord.Embed, **fields):
+    """
+    Archive the event in the local event log; the Discord log channel (if
+    set) is an optional fan-out, delivered in batches in the background.
+    Extra keyword fields (users=[ids], bet=..., ...) are stored as-is.
+    """
+    log_event(
+        log_type,
+        guild_id=guild.id if guild else None,
+        title=embed.title,
+        text=embed.description,
+        **fields,
+    )
     channel_id = db.get_log_channel(log_type)
     if not channel_id:
         return
-    channel = guild.get_channel(channel_id)
-    if channel is None:
-        try:
-            channel = await bot.fetch_channel(channel_id)
-        except Exception:
-            return
-    try:
-        await channel.send(embed=embed)
-    except Exception:
-        pass
+    get_pipeline(bot).submit(channel_id, embed)
@@ -0,0 +1,164 @@
+"""
+Round history of global crash, kept in a fixed-size binary ring file.
+
+Every finished round is one 44 byte record (time, crash point, players,
+wagered, payout, channel). Appending writes that record + the 16 byte
+header in place, O(1) whatever the file size; once `capacity` rounds are
+stored the oldest ones get overwritten. Stats read the raw records with
+struct into arrays, no JSON involved.
+"""
+
+import os
+import struct
+import time
+from array import array
+
+from . import db
+
+HISTORY_FILE = os.path.join(db.DATA_DIR, "global_crash_history.bin")
+CAPACITY = 100_000  # rounds kept (~4.4 MB)
+
+_MAGIC = b"AYCH"
+_HEADER = struct.Struct("<4sIII")  # magic, capacity, count, head
+# time, crash point, players, wagered, payout, channel id
+_RECORD = struct.Struct("<ddIqqQ")
+
+# histogram buckets: [edge, next edge)
+HISTOGRAM_EDGES = (1.0, 1.2, 1.5, 2.0, 3.0, 5.0, 10.0)
+STREAK_LINE = 2.0  # streaks = runs of rounds below / at-or-above this
+
+
+class CrashHistory:
+
+    def __init__(self, path: str = HISTORY_FILE, capacity: int = CAPACITY):
+        self.path = path
+        self.capacity = capacity
+        self.count = 0  # records stored (<= capacity)
+        self.head = 0  # slot of the next record
+        self._file = None
+
+    # ---------- file ----------
+
+    def _open(self):
+        if self._file is not None:
+            return self._file
+
+        db.ensure_data_dir()
+        f = open(self.path, "r+b" if os.path.exists(self.path) else "w+b")
+        header = f.read(_HEADER.size)
+        if len(header) == _HEADER.size:
+            magic, capacity, count, head = _HEADER.unpack(header)
+        else:
+            magic = None
+        if magic == _MAGIC:
+            # ring layout depends on the capacity it was written with
+            self.capacity, self.count, self.head = capacity, count, head
+        else:
+            f.seek(0)
+            f.truncate()
+            self.count = self.head = 0
+            self._write_header(f)
+        self._file = f
+        return f
+
+    def _write_header(self, f):
+        f.seek(0)
+        f.write(_HEADER.pack(_MAGIC, self.capacity, self.count, self.head))
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    # ---------- write ----------
+
+    def append(self, crash_point: float, players: int, wagered: int,
+               payout: int, channel_id: int = 0, ts: float | None = None):
+        f = self._open()
+        f.seek(_HEADER.size + self.head * _RECORD.size)
+        f.write(
+            _RECORD.pack(time.time() if ts is None else ts, crash_point,
+                         players, wagered, payout, channel_id))
+        # record first, header after: a torn write only loses this round
+        self.head = (self.head + 1) % self.capacity
+        self.count = min(self.count + 1, self.capacity)
+        self._write_header(f)
+        f.flush()
+
+    # ---------- read ----------
+
+    def _read_last(self, n: int) -> bytes:
+        """Raw bytes of the last `n` records, oldest first."""
+        self._open()
+        count, head, capacity = self.count, self.head, self.capacity
+        n = min(n, count)
+        if n <= 0:
+            return b""
+
+        start = (head - n) % capacity
+        # own handle: safe to call from a worker thread while rounds append
+        with open(self.path, "rb") as f:
+            f.seek(_HEADER.size + start * _RECORD.size)
+            if start + n <= capacity:
+                return f.read(n * _RECORD.size)
+            first = f.read((capacity - start) * _RECORD.size)
+            f.seek(_HEADER.size)
+            return first + f.read((start + n - capacity) * _RECORD.size)
+
+    def columns(self, n: int) -> dict[str, array]:
+        """Last `n` rounds as column arrays (oldest first)."""
+        cols = {
+            "ts": array("d"),
+            "crash": array("d"),
+            "players": array("I"),
+            "wagered": array("q"),
+            "payout": array("q"),
+            "channel": array("Q"),
+        }
+        appenders = [col.append for col in cols.values()]
+        for record in _RECORD.iter_unpack(self._read_last(n)):
+            for add, value in zip(appenders, record):
+                add(value)
+        return cols
+
+    def summarize(self, n: int) -> dict:
+        """Histogram, streaks and realized house edge of the last `n` rounds."""
+        cols = self.columns(n)
+        crash = cols["crash"]
+        rounds = len(crash)
+
+        histogram = [0] * len(HISTOGRAM_EDGES)
+        longest_low = longest_high = 0
+        run_high = None
+        run = 0
+        for point in crash:
+            # bucket: last edge <= point (7 edges, linear scan is fine)
+            b = len(HISTOGRAM_EDGES) - 1
+            while b and point < HISTOGRAM_EDGES[b]:
+                b -= 1
+            histogram[b] += 1
+
+            high = point >= STREAK_LINE
+            run = run + 1 if high == run_high else 1
+            run_high = high
+            if high:
+                longest_high = max(longest_high, run)
+            else:
+                longest_low = max(longest_low, run)
+
+        wagered = sum(cols["wagered"])
+        payout = sum(cols["payout"])
+        return {
+            "rounds": rounds,
+            "since": cols["ts"][0] if rounds else None,
+            "histogram": histogram,
+            "median": sorted(crash)[rounds // 2] if rounds else None,
+            "players": sum(cols["players"]),
+            "longest_low": longest_low,
+            "longest_high": longest_high,
+            "current_run": run,
+            "current_high": bool(run_high),
+            "wagered": wagered,
+            "payout": payout,
+            "house_edge": (1 - payout / wagered) if wagered else None,
+        }
@@ -0,0 +1,215 @@
+"""
+Round ledger for global crash.
+
+Bets and cashouts of a running round only touch memory: the bet is moved
+from `cash` into the profile's `gc_hold` (per round id) and every event is
+appended to a small write-ahead log. The round is committed with ONE
+db.save_users() at settlement.
+
+If the bot dies mid-round, `recover()` replays the log on the next start:
+recorded cashouts are paid, every other bet is refunded. The `gc_hold`
+entry tells how much of the bet actually reached users.json; settlement
+sets it to 0 (committed marker) which makes the replay idempotent. Markers
+are dropped on the user's next bet, once the commit record is on disk.
+"""
+
+import json
+import os
+
+from . import db
+
+WAL_FILE = os.path.join(db.DATA_DIR, "global_crash_wal.jsonl")
+# commits between log rewrites while other rounds keep it from truncating
+COMPACT_EVERY = 200
+
+
+class CrashLedger:
+
+    def __init__(self, path: str = WAL_FILE):
+        self.path = path
+        self._file = None
+        self._commits = 0
+        # round_id -> {"bets": {uid: amount}, "cashouts": {uid: win}}
+        self.rounds: dict[int, dict] = {}
+
+    # ---------- write-ahead log ----------
+
+    def _append(self, **record):
+        if self._file is None:
+            db.ensure_data_dir()
+            self._file = open(self.path, "a", encoding="utf-8")
+        self._file.write(json.dumps(record) + "\n")
+        # flushed per record -> survives a bot crash / restart
+        self._file.flush()
+
+    def _truncate(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self._commits = 0
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
+
+    def _compact(self):
+        """Rewrite the log with only the rounds that are still open."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self._commits = 0
+
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            for rid, entry in self.rounds.items():
+                f.write(json.dumps({"op": "open", "round": rid}) + "\n")
+                for uid, amount in entry["bets"].items():
+                    f.write(
+                        json.dumps({
+                            "op": "bet",
+                            "round": rid,
+                            "user": uid,
+                            "amount": amount
+                        }) + "\n")
+                for uid, win in entry["cashouts"].items():
+                    f.write(
+                        json.dumps({
+                            "op": "cashout",
+                            "round": rid,
+                            "user": uid,
+                            "win": win
+                        }) + "\n")
+        os.replace(tmp, self.path)
+
+    def _read(self) -> dict[int, dict]:
+        rounds: dict[int, dict] = {}
+        if not os.path.exists(self.path):
+            return rounds
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    rec = json.loads(line)
+                except ValueError:
+                    continue  # torn last line
+                rid = rec.get("round")
+                op = rec.get("op")
+                if op == "open":
+                    rounds.setdefault(rid, {"bets": {}, "cashouts": {}})
+                elif op == "bet":
+                    bets = rounds.setdefault(rid, {"bets": {}, "cashouts": {}})["bets"]
+                    bets[rec["user"]] = bets.get(rec["user"], 0) + rec["amount"]
+                elif op == "cashout" and rid in rounds:
+                    rounds[rid]["cashouts"][rec["user"]] = rec["win"]
+                elif op == "commit":
+                    rounds.pop(rid, None)
+        return rounds
+
+    # ---------- round flow ----------
+
+    def open_round(self, round_id: int, **info):
+        self.rounds[round_id] = {"bets": {}, "cashouts": {}}
+        self._append(op="open", round=round_id, **info)
+
+    def is_open(self, round_id: int) -> bool:
+        return round_id in self.rounds
+
+    def reserve(self, round_id: int, user_id: int, amount: int):
+        """Move `amount` from cash into the round hold (memory only)."""
+        profile = db.get_profile(user_id)
+        profile["cash"] -= amount
+        hold = profile.setdefault("gc_hold", {})
+        for key in [k for k, v in hold.items() if not v]:
+            del hold[key]  # committed markers of older rounds
+        hold[str(round_id)] = hold.get(str(round_id), 0) + amount
+
+        bets = self.rounds[round_id]["bets"]
+        bets[user_id] = bets.get(user_id, 0) + amount
+        self._append(op="bet", round=round_id, user=user_id, amount=amount)
+
+    def record_cashout(self, round_id: int, user_id: int, mult: float,
+                       win: int):
+        self.rounds[round_id]["cashouts"][user_id] = win
+        self._append(op="cashout",
+                     round=round_id,
+                     user=user_id,
+                     mult=round(mult, 4),
+                     win=win)
+
+    def settle(self, round_id: int) -> int:
+        """
+        Commit the round: release holds, pay recorded cashouts, one save.
+        Returns total paid out.
+        """
+        entry = self.rounds.pop(round_id, None)
+        if entry is None:
+            return 0
+
+        paid = 0
+        for user_id in entry["bets"]:
+            win = entry["cashouts"].get(user_id, 0)
+            profile = db.get_profile(user_id)
+            profile.setdefault("gc_hold", {})[str(round_id)] = 0
+            profile["cash"] += win
+            paid += win
+
+        self._commit(round_id)
+        return paid
+
+    def void(self, round_id: int) -> dict:
+        """Round could not finish: pay recorded cashouts, refund the rest."""
+        entry = self.rounds.pop(round_id, None)
+        if entry is None:
+            return {"refunded": 0, "paid": 0}
+        summary = self._apply_void(round_id, entry)
+        self._commit(round_id)
+        return summary
+
+    def _commit(self, round_id: int):
+        db.save_users()
+        self._append(op="commit", round=round_id)
+        if not self.rounds:
+            self._truncate()
+        else:
+            self._commits += 1
+            if self._commits >= COMPACT_EVERY:
+                self._compact()
+
+    # ---------- recovery ----------
+
+    def _apply_void(self, round_id: int, entry: dict) -> dict:
+        refunded = paid = 0
+        for user_id, bet in entry["bets"].items():
+            profile = db.get_profile(user_id)
+            hold = profile.setdefault("gc_hold", {})
+            if hold.get(str(round_id), None) == 0:
+                continue  # already committed before the crash
+
+            # part of the bet that was saved as deducted (rest never left cash)
+            reserved = min(hold.get(str(round_id), 0), bet)
+            hold[str(round_id)] = 0
+            if user_id in entry["cashouts"]:
+                credit = entry["cashouts"][user_id]
+                paid += credit
+            else:
+                credit = bet
+                refunded += bet
+            profile["cash"] += credit - (bet - reserved)
+        return {"refunded": refunded, "paid": paid}
+
+    def recover(self) -> list[dict]:
+        """Replay rounds left open by a crash / restart (call on load)."""
+        summaries = []
+        for round_id, entry in sorted(self._read().items()):
+            summary = self._apply_void(round_id, entry)
+            summary.update(round=round_id, players=len(entry["bets"]))
+            summaries.append(summary)
+
+        if summaries:
+            db.save_users()
+        self._truncate()
+        return summaries
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
@@ -0,0 +1,159 @@
+"""
+Crash multiplier helpers shared by the crash + global crash cogs.
+
+The multiplier is a pure function of elapsed time since round start, so a
+cashout can be evaluated at the exact moment the button was pressed
+(interaction timestamp) instead of whenever the game loop wakes up.
+
+RoundSchedule goes one step further for global crash: the whole round
+(crash point + sampled trajectory) is computed up front from a seed, so
+every query during the round is an array lookup and any round can be
+replayed exactly from its seed.
+
+STOP clicks are judged by their Discord timestamp; ClickClock maps those
+onto the host clock both crash cogs time their rounds with. A click
+reaches the bot a little after it was made, so rounds settle STOP_GRACE
+seconds after the crash: a click stamped before the crash still counts.
+"""
+
+import bisect
+import random
+import time
+from array import array
+from collections import deque
+
+SAMPLE_STEP = 0.05  # seconds between trajectory samples
+CLOCK_SAMPLES = 64  # recent interactions used for the clock offset
+STOP_GRACE = 1.5  # seconds after the crash in which late STOPs still land
+
+
+def build_curve(rates):
+    """
+    rates: [(from_mult, growth_per_second), ...] sorted by from_mult.
+    Returns a tuple of (from_mult, start_time, growth_per_second) segments.
+    """
+    curve = []
+    start_time = 0.0
+    for i, (mult, rate) in enumerate(rates):
+        if i:
+            prev_mult, prev_rate = rates[i - 1]
+            start_time += (mult - prev_mult) / prev_rate
+        curve.append((float(mult), start_time, float(rate)))
+    return tuple(curve)
+
+
+def multiplier_at(curve, elapsed: float) -> float:
+    """Multiplier `elapsed` seconds after round start."""
+    if elapsed <= 0:
+        return curve[0][0]
+    mult, start, rate = curve[0]
+    for seg in curve[1:]:
+        if elapsed < seg[1]:
+            break
+        mult, start, rate = seg
+    return mult + (elapsed - start) * rate
+
+
+def time_to_reach(curve, target: float) -> float:
+    """Seconds after round start at which the curve reaches `target`."""
+    mult, start, rate = curve[0]
+    for seg in curve[1:]:
+        if target < seg[0]:
+            break
+        mult, start, rate = seg
+    return start + max(0.0, target - mult) / rate
+
+
+class RoundSchedule:
+    """
+    One round, fixed before it starts: `draw(rng)` picks the crash point
+    from random.Random(seed), the curve is sampled every SAMPLE_STEP
+    seconds up to the crash. Same seed + curve + draw = same round.
+    """
+
+    __slots__ = ("seed", "crash_point", "duration", "samples")
+
+    def __init__(self, seed: int, curve, draw):
+        self.seed = seed
+        self.crash_point = draw(random.Random(seed))
+        self.duration = time_to_reach(curve, self.crash_point)
+        n = int(self.duration / SAMPLE_STEP) + 2
+        self.samples = array("d", (multiplier_at(curve, i * SAMPLE_STEP)
+                                   for i in range(n)))
+
+    def crashed(self, elapsed: float) -> bool:
+        return elapsed >= self.duration
+
+    def multiplier_at(self, elapsed: float) -> float:
+        """Multiplier `elapsed` seconds in (interpolated between samples)."""
+        if elapsed <= 0:
+            return self.samples[0]
+        if elapsed >= self.duration:
+            return self.crash_point
+        pos = elapsed / SAMPLE_STEP
+        i = int(pos)
+        low = self.samples[i]
+        return low + (self.samples[i + 1] - low) * (pos - i)
+
+    def time_to(self, target: float) -> float:
+        """First moment the multiplier reaches `target` (inf if it crashes first)."""
+        if target > self.crash_point:
+            return float("inf")
+        i = bisect.bisect_left(self.samples, target)
+        if i == 0:
+            return 0.0
+        low, high = self.samples[i - 1], self.samples[i]
+        return min((i - 1 + (target - low) / (high - low)) * SAMPLE_STEP,
+                   self.duration)
+
+
+class ClickClock:
+    """
+    Discord interaction timestamps -> host time.time() clock.
+
+    created_at comes from Discord's clock, a round timed with time.time()
+    from ours; the two can be seconds apart. The smallest recent
+    (received - created) gap is clock offset + best case latency, so a
+    click converted with it never lands after it was received.
+    """
+
+    __slots__ = ("_gaps",)
+
+    def __init__(self, samples: int = CLOCK_SAMPLES):
+        self._gaps: deque[float] = deque(maxlen=samples)
+
+    def observe(self, created_at: float, received_at: float | None = None):
+        if received_at is None:
+            received_at = time.time()
+        self._gaps.append(received_at - created_at)
+
+    def host_time(self, created_at: float,
+                  received_at: float | None = None) -> float:
+        """Host time of a click that Discord stamped `created_at`."""
+        self.observe(created_at, received_at)
+        return created_at + min(self._gaps)
+
+
+# ---------- single-player crash generator settings ----------
+# Shared by Crash._generate_crash_point and the RTP simulator
+# (utils/crash_sim.py) so both always model the same game.
+
+# base distribution: (cumulative probability, low, high)
+CRASH_BANDS = (
+    (0.03, 1.10, 1.20),  # very rare instant crash ~1.1
+    (0.58, 1.20, 1.60),  # most common 1.2 - 1.6 (+55%)
+    (0.78, 1.60, 3.00),  # medium wins (+20%)
+    (0.95, 3.0, 20.0),  # high range (+17%)
+    (1.00, 20.0, 100.0),  # ultra rare jackpots (1 in 20 games)
+)
+# loss streak protector: (streak, minimum crash point)
+STREAK_FLOORS = ((3, 1.60), (5, 2.00))
+# anti-lucky: window of recent games, min samples, big win multiplier,
+# big win rate above which high crash points get capped into CAP_RANGE
+BIG_WIN_WINDOW = 50
+BIG_WIN_MIN_SAMPLES = 10
+BIG_WIN_MULT = 3.0
+BIG_WIN_RATE_CAP = 0.35
+BIG_WIN_CAP_RANGE = (3.0, 8.0)
+# RTP correction factor: utils/rtp.py (shared by every money game)
+CRASH_MIN, CRASH_MAX = 1.10, 100.0
@@ -0,0 +1,309 @@
+"""
+Monte Carlo RTP simulator for single-player crash.
+
+Models Crash._generate_crash_point with its feedback state plus a player
+strategy. Like the cog, the loss streak is per player but the RTP state
+(decayed bet / paid sums, recent big wins) is ONE global state: sessions
+are grouped BOT_PLAYERS at a time into simulated bots, the players of a
+bot take turns game by game behind a shared state, warm-started from the
+live controller (data/rtp_state.json). Every numpy step advances one game
+on all bots at once; chunks of bots run in a process pool, so tens of
+millions of games take seconds and never block the bot loop.
+
+    python -m utils.crash_sim --games 20000000 --strategy fixed:2 --rtp 0.90
+
+Strategies:
+    fixed:<x>          cash out at x every game
+    range:<lo>:<hi>    cash out at a random target in [lo, hi)
+    martingale:<x>     cash out at x, double the bet after a loss
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import numpy as np
+except ImportError:  # optional: only the simulator needs it
+    np = None
+
+from .crash_math import (
+    BIG_WIN_CAP_RANGE,
+    BIG_WIN_MIN_SAMPLES,
+    BIG_WIN_MULT,
+    BIG_WIN_RATE_CAP,
+    BIG_WIN_WINDOW,
+    CRASH_BANDS,
+    CRASH_MAX,
+    CRASH_MIN,
+    STREAK_FLOORS,
+)
+from .rtp import DECAY, RTP_GAIN, RTP_MAX_ADJUST, get_rtp
+
+BASE_BET = 1_000
+MAX_BET = 250_000  # same as the crash cog
+START_CASH = 250_000  # new profile cash
+SESSION_GAMES = 200  # games per simulated player session
+BOT_PLAYERS = 100  # sessions sharing one RTP state (interleaved)
+CHUNK_SESSIONS = 20_000  # sessions per worker task
+
+
+def parse_strategy(text: str) -> tuple[str, float, float]:
+    """'fixed:2' -> ("fixed", 2.0, 2.0). Raises ValueError if invalid."""
+    kind, _, rest = text.lower().partition(":")
+    values = [float(v) for v in rest.split(":")] if rest else []
+    if kind in ("fixed", "martingale") and len(values) == 1:
+        low = high = values[0]
+    elif kind == "range" and len(values) == 2 and values[0] < values[1]:
+        low, high = values
+    else:
+        raise ValueError(f"unknown strategy: {text}")
+    if low <= 1.0:
+        raise ValueError("cashout target must be above x1.00")
+    return kind, low, high
+
+
+def simulate_chunk(sessions: int, games: int, strategy: str,
+                   target_rtp: float, seed, state: dict | None = None) -> dict:
+    """
+    Run `sessions` player sessions of `games` games; returns raw sums.
+    Sessions are split into bots of BOT_PLAYERS players; in a bot the
+    players take turns (one game each, round robin) against one RTP state
+    started from `state` (RtpController.to_dict()).
+    """
+    kind, low, high = parse_strategy(strategy)
+    rng = np.random.default_rng(seed)
+    state = state or {}
+
+    cumulative = np.array([b[0] for b in CRASH_BANDS])
+    band_low = np.array([b[1] for b in CRASH_BANDS])
+    band_span = np.array([b[2] - b[1] for b in CRASH_BANDS])
+
+    # players: (bot, seat); padding seats of the last bot never play
+    players = min(BOT_PLAYERS, sessions)
+    bots = -(-sessions // players)
+    seated = (np.arange(bots * players) < sessions).reshape(bots, players)
+    cash = np.where(seated, START_CASH, 0).astype(np.int64)
+    bet = np.full((bots, players), BASE_BET, dtype=np.int64)
+    loss_streak = np.zeros((bots, players), dtype=np.int32)
+
+    # global state per bot, same as RtpController (decayed sums + ring)
+    bet_decayed = np.full(bots, float(state.get("bet", 0.0)))
+    paid_decayed = np.full(bots, float(state.get("paid", 0.0)))
+    recent = np.zeros((bots, BIG_WIN_WINDOW), dtype=np.int32)
+    history = [bool(f) for f in state.get("big_wins", [])][-BIG_WIN_WINDOW:]
+    recent[:, :len(history)] = history
+    recent_pos = np.full(bots, len(history) % BIG_WIN_WINDOW)
+    recent_len = np.full(bots, len(history))
+    recent_sum = np.full(bots, sum(history))
+    rows = np.arange(bots)
+
+    bet_total = 0
+    paid_total = 0
+    played = 0
+    sum_ret = sum_ret2 = 0.0
+
+    for t in range(games * players):
+        seat = t % players
+        if seat == 0 and not (cash >= bet).any():
+            break
+        seat_bet = bet[:, seat]
+        active = cash[:, seat] >= seat_bet
+        if not active.any():
+            continue
+
+        # --- crash point, same steps as Crash._generate_crash_point ---
+        band = np.searchsorted(cumulative, rng.random(bots), side="right")
+        band = np.minimum(band, len(CRASH_BANDS) - 1)
+        base = band_low[band] + band_span[band] * rng.random(bots)
+
+        streak = loss_streak[:, seat]
+        for min_streak, floor in STREAK_FLOORS:
+            base = np.where(streak >= min_streak, np.maximum(base, floor), base)
+
+        rate = np.where(recent_len > BIG_WIN_MIN_SAMPLES,
+                        recent_sum / np.maximum(recent_len, 1), 0.0)
+        capped = (rate > BIG_WIN_RATE_CAP) & (base > BIG_WIN_MULT)
+        cap = rng.uniform(*BIG_WIN_CAP_RANGE, bots)
+        base = np.where(capped, np.minimum(base, cap), base)
+
+        rtp = paid_decayed / np.maximum(bet_decayed, 1e-9)
+        factor = np.clip(1.0 + RTP_GAIN * (target_rtp - rtp),
+                         1.0 - RTP_MAX_ADJUST, 1.0 + RTP_MAX_ADJUST)
+        base = np.where(bet_decayed > 0, base * factor, base)
+        crash = np.round(np.clip(base, CRASH_MIN, CRASH_MAX), 2)
+
+        # --- player ---
+        if kind == "range":
+            target = rng.uniform(low, high, bots)
+        else:
+            target = low
+        win = active & (target < crash)
+        payout = np.where(win, np.floor(seat_bet * target).astype(np.int64), 0)
+        stake = np.where(active, seat_bet, 0)
+
+        cash[:, seat] += payout - stake
+        bet_total += int(stake.sum())
+        paid_total += int(payout.sum())
+        bet_decayed = np.where(active, bet_decayed * DECAY + stake, bet_decayed)
+        paid_decayed = np.where(active, paid_decayed * DECAY + payout,
+                                paid_decayed)
+
+        ret = (payout[active] / seat_bet[active]) - 1.0
+        played += int(active.sum())
+        sum_ret += float(ret.sum())
+        sum_ret2 += float((ret * ret).sum())
+
+        loss_streak[:, seat] = np.where(active, np.where(win, 0, streak + 1),
+                                        streak)
+        # big win ring of the bot (only bots that played this turn move)
+        big = (win & (target >= BIG_WIN_MULT)).astype(np.int32)
+        old = recent[rows, recent_pos]
+        new = np.where(active, big, old)
+        recent[rows, recent_pos] = new
+        recent_sum += new - old
+        recent_pos = np.where(active, (recent_pos + 1) % BIG_WIN_WINDOW,
+                              recent_pos)
+        recent_len = np.where(active, np.minimum(recent_len + 1,
+                                                 BIG_WIN_WINDOW), recent_len)
+
+        if kind == "martingale":
+            bet[:, seat] = np.where(
+                active, np.where(win, BASE_BET, np.minimum(seat_bet * 2,
+                                                           MAX_BET)), seat_bet)
+
+    return {
+        "games": played,
+        "bet": bet_total,
+        "paid": paid_total,
+        "sum_ret": sum_ret,
+        "sum_ret2": sum_ret2,
+        "ruined": int(((cash < bet) & seated).sum()),
+        "sessions": sessions,
+        "net": cash[seated] - START_CASH,
+    }
+
+
+def summarize(parts: list[dict], seconds: float) -> dict:
+    games = sum(p["games"] for p in parts)
+    bet = sum(p["bet"] for p in parts)
+    paid = sum(p["paid"] for p in parts)
+    sessions = sum(p["sessions"] for p in parts)
+    mean = sum(p["sum_ret"] for p in parts) / max(games, 1)
+    variance = sum(p["sum_ret2"] for p in parts) / max(games, 1) - mean * mean
+    net = np.concatenate([p["net"] for p in parts])
+    p5, p50, p95 = np.percentile(net, [5, 50, 95])
+    return {
+        "games": games,
+        "sessions": sessions,
+        "rtp": paid / bet if bet else 0.0,
+        "variance": variance,
+        "stderr": (variance / max(games, 1))**0.5,
+        "ruin": sum(p["ruined"] for p in parts) / max(sessions, 1),
+        "net_p5": float(p5),
+        "net_p50": float(p50),
+        "net_p95": float(p95),
+        "house_net": bet - paid,
+        "seconds": seconds,
+    }
+
+
+def _chunks(games: int, session: int) -> list[int]:
+    sessions = max(1, games // session)
+    sizes = [CHUNK_SESSIONS] * (sessions // CHUNK_SESSIONS)
+    if sessions % CHUNK_SESSIONS:
+        sizes.append(sessions % CHUNK_SESSIONS)
+    return sizes
+
+
+def _pool(processes: int | None) -> ProcessPoolExecutor:
+    # spawn: don't fork a process that runs the bot's event loop / threads
+    return ProcessPoolExecutor(
+        max_workers=processes or os.cpu_count(),
+        mp_context=multiprocessing.get_context("spawn"),
+    )
+
+
+def _seeds(n: int) -> list:
+    """Independent, fresh random streams for n chunks."""
+    return np.random.SeedSequence().spawn(n)
+
+
+async def run_async(games: int, strategy: str, target_rtp: float, *,
+                    state: dict | None = None,
+                    session: int = SESSION_GAMES,
+                    processes: int | None = None) -> dict:
+    """
+    Simulate from the bot: chunks go to a process pool. `state` = live
+    RtpController.to_dict() the simulated bots start from.
+    """
+    if np is None:
+        raise RuntimeError("numpy is not installed")
+    parse_strategy(strategy)  # fail fast, before spawning workers
+
+    loop = asyncio.get_running_loop()
+    started = time.perf_counter()
+    sizes = _chunks(games, session)
+    pool = _pool(processes)
+    try:
+        parts = await asyncio.gather(*(loop.run_in_executor(
+            pool, simulate_chunk, size, session, strategy, target_rtp, seed,
+            state) for size, seed in zip(sizes, _seeds(len(sizes)))))
+    finally:
+        pool.shutdown(wait=False)
+    return summarize(parts, time.perf_counter() - started)
+
+
+def run(games: int, strategy: str, target_rtp: float, *,
+        state: dict | None = None, session: int = SESSION_GAMES,
+        processes: int | None = None) -> dict:
+    if np is None:
+        raise RuntimeError("numpy is not installed")
+    parse_strategy(strategy)
+
+    started = time.perf_counter()
+    sizes = _chunks(games, session)
+    with _pool(processes) as pool:
+        parts = list(
+            pool.map(simulate_chunk, sizes, [session] * len(sizes),
+                     [strategy] * len(sizes), [target_rtp] * len(sizes),
+                     _seeds(len(sizes)), [state] * len(sizes)))
+    return summarize(parts, time.perf_counter() - started)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Monte Carlo RTP simulator for AYO crash")
+    parser.add_argument("--games", type=int, default=10_000_000)
+    parser.add_argument("--strategy", default="fixed:2")
+    parser.add_argument("--rtp", type=float, default=0.90,
+                        help="target RTP set with crashrtp")
+    parser.add_argument("--session", type=int, default=SESSION_GAMES,
+                        help="games per simulated player session")
+    parser.add_argument("--processes", type=int, default=None)
+    parser.add_argument("--cold", action="store_true",
+                        help="start from an empty RTP state, not the saved one")
+    args = parser.parse_args()
+
+    state = None if args.cold else get_rtp("crash").to_dict()
+    try:
+        stats = run(args.games, args.strategy, args.rtp, state=state,
+                    session=args.session, processes=args.processes)
+    except (RuntimeError, ValueError) as e:
+        parser.error(str(e))
+
+    print(f"games        {stats['games']:,} ({stats['sessions']:,} sessions)")
+    print(f"RTP          {stats['rtp']:.4%} ± {1.96 * stats['stderr']:.4%} (95%)")
+    print(f"variance     {stats['variance']:.4f} (per-game return)")
+    print(f"ruin         {stats['ruin']:.2%} of sessions can't cover the next bet")
+    print(f"player net   p5 {stats['net_p5']:,.0f} • median "
+          f"{stats['net_p50']:,.0f} • p95 {stats['net_p95']:,.0f}")
+    print(f"house net    {stats['house_net']:,}")
+    print(f"time         {stats['seconds']:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
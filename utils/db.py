@@ -5,9 +5,11 @@ import time
 DATA_DIR = "data"
 USERS_FILE = os.path.join(DATA_DIR, "users.json")
 CONFIG_FILE = os.path.join(DATA_DIR, "config.json")
+LIVE_GAMES_FILE = os.path.join(DATA_DIR, "live_games.json")
 
 _users = None
 _config = None
+_live_games = None
 
 
 def ensure_data_dir():
@@ -77,6 +79,7 @@ def get_config():
     _config.setdefault("second_prefix", None)
     _config.setdefault("logs", {})
     _config.setdefault("games_enabled", True)
+    _config.setdefault("announce_channels", {})
 
     if "claim" not in _config or not isinstance(_config["claim"], dict):
         _config["claim"] = {
@@ -171,6 +174,9 @@ def get_profile(user_id: int):
             "crash_games": 0,
             "crash_profit": 0,
 
+            # global crash round ledger (see utils/crash_ledger.py)
+            "gc_hold": {},  # round_id -> bet reserved in a running round
+
             # trivia stats
             "trivia_correct": 0,
             "trivia_wrong": 0,
@@ -247,6 +253,9 @@ def get_profile(user_id: int):
         p.setdefault("crash_games", 0)
         p.setdefault("crash_profit", 0)
 
+        # global crash round ledger
+        p.setdefault("gc_hold", {})
+
         # trivia stats
         p.setdefault("trivia_correct", 0)
         p.setdefault("trivia_wrong", 0)
@@ -289,6 +298,15 @@ def set_log_channel(log_type: str, channel_id: int):
     save_config()
 
 
+# ========== ANNOUNCEMENTS ==========
+
+
+def get_announce_channels() -> dict:
+    """guild_id (str) -> channel_id used for global announcements."""
+    cfg = get_config()
+    return cfg["announce_channels"]
+
+
 # ========== GAMES ON/OFF ==========
 
 
@@ -325,3 +343,24 @@ def disable_claim():
 def get_claim_config():
     cfg = get_config()
     return cfg["claim"]
+
+
+# ========== LIVE GAMES ==========
+
+
+def get_live_games(kind: str) -> dict:
+    """
+    Persisted state of games that are still running, per game kind
+    (game_id -> compact record). Survives cog reloads and restarts.
+    """
+    global _live_games
+    if _live_games is None:
+        _live_games = _load_json(LIVE_GAMES_FILE, {})
+    return _live_games.setdefault(kind, {})
+
+
+def save_live_games():
+    global _live_games
+    if _live_games is None:
+        _live_games = {}
+    _save_json(LIVE_GAMES_FILE, _live_games)
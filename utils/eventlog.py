@@ -0,0 +1,234 @@
+"""
+Local structured event archive (JSON lines).
+
+Every game result, transfer, admin action and error is appended to
+data/logs/events.jsonl by a background writer. The file is rotated by
+size / age and rotated segments are gzip compressed. `search()` scans the
+archive newest-first, grep style (substring check before json parsing).
+"""
+
+import asyncio
+import glob
+import gzip
+import json
+import os
+import shutil
+import threading
+import time
+
+from . import db
+
+LOG_DIR = os.path.join(db.DATA_DIR, "logs")
+EVENT_FILE = os.path.join(LOG_DIR, "events.jsonl")
+
+MAX_SEGMENT_BYTES = 8 * 1024 * 1024  # rotate after 8 MB...
+MAX_SEGMENT_AGE = 24 * 60 * 60  # ...or after one day
+MAX_SEGMENTS = 120  # compressed segments kept on disk
+FLUSH_INTERVAL = 1.0  # seconds between background writes
+
+
+def _segment_start(path: str) -> float:
+    """Start timestamp encoded in a rotated segment name."""
+    name = os.path.basename(path)
+    try:
+        return int(name.split("-", 1)[1].split(".", 1)[0]) / 1000
+    except (IndexError, ValueError):
+        return 0.0
+
+
+class EventLog:
+
+    def __init__(self, path: str = EVENT_FILE):
+        self.path = path
+        self._buffer: list[str] = []
+        self._wakeup: asyncio.Event | None = None
+        self._task: asyncio.Task | None = None
+        self._opened_at: float | None = None
+        self._size = 0
+        # _write runs on worker threads (writer task + flush()), one at a time
+        self._lock = threading.Lock()
+
+    # ---------- writing ----------
+
+    def emit(self, kind: str, **fields):
+        event = {"ts": round(time.time(), 3), "kind": kind}
+        event.update(fields)
+        self._buffer.append(json.dumps(event, default=str))
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # no event loop (CLI / startup) -> write directly
+            self._write(self._take())
+            return
+
+        if self._task is None or self._task.done():
+            self._wakeup = asyncio.Event()
+            self._task = loop.create_task(self._writer())
+        if len(self._buffer) >= 200:
+            self._wakeup.set()
+
+    def _take(self) -> list[str]:
+        lines, self._buffer = self._buffer, []
+        return lines
+
+    async def _writer(self):
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), FLUSH_INTERVAL)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            lines = self._take()
+            if lines:
+                try:
+                    await asyncio.to_thread(self._write, lines)
+                except Exception as e:
+                    print(f"Event log write failed: {e}")
+
+    async def flush(self):
+        lines = self._take()
+        if lines:
+            await asyncio.to_thread(self._write, lines)
+
+    def _write(self, lines: list[str]):
+        if not lines:
+            return
+        with self._lock:
+            self._write_locked(lines)
+
+    def _write_locked(self, lines: list[str]):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+
+        if self._opened_at is None:
+            self._open_existing()
+
+        now = time.time()
+        if self._size and (self._size >= MAX_SEGMENT_BYTES
+                           or now - self._opened_at >= MAX_SEGMENT_AGE):
+            self._rotate()
+
+        data = ("\n".join(lines) + "\n").encode("utf-8")
+        with open(self.path, "ab") as f:
+            f.write(data)
+        if not self._size:
+            self._opened_at = now
+        self._size += len(data)
+
+    def _open_existing(self):
+        self._opened_at = time.time()
+        self._size = 0
+        if not os.path.exists(self.path):
+            return
+        self._size = os.path.getsize(self.path)
+        try:
+            with open(self.path, "rb") as f:
+                first = f.readline()
+            self._opened_at = json.loads(first)["ts"]
+        except Exception:
+            pass
+
+    def _rotate(self):
+        base = os.path.splitext(self.path)[0]
+        stamp = int(self._opened_at * 1000)
+        while os.path.exists(f"{base}-{stamp}.jsonl.gz"):
+            stamp += 1
+        rotated = f"{base}-{stamp}.jsonl"
+        os.replace(self.path, rotated)
+        with open(rotated, "rb") as src, gzip.open(rotated + ".gz",
+                                                   "wb") as dst:
+            shutil.copyfileobj(src, dst)
+        os.remove(rotated)
+        self._size = 0
+
+        segments = self.segments()
+        for old in segments[MAX_SEGMENTS:]:
+            try:
+                os.remove(old)
+            except OSError:
+                pass
+
+    # ---------- reading ----------
+
+    def segments(self) -> list[str]:
+        """Rotated segments, newest first."""
+        base = os.path.splitext(self.path)[0]
+        return sorted(glob.glob(f"{base}-*.jsonl.gz"),
+                      key=_segment_start,
+                      reverse=True)
+
+    def search(
+        self,
+        user_id: int | None = None,
+        since: float | None = None,
+        until: float | None = None,
+        kind: str | None = None,
+        limit: int = 25,
+    ) -> list[dict]:
+        """Newest-first events matching a user id and/or time range."""
+        needle = str(user_id).encode() if user_id is not None else None
+        kind_needle = f'"kind": "{kind}"'.encode() if kind else None
+        results: list[dict] = []
+
+        # (path, opener, segment start); a segment ends where the newer one starts
+        files = []
+        if os.path.exists(self.path):
+            files.append((self.path, open, None))
+        files.extend((p, gzip.open, _segment_start(p)) for p in self.segments())
+
+        newer_start = None
+        for path, opener, start in files:
+            # whole segment outside the time range -> skip without reading
+            if until is not None and start is not None and start > until:
+                newer_start = start
+                continue
+            if since is not None and newer_start is not None and newer_start < since:
+                break
+            newer_start = start
+
+            matches = []
+            with opener(path, "rb") as f:
+                for raw in f:
+                    if needle is not None and needle not in raw:
+                        continue
+                    if kind_needle is not None and kind_needle not in raw:
+                        continue
+                    try:
+                        event = json.loads(raw)
+                    except ValueError:
+                        continue
+                    ts = event.get("ts", 0)
+                    if since is not None and ts < since:
+                        continue
+                    if until is not None and ts > until:
+                        continue
+                    if user_id is not None and user_id not in event.get(
+                            "users", []):
+                        continue
+                    matches.append(event)
+
+            results.extend(reversed(matches))
+            if len(results) >= limit:
+                break
+
+        return results[:limit]
+
+
+_event_log = EventLog()
+
+
+def get_event_log() -> EventLog:
+    return _event_log
+
+
+def log_event(kind: str, **fields):
+    """Append a structured event to the archive (never blocks)."""
+    _event_log.emit(kind, **fields)
+
+
+def log_error(where: str, error: Exception, **fields):
+    print(f"Error in {where}: {error}")
+    _event_log.emit("error",
+                    where=where,
+                    error=f"{type(error).__name__}: {error}",
+                    **fields)
@@ -0,0 +1,174 @@
+"""
+Provably fair seeds: a precomputed reverse hash chain.
+
+A chain is built backwards from a random secret: seed[i] = sha256(seed[i+1]).
+Rounds use seed[0], seed[1], ... in order, and only the terminating hash
+sha256(seed[0]) is published up front. Once a round is over its seed is
+revealed, and anyone can check it with ONE hash: sha256(seed[i]) must be
+the seed revealed the round before (or the published hash for i = 0). The
+house can't pick seeds after the fact, players can't predict the next one.
+
+Chains are generated on a worker thread (the next one well before the
+current one runs out) and stored as raw 32 byte seeds behind a small
+header, so taking the next seed is one read + one 4 byte header write.
+"""
+
+import asyncio
+import hashlib
+import os
+import secrets
+import struct
+
+from . import db
+from .eventlog import log_event
+
+FAIR_FILE = os.path.join(db.DATA_DIR, "fair_chain.bin")
+CHAIN_LENGTH = 100_000
+REFILL_AT = 1_000  # seeds left when the next chain gets prepared
+SEED_SIZE = 32
+
+_MAGIC = b"AYFC"
+# magic, chain number, length, next index, terminating hash
+_HEADER = struct.Struct("<4sIII32s")
+_NEXT_OFFSET = struct.calcsize("<4sII")  # where "next index" sits in the header
+
+
+def sha256(data: bytes) -> bytes:
+    return hashlib.sha256(data).digest()
+
+
+def build_chain(path: str, number: int, length: int = CHAIN_LENGTH) -> bytes:
+    """Write a fresh chain file (blocking, run it on a worker thread)."""
+    seeds = [b""] * length
+    h = secrets.token_bytes(SEED_SIZE)
+    for i in range(length - 1, -1, -1):
+        seeds[i] = h
+        h = sha256(h)
+
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(_HEADER.pack(_MAGIC, number, length, 0, h))
+        f.write(b"".join(seeds))
+    os.replace(tmp, path)
+    return h
+
+
+class FairChain:
+
+    def __init__(self, path: str = FAIR_FILE):
+        self.path = path
+        self.next_path = path + ".next"
+        self.number = 0
+        self.length = 0
+        self.next_index = 0
+        self.terminating_hash = b""
+        self._file = None
+        self._refill: asyncio.Task | None = None
+
+    # ---------- file ----------
+
+    def _open(self) -> bool:
+        """Open the chain file; False if missing / broken / used up."""
+        self.close()
+        if not os.path.exists(self.path):
+            return False
+        f = open(self.path, "r+b")
+        header = f.read(_HEADER.size)
+        if len(header) != _HEADER.size:
+            f.close()
+            return False
+        magic, number, length, next_index, terminating = _HEADER.unpack(header)
+        if magic == _MAGIC:
+            self.number = number  # next chain continues the numbering
+        if magic != _MAGIC or next_index >= length:
+            f.close()
+            return False
+
+        self._file = f
+        self.number, self.length = number, length
+        self.next_index, self.terminating_hash = next_index, terminating
+        return True
+
+    def _activate_next(self) -> bool:
+        if not os.path.exists(self.next_path):
+            return False
+        os.replace(self.next_path, self.path)
+        if not self._open():
+            return False
+        log_event("fair_chain",
+                  chain=self.number,
+                  length=self.length,
+                  terminating_hash=self.terminating_hash.hex())
+        return True
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    # ---------- chain supply ----------
+
+    async def prepare(self):
+        """Make sure a usable chain is open (call on cog load)."""
+        if self._open() or self._activate_next():
+            self._maybe_refill()
+            return
+        db.ensure_data_dir()
+        await asyncio.to_thread(build_chain, self.next_path, self.number + 1)
+        self._activate_next()
+
+    def _maybe_refill(self):
+        if self.length - self.next_index > REFILL_AT:
+            return
+        if os.path.exists(self.next_path):
+            return
+        if self._refill is None or self._refill.done():
+            self._refill = asyncio.get_running_loop().create_task(
+                asyncio.to_thread(build_chain, self.next_path,
+                                  self.number + 1))
+
+    def next_seed(self) -> tuple[int, int, bytes]:
+        """(chain number, index, seed) of the next round. Seed stays secret
+        until the round is over."""
+        if self._file is None and not (self._open() or self._activate_next()):
+            # worker didn't make it in time: build inline (rare)
+            build_chain(self.next_path, self.number + 1)
+            self._activate_next()
+
+        number, index = self.number, self.next_index
+        self._file.seek(_HEADER.size + index * SEED_SIZE)
+        seed = self._file.read(SEED_SIZE)
+
+        self.next_index += 1
+        self._file.seek(_NEXT_OFFSET)
+        self._file.write(struct.pack("<I", self.next_index))
+        self._file.flush()
+
+        if self.next_index >= self.length:
+            self.close()
+            self._activate_next()
+        else:
+            self._maybe_refill()
+        return number, index, seed
+
+    # ---------- verification ----------
+
+    def revealed(self, index: int) -> bytes | None:
+        """Seed `index` of the current chain, only once it has been used."""
+        if self._file is None or not 0 <= index < self.next_index:
+            return None
+        self._file.seek(_HEADER.size + index * SEED_SIZE)
+        return self._file.read(SEED_SIZE)
+
+    def verify(self, index: int, seed: bytes) -> bool | None:
+        """
+        One hash: sha256(seed) == previous revealed seed (terminating hash
+        for index 0). None if `index` isn't a revealed round of this chain.
+        """
+        if not 0 <= index < self.next_index:
+            return None
+        if index == 0:
+            expected = self.terminating_hash
+        else:
+            expected = self.revealed(index - 1)
+        return sha256(seed) == expected
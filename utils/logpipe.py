@@ -0,0 +1,155 @@
+"""
+Batched delivery for log channel embeds.
+
+Every log channel gets its own queue + worker. The worker packs up to 10
+embeds into one message (within Discord's 6000 character budget) and
+flushes when the batch is full or FLUSH_INTERVAL has passed. Callers only
+enqueue, so a slow / rate limited log channel never blocks a game.
+"""
+
+import asyncio
+
+import discord
+
+MAX_EMBEDS_PER_MESSAGE = 10
+MAX_CHARS_PER_MESSAGE = 6000  # Discord limit for all embeds in one message
+FLUSH_INTERVAL = 2.0  # seconds to wait for more embeds before sending
+QUEUE_LIMIT = 500  # per channel; extra embeds are dropped + counted
+RESOLVE_RETRY = 300.0  # seconds before retrying a channel we couldn't fetch
+
+
+class LogPipeline:
+
+    def __init__(self, bot):
+        self.bot = bot
+        self._queues: dict[int, asyncio.Queue] = {}
+        self._workers: dict[int, asyncio.Task] = {}
+
+        # channel_id -> channel (resolved once, reused for every batch)
+        self._channels: dict[int, discord.abc.Messageable] = {}
+        # channel_id -> loop time until which we don't retry resolving
+        self._unresolvable: dict[int, float] = {}
+
+        # overflow counters: channel_id -> embeds dropped since last report
+        self.dropped: dict[int, int] = {}
+        self.dropped_total = 0
+        self.sent_messages = 0
+        self.sent_embeds = 0
+
+    # ---------- producer side ----------
+
+    def submit(self, channel_id: int, embed: discord.Embed):
+        """Queue an embed for `channel_id`. Never waits."""
+        queue = self._queues.get(channel_id)
+        if queue is None:
+            queue = asyncio.Queue(maxsize=QUEUE_LIMIT)
+            self._queues[channel_id] = queue
+
+        worker = self._workers.get(channel_id)
+        if worker is None or worker.done():
+            self._workers[channel_id] = asyncio.get_running_loop().create_task(
+                self._worker(channel_id, queue))
+
+        try:
+            queue.put_nowait(embed)
+        except asyncio.QueueFull:
+            self.dropped[channel_id] = self.dropped.get(channel_id, 0) + 1
+            self.dropped_total += 1
+
+    def backlog(self) -> int:
+        return sum(q.qsize() for q in self._queues.values())
+
+    # ---------- consumer side ----------
+
+    async def _worker(self, channel_id: int, queue: asyncio.Queue):
+        loop = asyncio.get_running_loop()
+        carry: discord.Embed | None = None
+
+        while True:
+            first = carry if carry is not None else await queue.get()
+            carry = None
+
+            batch = [first]
+            size = len(first)
+            deadline = loop.time() + FLUSH_INTERVAL
+
+            # flush on size (10 embeds / 6000 chars) or on interval
+            while len(batch) < MAX_EMBEDS_PER_MESSAGE:
+                if queue.empty():
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        embed = await asyncio.wait_for(queue.get(), remaining)
+                    except asyncio.TimeoutError:
+                        break
+                else:
+                    embed = queue.get_nowait()
+
+                if size + len(embed) > MAX_CHARS_PER_MESSAGE:
+                    carry = embed
+                    break
+                batch.append(embed)
+                size += len(embed)
+
+            dropped = self.dropped.pop(channel_id, 0)
+            if dropped:
+                note = discord.Embed(
+                    description=
+                    f"⚠️ {dropped:,} log entries dropped (log channel backlog).",
+                    color=0x000000,
+                )
+                if (len(batch) < MAX_EMBEDS_PER_MESSAGE
+                        and size + len(note) <= MAX_CHARS_PER_MESSAGE):
+                    batch.append(note)
+                else:
+                    # report again with the next batch
+                    self.dropped[channel_id] = dropped
+
+            await self._send(channel_id, batch)
+
+    async def _resolve(self, channel_id: int):
+        channel = self._channels.get(channel_id)
+        if channel is not None:
+            return channel
+
+        loop = asyncio.get_running_loop()
+        if self._unresolvable.get(channel_id, 0.0) > loop.time():
+            return None
+
+        channel = self.bot.get_channel(channel_id)
+        if channel is None:
+            try:
+                channel = await self.bot.fetch_channel(channel_id)
+            except Exception:
+                self._unresolvable[channel_id] = loop.time() + RESOLVE_RETRY
+                return None
+
+        self._unresolvable.pop(channel_id, None)
+        self._channels[channel_id] = channel
+        return channel
+
+    async def _send(self, channel_id: int, batch: list[discord.Embed]):
+        channel = await self._resolve(channel_id)
+        if channel is None:
+            return
+        try:
+            await channel.send(embeds=batch)
+        except (discord.Forbidden, discord.NotFound):
+            # channel deleted / perms changed -> resolve again next time
+            self._channels.pop(channel_id, None)
+        except Exception:
+            pass
+        else:
+            self.sent_messages += 1
+            self.sent_embeds += len(batch)
+
+
+_pipeline: LogPipeline | None = None
+
+
+def get_pipeline(bot) -> LogPipeline:
+    global _pipeline
+    if _pipeline is None or _pipeline.bot is not bot:
+        _pipeline = LogPipeline(bot)
+    return _pipeline
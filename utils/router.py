@@ -0,0 +1,176 @@
+"""
+Central router for game buttons.
+
+Games register their message id once; each click is looked up in a dict
+(O(1)) and handed straight to the owning game's handler, instead of every
+game keeping its own View / wait_for predicate. Move timeouts live in one
+heap driven by a single timer task instead of one timer per game.
+
+Custom ids look like "ayo:<game>:<action>" (routed by message id) or
+"ayo:<game>:<game_id>:<action>" for stateless / persistent components:
+those are routed by namespace to the cog, which looks the game id up in its
+own table, so they keep working after a cog reload or a restart.
+"""
+
+import asyncio
+import heapq
+import itertools
+
+import discord
+
+CUSTOM_ID_PREFIX = "ayo:"
+
+
+def static_view(*items: discord.ui.Item) -> discord.ui.View:
+    """
+    Render-only view: the components are sent with the message, but the view
+    is already stopped so discord.py doesn't store / dispatch it. Clicks
+    reach the router through on_interaction instead.
+    """
+    view = discord.ui.View(timeout=None)
+    for item in items:
+        view.add_item(item)
+    view.stop()
+    return view
+
+
+class _Route:
+    __slots__ = ("on_action", "on_timeout")
+
+    def __init__(self, on_action, on_timeout):
+        self.on_action = on_action
+        self.on_timeout = on_timeout
+
+
+class InteractionRouter:
+
+    def __init__(self, bot):
+        self.bot = bot
+        self._routes: dict[int, _Route] = {}  # message_id -> route
+        # namespace -> handler(interaction, game_id, action)
+        self._namespaces: dict[str, object] = {}
+
+        # key -> (deadline, callback); heap holds (deadline, seq, key) and
+        # stale entries are skipped when popped
+        self._deadlines: dict[object, tuple[float, object]] = {}
+        self._timers: list[tuple[float, int, object]] = []
+        self._seq = itertools.count()
+        self._timer_task: asyncio.Task | None = None
+        self._timer_changed = asyncio.Event()
+
+    # ---------- registration ----------
+
+    def register(self, message_id: int, on_action, *, on_timeout=None,
+                 timeout: float | None = None):
+        """
+        on_action(interaction, action) is awaited for every click on the
+        message; on_timeout() is awaited once the deadline passes.
+        """
+        self._routes[message_id] = _Route(on_action, on_timeout)
+        if timeout is not None:
+            self.touch(message_id, timeout)
+
+    def unregister(self, message_id: int):
+        self._routes.pop(message_id, None)
+        self.cancel_timer(message_id)
+
+    def touch(self, message_id: int, timeout: float):
+        """(Re)arm the timeout of a registered message."""
+        route = self._routes.get(message_id)
+        if route is None or route.on_timeout is None:
+            return
+        self.set_timer(message_id, timeout, route.on_timeout)
+
+    def register_namespace(self, namespace: str, handler):
+        """handler(interaction, game_id, action) for "ayo:<ns>:<id>:<action>"."""
+        self._namespaces[namespace] = handler
+
+    def unregister_namespace(self, namespace: str, handler=None):
+        if handler is None or self._namespaces.get(namespace) == handler:
+            self._namespaces.pop(namespace, None)
+
+    # ---------- shared timers ----------
+
+    def set_timer(self, key, timeout: float, callback):
+        """Await callback() once, `timeout` seconds from now (replaces key)."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + max(0.0, timeout)
+        self._deadlines[key] = (deadline, callback)
+        heapq.heappush(self._timers, (deadline, next(self._seq), key))
+
+        if self._timer_task is None or self._timer_task.done():
+            self._timer_task = loop.create_task(self._run_timers())
+        elif self._timers[0][2] == key:
+            # new earliest deadline -> let the timer task re-sleep
+            self._timer_changed.set()
+
+    def cancel_timer(self, key):
+        self._deadlines.pop(key, None)
+
+    # ---------- dispatch ----------
+
+    async def on_interaction(self, interaction: discord.Interaction):
+        if interaction.type is not discord.InteractionType.component:
+            return
+        custom_id = (interaction.data or {}).get("custom_id", "")
+        if not custom_id.startswith(CUSTOM_ID_PREFIX):
+            return
+
+        parts = custom_id.split(":")
+        if len(parts) == 4:
+            handler = self._namespaces.get(parts[1])
+            if handler is not None:
+                await handler(interaction, parts[2], parts[3])
+                return
+            route = None
+        elif interaction.message is None:
+            return
+        else:
+            route = self._routes.get(interaction.message.id)
+
+        if route is None:
+            # game is gone (finished / bot restarted)
+            try:
+                await interaction.response.send_message(
+                    "⌛ This game is no longer active.",
+                    ephemeral=True,
+                )
+            except Exception:
+                pass
+            return
+
+        action = custom_id.rsplit(":", 1)[-1]
+        await route.on_action(interaction, action)
+
+    async def _run_timers(self):
+        loop = asyncio.get_running_loop()
+        while self._timers:
+            deadline, _, key = self._timers[0]
+            entry = self._deadlines.get(key)
+            if entry is None or entry[0] != deadline:
+                heapq.heappop(self._timers)  # stale entry
+                continue
+
+            delay = deadline - loop.time()
+            if delay > 0:
+                self._timer_changed.clear()
+                try:
+                    await asyncio.wait_for(self._timer_changed.wait(), delay)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            heapq.heappop(self._timers)
+            del self._deadlines[key]
+            loop.create_task(entry[1]())
+
+
+_router: InteractionRouter | None = None
+
+
+def get_router(bot) -> InteractionRouter:
+    global _router
+    if _router is None or _router.bot is not bot:
+        _router = InteractionRouter(bot)
+        bot.add_listener(_router.on_interaction, "on_interaction")
+    return _router
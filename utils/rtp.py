@@ -0,0 +1,192 @@
+"""
+RTP controller shared by the money games.
+
+One controller per game kind keeps, all O(1) per game:
+- exponentially decayed bet / paid sums -> realized RTP of the recent past
+  (old games fade out instead of a restart wiping everything)
+- a ring buffer of recent big wins with a running count
+- per-user win / loss streaks in a bounded LRU
+and turns the RTP error into a smooth multiplier (no ±15% step).
+
+State is saved to data/rtp_state.json (debounced) and loaded on start, so
+restarts don't reset the correction. Games get their controller with
+get_rtp("crash"), record() every settled game and read factor() /
+streak() / big_win_rate() when generating the next one.
+"""
+
+import json
+import os
+import time
+from collections import OrderedDict
+
+from . import db
+
+RTP_FILE = os.path.join(db.DATA_DIR, "rtp_state.json")
+SAVE_GAP = 60.0  # seconds between state writes
+
+HALF_LIFE_GAMES = 5_000  # a game's weight halves after this many games
+DECAY = 0.5**(1 / HALF_LIFE_GAMES)
+RTP_GAIN = 3.0  # factor change per unit of RTP error (5% off -> ±15%)
+RTP_MAX_ADJUST = 0.15  # factor stays within 1 ± this
+STREAK_USERS = 5_000  # LRU size of per-user streaks
+
+
+def rtp_factor(rtp: float, target: float) -> float:
+    """Smooth controller output: >1 helps players, <1 helps the house."""
+    adjust = RTP_GAIN * (target - rtp)
+    return 1.0 + max(-RTP_MAX_ADJUST, min(adjust, RTP_MAX_ADJUST))
+
+
+class RtpController:
+
+    def __init__(self, game: str, target: float = 0.90, window: int = 50):
+        self.game = game
+        self.target = target
+
+        # decayed sums (bet / paid weighted by recency)
+        self.bet = 0.0
+        self.paid = 0.0
+        self.games = 0
+
+        # recent big wins: ring buffer + running count
+        self.window = window
+        self._big = bytearray(window)
+        self._big_pos = 0
+        self._big_len = 0
+        self._big_sum = 0
+
+        # user_id -> [win streak, loss streak], least recently used first
+        self._streaks: OrderedDict[int, list[int]] = OrderedDict()
+
+    # ---------- per game ----------
+
+    def record(self, user_id: int, bet: int, payout: int, *, won: bool,
+               big_win: bool = False) -> tuple[int, int]:
+        """Account one settled game; returns the user's (win, loss) streak."""
+        self.bet = self.bet * DECAY + bet
+        self.paid = self.paid * DECAY + payout
+        self.games += 1
+
+        old = self._big[self._big_pos]
+        self._big[self._big_pos] = big_win
+        self._big_sum += big_win - old
+        self._big_pos = (self._big_pos + 1) % self.window
+        self._big_len = min(self._big_len + 1, self.window)
+
+        streak = self._streaks.pop(user_id, None) or [0, 0]
+        if won:
+            streak = [streak[0] + 1, 0]
+        else:
+            streak = [0, streak[1] + 1]
+        self._streaks[user_id] = streak
+        if len(self._streaks) > STREAK_USERS:
+            self._streaks.popitem(last=False)
+
+        _mark_dirty()
+        return streak[0], streak[1]
+
+    # ---------- reads ----------
+
+    def rtp(self) -> float:
+        return self.paid / self.bet if self.bet > 0 else 0.0
+
+    def factor(self) -> float:
+        if self.bet <= 0:
+            return 1.0
+        return rtp_factor(self.rtp(), self.target)
+
+    def big_win_rate(self, min_samples: int = 0) -> float:
+        if self._big_len <= min_samples:
+            return 0.0
+        return self._big_sum / self._big_len
+
+    def streak(self, user_id: int) -> tuple[int, int]:
+        streak = self._streaks.get(user_id)
+        return (streak[0], streak[1]) if streak else (0, 0)
+
+    # ---------- persistence ----------
+
+    def to_dict(self) -> dict:
+        # ring stored oldest -> newest
+        start = (self._big_pos - self._big_len) % self.window
+        big = [
+            self._big[(start + i) % self.window] for i in range(self._big_len)
+        ]
+        return {
+            "target": self.target,
+            "bet": self.bet,
+            "paid": self.paid,
+            "games": self.games,
+            "big_wins": big,
+            "streaks": [[uid, w, l] for uid, (w, l) in self._streaks.items()],
+        }
+
+    def load(self, data: dict):
+        self.target = data.get("target", self.target)
+        self.bet = float(data.get("bet", 0.0))
+        self.paid = float(data.get("paid", 0.0))
+        self.games = int(data.get("games", 0))
+        for flag in data.get("big_wins", [])[-self.window:]:
+            self._big[self._big_pos] = bool(flag)
+            self._big_sum += bool(flag)
+            self._big_pos = (self._big_pos + 1) % self.window
+            self._big_len += 1
+        for uid, w, l in data.get("streaks", [])[-STREAK_USERS:]:
+            self._streaks[int(uid)] = [w, l]
+
+
+_controllers: dict[str, RtpController] = {}
+_state: dict | None = None
+_dirty = False
+_saved_at = 0.0
+
+
+def _load_state() -> dict:
+    if not os.path.exists(RTP_FILE):
+        return {}
+    try:
+        with open(RTP_FILE, "r") as f:
+            return json.load(f)
+    except Exception:
+        return {}
+
+
+def _mark_dirty():
+    global _dirty
+    _dirty = True
+    if time.time() - _saved_at >= SAVE_GAP:
+        save_rtp()
+
+
+def get_rtp(game: str, *, target: float = 0.90,
+            window: int = 50) -> RtpController:
+    """Controller of a game kind (created + loaded on first use)."""
+    global _state
+    controller = _controllers.get(game)
+    if controller is None:
+        if _state is None:
+            _state = _load_state()
+        controller = RtpController(game, target, window)
+        controller.load(_state.get(game, {}))
+        _controllers[game] = controller
+    return controller
+
+
+def save_rtp():
+    global _dirty, _saved_at
+    data = dict(_state or {})
+    for game, controller in _controllers.items():
+        data[game] = controller.to_dict()
+    db.ensure_data_dir()
+    try:
+        with open(RTP_FILE, "w") as f:
+            json.dump(data, f)
+    except OSError:
+        return
+    _dirty = False
+    _saved_at = time.time()
+
+
+def save_rtp_if_dirty():
+    if _dirty:
+        save_rtp()